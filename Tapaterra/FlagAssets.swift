@@ -2,6 +2,21 @@ import SwiftUI
 
 // Generated by script - do not edit manually
 public struct FlagAssets {
+    public static let hasThumbnails = true
+    public static let thumbnailSuffix = "-thumb"
+
+    /// Flags stored once and shared by other territories: asset name -> shared asset name
+    public static let aliases: [String: String] = [
+        "Flags/bouvet-island": "Flags/norway",
+        "Flags/saint-martin": "Flags/france",
+        "Flags/svalbard-and-jan-mayen": "Flags/norway",
+    ]
+
+    /// Asset to load for an asset name, following aliases
+    public static func resolve(_ name: String) -> String {
+        aliases[name] ?? name
+    }
+
     public struct Africa {
         public static let algeria = Image("Flags/algeria")
         public static let algeriaName = "Flags/algeria"
@@ -124,8 +139,8 @@ public struct FlagAssets {
     public struct Antarctica {
         public static let antarctica = Image("Flags/antarctica")
         public static let antarcticaName = "Flags/antarctica"
-        public static let bouvetIsland = Image("Flags/bouvet-island")
-        public static let bouvetIslandName = "Flags/bouvet-island"
+        public static let bouvetIsland = Image("Flags/norway")
+        public static let bouvetIslandName = "Flags/norway"
         public static let frenchSouthernTerritories = Image("Flags/french-southern-territories")
         public static let frenchSouthernTerritoriesName = "Flags/french-southern-territories"
         public static let heardIslandAndMcdonaldIslands = Image("Flags/heard-island-and-mcdonald-islands")
@@ -332,8 +347,8 @@ public struct FlagAssets {
         public static let sloveniaName = "Flags/slovenia"
         public static let spain = Image("Flags/spain")
         public static let spainName = "Flags/spain"
-        public static let svalbardAndJanMayen = Image("Flags/svalbard-and-jan-mayen")
-        public static let svalbardAndJanMayenName = "Flags/svalbard-and-jan-mayen"
+        public static let svalbardAndJanMayen = Image("Flags/norway")
+        public static let svalbardAndJanMayenName = "Flags/norway"
         public static let sweden = Image("Flags/sweden")
         public static let swedenName = "Flags/sweden"
         public static let switzerland = Image("Flags/switzerland")
@@ -413,8 +428,8 @@ public struct FlagAssets {
         public static let saintKittsAndNevisName = "Flags/saint-kitts-and-nevis"
         public static let saintLucia = Image("Flags/saint-lucia")
         public static let saintLuciaName = "Flags/saint-lucia"
-        public static let saintMartin = Image("Flags/saint-martin")
-        public static let saintMartinName = "Flags/saint-martin"
+        public static let saintMartin = Image("Flags/france")
+        public static let saintMartinName = "Flags/france"
         public static let saintPierreAndMiquelon = Image("Flags/saint-pierre-and-miquelon")
         public static let saintPierreAndMiquelonName = "Flags/saint-pierre-and-miquelon"
         public static let saintVincentAndTheGrenadines = Image("Flags/saint-vincent-and-the-grenadines")
@@ -519,4 +534,330 @@ public struct FlagAssets {
         public static let venezuelaName = "Flags/venezuela"
     }
 
+}
+
+struct FlagAssetEntry {
+    let isoCode: String
+    let assetName: String
+    let continent: Continent
+}
+
+extension FlagAssets {
+    /// Every flag, grouped by continent; aliases point at the shared asset
+    static let entries: [FlagAssetEntry] = [
+        FlagAssetEntry(isoCode: "DZ", assetName: "Flags/algeria", continent: .africa),
+        FlagAssetEntry(isoCode: "AO", assetName: "Flags/angola", continent: .africa),
+        FlagAssetEntry(isoCode: "BJ", assetName: "Flags/benin", continent: .africa),
+        FlagAssetEntry(isoCode: "BW", assetName: "Flags/botswana", continent: .africa),
+        FlagAssetEntry(isoCode: "BF", assetName: "Flags/burkina-faso", continent: .africa),
+        FlagAssetEntry(isoCode: "BI", assetName: "Flags/burundi", continent: .africa),
+        FlagAssetEntry(isoCode: "CV", assetName: "Flags/cabo-verde", continent: .africa),
+        FlagAssetEntry(isoCode: "CM", assetName: "Flags/cameroon", continent: .africa),
+        FlagAssetEntry(isoCode: "CF", assetName: "Flags/central-african-republic", continent: .africa),
+        FlagAssetEntry(isoCode: "TD", assetName: "Flags/chad", continent: .africa),
+        FlagAssetEntry(isoCode: "KM", assetName: "Flags/comoros", continent: .africa),
+        FlagAssetEntry(isoCode: "CG", assetName: "Flags/congo", continent: .africa),
+        FlagAssetEntry(isoCode: "CD", assetName: "Flags/congo-democratic-republic", continent: .africa),
+        FlagAssetEntry(isoCode: "CI", assetName: "Flags/cote-divoire", continent: .africa),
+        FlagAssetEntry(isoCode: "DJ", assetName: "Flags/djibouti", continent: .africa),
+        FlagAssetEntry(isoCode: "EG", assetName: "Flags/egypt", continent: .africa),
+        FlagAssetEntry(isoCode: "GQ", assetName: "Flags/equatorial-guinea", continent: .africa),
+        FlagAssetEntry(isoCode: "ER", assetName: "Flags/eritrea", continent: .africa),
+        FlagAssetEntry(isoCode: "SZ", assetName: "Flags/eswatini", continent: .africa),
+        FlagAssetEntry(isoCode: "ET", assetName: "Flags/ethiopia", continent: .africa),
+        FlagAssetEntry(isoCode: "GA", assetName: "Flags/gabon", continent: .africa),
+        FlagAssetEntry(isoCode: "GM", assetName: "Flags/gambia", continent: .africa),
+        FlagAssetEntry(isoCode: "GH", assetName: "Flags/ghana", continent: .africa),
+        FlagAssetEntry(isoCode: "GN", assetName: "Flags/guinea", continent: .africa),
+        FlagAssetEntry(isoCode: "GW", assetName: "Flags/guinea-bissau", continent: .africa),
+        FlagAssetEntry(isoCode: "KE", assetName: "Flags/kenya", continent: .africa),
+        FlagAssetEntry(isoCode: "LS", assetName: "Flags/lesotho", continent: .africa),
+        FlagAssetEntry(isoCode: "LR", assetName: "Flags/liberia", continent: .africa),
+        FlagAssetEntry(isoCode: "LY", assetName: "Flags/libya", continent: .africa),
+        FlagAssetEntry(isoCode: "MG", assetName: "Flags/madagascar", continent: .africa),
+        FlagAssetEntry(isoCode: "MW", assetName: "Flags/malawi", continent: .africa),
+        FlagAssetEntry(isoCode: "ML", assetName: "Flags/mali", continent: .africa),
+        FlagAssetEntry(isoCode: "MR", assetName: "Flags/mauritania", continent: .africa),
+        FlagAssetEntry(isoCode: "MU", assetName: "Flags/mauritius", continent: .africa),
+        FlagAssetEntry(isoCode: "YT", assetName: "Flags/mayotte", continent: .africa),
+        FlagAssetEntry(isoCode: "MA", assetName: "Flags/morocco", continent: .africa),
+        FlagAssetEntry(isoCode: "MZ", assetName: "Flags/mozambique", continent: .africa),
+        FlagAssetEntry(isoCode: "NA", assetName: "Flags/namibia", continent: .africa),
+        FlagAssetEntry(isoCode: "NE", assetName: "Flags/niger", continent: .africa),
+        FlagAssetEntry(isoCode: "NG", assetName: "Flags/nigeria", continent: .africa),
+        FlagAssetEntry(isoCode: "RE", assetName: "Flags/reunion", continent: .africa),
+        FlagAssetEntry(isoCode: "RW", assetName: "Flags/rwanda", continent: .africa),
+        FlagAssetEntry(isoCode: "SH", assetName: "Flags/saint-helena", continent: .africa),
+        FlagAssetEntry(isoCode: "ST", assetName: "Flags/sao-tome-and-principe", continent: .africa),
+        FlagAssetEntry(isoCode: "SN", assetName: "Flags/senegal", continent: .africa),
+        FlagAssetEntry(isoCode: "SC", assetName: "Flags/seychelles", continent: .africa),
+        FlagAssetEntry(isoCode: "SL", assetName: "Flags/sierra-leone", continent: .africa),
+        FlagAssetEntry(isoCode: "SO", assetName: "Flags/somalia", continent: .africa),
+        FlagAssetEntry(isoCode: "ZA", assetName: "Flags/south-africa", continent: .africa),
+        FlagAssetEntry(isoCode: "SS", assetName: "Flags/south-sudan", continent: .africa),
+        FlagAssetEntry(isoCode: "SD", assetName: "Flags/sudan", continent: .africa),
+        FlagAssetEntry(isoCode: "TZ", assetName: "Flags/tanzania", continent: .africa),
+        FlagAssetEntry(isoCode: "TG", assetName: "Flags/togo", continent: .africa),
+        FlagAssetEntry(isoCode: "TN", assetName: "Flags/tunisia", continent: .africa),
+        FlagAssetEntry(isoCode: "UG", assetName: "Flags/uganda", continent: .africa),
+        FlagAssetEntry(isoCode: "EH", assetName: "Flags/western-sahara", continent: .africa),
+        FlagAssetEntry(isoCode: "ZM", assetName: "Flags/zambia", continent: .africa),
+        FlagAssetEntry(isoCode: "ZW", assetName: "Flags/zimbabwe", continent: .africa),
+        FlagAssetEntry(isoCode: "AQ", assetName: "Flags/antarctica", continent: .antarctica),
+        FlagAssetEntry(isoCode: "BV", assetName: "Flags/norway", continent: .antarctica),
+        FlagAssetEntry(isoCode: "TF", assetName: "Flags/french-southern-territories", continent: .antarctica),
+        FlagAssetEntry(isoCode: "HM", assetName: "Flags/heard-island-and-mcdonald-islands", continent: .antarctica),
+        FlagAssetEntry(isoCode: "GS", assetName: "Flags/south-georgia-and-south-sandwich-islands", continent: .antarctica),
+        FlagAssetEntry(isoCode: "AF", assetName: "Flags/afghanistan", continent: .asia),
+        FlagAssetEntry(isoCode: "AM", assetName: "Flags/armenia", continent: .asia),
+        FlagAssetEntry(isoCode: "AZ", assetName: "Flags/azerbaijan", continent: .asia),
+        FlagAssetEntry(isoCode: "BH", assetName: "Flags/bahrain", continent: .asia),
+        FlagAssetEntry(isoCode: "BD", assetName: "Flags/bangladesh", continent: .asia),
+        FlagAssetEntry(isoCode: "BT", assetName: "Flags/bhutan", continent: .asia),
+        FlagAssetEntry(isoCode: "BN", assetName: "Flags/brunei", continent: .asia),
+        FlagAssetEntry(isoCode: "KH", assetName: "Flags/cambodia", continent: .asia),
+        FlagAssetEntry(isoCode: "CN", assetName: "Flags/china", continent: .asia),
+        FlagAssetEntry(isoCode: "CY", assetName: "Flags/cyprus", continent: .asia),
+        FlagAssetEntry(isoCode: "GE", assetName: "Flags/georgia", continent: .asia),
+        FlagAssetEntry(isoCode: "HK", assetName: "Flags/hong-kong", continent: .asia),
+        FlagAssetEntry(isoCode: "IN", assetName: "Flags/india", continent: .asia),
+        FlagAssetEntry(isoCode: "ID", assetName: "Flags/indonesia", continent: .asia),
+        FlagAssetEntry(isoCode: "IR", assetName: "Flags/iran", continent: .asia),
+        FlagAssetEntry(isoCode: "IQ", assetName: "Flags/iraq", continent: .asia),
+        FlagAssetEntry(isoCode: "IL", assetName: "Flags/israel", continent: .asia),
+        FlagAssetEntry(isoCode: "JP", assetName: "Flags/japan", continent: .asia),
+        FlagAssetEntry(isoCode: "JO", assetName: "Flags/jordan", continent: .asia),
+        FlagAssetEntry(isoCode: "KZ", assetName: "Flags/kazakhstan", continent: .asia),
+        FlagAssetEntry(isoCode: "KW", assetName: "Flags/kuwait", continent: .asia),
+        FlagAssetEntry(isoCode: "KG", assetName: "Flags/kyrgyzstan", continent: .asia),
+        FlagAssetEntry(isoCode: "LA", assetName: "Flags/laos", continent: .asia),
+        FlagAssetEntry(isoCode: "LB", assetName: "Flags/lebanon", continent: .asia),
+        FlagAssetEntry(isoCode: "MO", assetName: "Flags/macao", continent: .asia),
+        FlagAssetEntry(isoCode: "MY", assetName: "Flags/malaysia", continent: .asia),
+        FlagAssetEntry(isoCode: "MV", assetName: "Flags/maldives", continent: .asia),
+        FlagAssetEntry(isoCode: "MN", assetName: "Flags/mongolia", continent: .asia),
+        FlagAssetEntry(isoCode: "MM", assetName: "Flags/myanmar", continent: .asia),
+        FlagAssetEntry(isoCode: "NP", assetName: "Flags/nepal", continent: .asia),
+        FlagAssetEntry(isoCode: "KP", assetName: "Flags/north-korea", continent: .asia),
+        FlagAssetEntry(isoCode: "OM", assetName: "Flags/oman", continent: .asia),
+        FlagAssetEntry(isoCode: "PK", assetName: "Flags/pakistan", continent: .asia),
+        FlagAssetEntry(isoCode: "PS", assetName: "Flags/palestine", continent: .asia),
+        FlagAssetEntry(isoCode: "PH", assetName: "Flags/philippines", continent: .asia),
+        FlagAssetEntry(isoCode: "QA", assetName: "Flags/qatar", continent: .asia),
+        FlagAssetEntry(isoCode: "SA", assetName: "Flags/saudi-arabia", continent: .asia),
+        FlagAssetEntry(isoCode: "SG", assetName: "Flags/singapore", continent: .asia),
+        FlagAssetEntry(isoCode: "KR", assetName: "Flags/south-korea", continent: .asia),
+        FlagAssetEntry(isoCode: "LK", assetName: "Flags/sri-lanka", continent: .asia),
+        FlagAssetEntry(isoCode: "SY", assetName: "Flags/syria", continent: .asia),
+        FlagAssetEntry(isoCode: "TW", assetName: "Flags/taiwan", continent: .asia),
+        FlagAssetEntry(isoCode: "TJ", assetName: "Flags/tajikistan", continent: .asia),
+        FlagAssetEntry(isoCode: "TH", assetName: "Flags/thailand", continent: .asia),
+        FlagAssetEntry(isoCode: "TL", assetName: "Flags/timor-leste", continent: .asia),
+        FlagAssetEntry(isoCode: "TR", assetName: "Flags/turkey", continent: .asia),
+        FlagAssetEntry(isoCode: "TM", assetName: "Flags/turkmenistan", continent: .asia),
+        FlagAssetEntry(isoCode: "AE", assetName: "Flags/united-arab-emirates", continent: .asia),
+        FlagAssetEntry(isoCode: "UZ", assetName: "Flags/uzbekistan", continent: .asia),
+        FlagAssetEntry(isoCode: "VN", assetName: "Flags/vietnam", continent: .asia),
+        FlagAssetEntry(isoCode: "YE", assetName: "Flags/yemen", continent: .asia),
+        FlagAssetEntry(isoCode: "AX", assetName: "Flags/aland-islands", continent: .europe),
+        FlagAssetEntry(isoCode: "AL", assetName: "Flags/albania", continent: .europe),
+        FlagAssetEntry(isoCode: "AD", assetName: "Flags/andorra", continent: .europe),
+        FlagAssetEntry(isoCode: "AT", assetName: "Flags/austria", continent: .europe),
+        FlagAssetEntry(isoCode: "BY", assetName: "Flags/belarus", continent: .europe),
+        FlagAssetEntry(isoCode: "BE", assetName: "Flags/belgium", continent: .europe),
+        FlagAssetEntry(isoCode: "BA", assetName: "Flags/bosnia-and-herzegovina", continent: .europe),
+        FlagAssetEntry(isoCode: "BG", assetName: "Flags/bulgaria", continent: .europe),
+        FlagAssetEntry(isoCode: "HR", assetName: "Flags/croatia", continent: .europe),
+        FlagAssetEntry(isoCode: "CZ", assetName: "Flags/czechia", continent: .europe),
+        FlagAssetEntry(isoCode: "DK", assetName: "Flags/denmark", continent: .europe),
+        FlagAssetEntry(isoCode: "EE", assetName: "Flags/estonia", continent: .europe),
+        FlagAssetEntry(isoCode: "FO", assetName: "Flags/faroe-islands", continent: .europe),
+        FlagAssetEntry(isoCode: "FI", assetName: "Flags/finland", continent: .europe),
+        FlagAssetEntry(isoCode: "FR", assetName: "Flags/france", continent: .europe),
+        FlagAssetEntry(isoCode: "DE", assetName: "Flags/germany", continent: .europe),
+        FlagAssetEntry(isoCode: "GI", assetName: "Flags/gibraltar", continent: .europe),
+        FlagAssetEntry(isoCode: "GR", assetName: "Flags/greece", continent: .europe),
+        FlagAssetEntry(isoCode: "GG", assetName: "Flags/guernsey", continent: .europe),
+        FlagAssetEntry(isoCode: "HU", assetName: "Flags/hungary", continent: .europe),
+        FlagAssetEntry(isoCode: "IS", assetName: "Flags/iceland", continent: .europe),
+        FlagAssetEntry(isoCode: "IE", assetName: "Flags/ireland", continent: .europe),
+        FlagAssetEntry(isoCode: "IM", assetName: "Flags/isle-of-man", continent: .europe),
+        FlagAssetEntry(isoCode: "IT", assetName: "Flags/italy", continent: .europe),
+        FlagAssetEntry(isoCode: "JE", assetName: "Flags/jersey", continent: .europe),
+        FlagAssetEntry(isoCode: "XK", assetName: "Flags/kosovo", continent: .europe),
+        FlagAssetEntry(isoCode: "LV", assetName: "Flags/latvia", continent: .europe),
+        FlagAssetEntry(isoCode: "LI", assetName: "Flags/liechtenstein", continent: .europe),
+        FlagAssetEntry(isoCode: "LT", assetName: "Flags/lithuania", continent: .europe),
+        FlagAssetEntry(isoCode: "LU", assetName: "Flags/luxembourg", continent: .europe),
+        FlagAssetEntry(isoCode: "MT", assetName: "Flags/malta", continent: .europe),
+        FlagAssetEntry(isoCode: "MD", assetName: "Flags/moldova", continent: .europe),
+        FlagAssetEntry(isoCode: "MC", assetName: "Flags/monaco", continent: .europe),
+        FlagAssetEntry(isoCode: "ME", assetName: "Flags/montenegro", continent: .europe),
+        FlagAssetEntry(isoCode: "NL", assetName: "Flags/netherlands", continent: .europe),
+        FlagAssetEntry(isoCode: "MK", assetName: "Flags/north-macedonia", continent: .europe),
+        FlagAssetEntry(isoCode: "NO", assetName: "Flags/norway", continent: .europe),
+        FlagAssetEntry(isoCode: "PL", assetName: "Flags/poland", continent: .europe),
+        FlagAssetEntry(isoCode: "PT", assetName: "Flags/portugal", continent: .europe),
+        FlagAssetEntry(isoCode: "RO", assetName: "Flags/romania", continent: .europe),
+        FlagAssetEntry(isoCode: "RU", assetName: "Flags/russia", continent: .europe),
+        FlagAssetEntry(isoCode: "SM", assetName: "Flags/san-marino", continent: .europe),
+        FlagAssetEntry(isoCode: "RS", assetName: "Flags/serbia", continent: .europe),
+        FlagAssetEntry(isoCode: "SK", assetName: "Flags/slovakia", continent: .europe),
+        FlagAssetEntry(isoCode: "SI", assetName: "Flags/slovenia", continent: .europe),
+        FlagAssetEntry(isoCode: "ES", assetName: "Flags/spain", continent: .europe),
+        FlagAssetEntry(isoCode: "SJ", assetName: "Flags/norway", continent: .europe),
+        FlagAssetEntry(isoCode: "SE", assetName: "Flags/sweden", continent: .europe),
+        FlagAssetEntry(isoCode: "CH", assetName: "Flags/switzerland", continent: .europe),
+        FlagAssetEntry(isoCode: "UA", assetName: "Flags/ukraine", continent: .europe),
+        FlagAssetEntry(isoCode: "GB", assetName: "Flags/united-kingdom", continent: .europe),
+        FlagAssetEntry(isoCode: "VA", assetName: "Flags/vatican-city", continent: .europe),
+        FlagAssetEntry(isoCode: "AI", assetName: "Flags/anguilla", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "AG", assetName: "Flags/antigua-and-barbuda", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "AW", assetName: "Flags/aruba", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "BS", assetName: "Flags/bahamas", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "BB", assetName: "Flags/barbados", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "BZ", assetName: "Flags/belize", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "BM", assetName: "Flags/bermuda", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "BQ", assetName: "Flags/bonaire-sint-eustatius-and-saba", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "VG", assetName: "Flags/british-virgin-islands", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "CA", assetName: "Flags/canada", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "KY", assetName: "Flags/cayman-islands", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "CR", assetName: "Flags/costa-rica", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "CU", assetName: "Flags/cuba", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "CW", assetName: "Flags/curacao", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "DM", assetName: "Flags/dominica", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "DO", assetName: "Flags/dominican-republic", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "SV", assetName: "Flags/el-salvador", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "GL", assetName: "Flags/greenland", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "GD", assetName: "Flags/grenada", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "GP", assetName: "Flags/guadeloupe", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "GT", assetName: "Flags/guatemala", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "HT", assetName: "Flags/haiti", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "HN", assetName: "Flags/honduras", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "JM", assetName: "Flags/jamaica", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "MQ", assetName: "Flags/martinique", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "MX", assetName: "Flags/mexico", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "MS", assetName: "Flags/montserrat", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "NI", assetName: "Flags/nicaragua", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "PA", assetName: "Flags/panama", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "PR", assetName: "Flags/puerto-rico", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "BL", assetName: "Flags/saint-barthelemy", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "KN", assetName: "Flags/saint-kitts-and-nevis", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "LC", assetName: "Flags/saint-lucia", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "MF", assetName: "Flags/france", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "PM", assetName: "Flags/saint-pierre-and-miquelon", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "VC", assetName: "Flags/saint-vincent-and-the-grenadines", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "SX", assetName: "Flags/sint-maarten", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "TT", assetName: "Flags/trinidad-and-tobago", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "TC", assetName: "Flags/turks-and-caicos-islands", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "US", assetName: "Flags/united-states", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "VI", assetName: "Flags/us-virgin-islands", continent: .northAmerica),
+        FlagAssetEntry(isoCode: "AS", assetName: "Flags/american-samoa", continent: .oceania),
+        FlagAssetEntry(isoCode: "AU", assetName: "Flags/australia", continent: .oceania),
+        FlagAssetEntry(isoCode: "CX", assetName: "Flags/christmas-island", continent: .oceania),
+        FlagAssetEntry(isoCode: "CC", assetName: "Flags/cocos-islands", continent: .oceania),
+        FlagAssetEntry(isoCode: "CK", assetName: "Flags/cook-islands", continent: .oceania),
+        FlagAssetEntry(isoCode: "FJ", assetName: "Flags/fiji", continent: .oceania),
+        FlagAssetEntry(isoCode: "PF", assetName: "Flags/french-polynesia", continent: .oceania),
+        FlagAssetEntry(isoCode: "GU", assetName: "Flags/guam", continent: .oceania),
+        FlagAssetEntry(isoCode: "KI", assetName: "Flags/kiribati", continent: .oceania),
+        FlagAssetEntry(isoCode: "MH", assetName: "Flags/marshall-islands", continent: .oceania),
+        FlagAssetEntry(isoCode: "FM", assetName: "Flags/micronesia", continent: .oceania),
+        FlagAssetEntry(isoCode: "NR", assetName: "Flags/nauru", continent: .oceania),
+        FlagAssetEntry(isoCode: "NC", assetName: "Flags/new-caledonia", continent: .oceania),
+        FlagAssetEntry(isoCode: "NZ", assetName: "Flags/new-zealand", continent: .oceania),
+        FlagAssetEntry(isoCode: "NU", assetName: "Flags/niue", continent: .oceania),
+        FlagAssetEntry(isoCode: "NF", assetName: "Flags/norfolk-island", continent: .oceania),
+        FlagAssetEntry(isoCode: "MP", assetName: "Flags/northern-mariana-islands", continent: .oceania),
+        FlagAssetEntry(isoCode: "PW", assetName: "Flags/palau", continent: .oceania),
+        FlagAssetEntry(isoCode: "PG", assetName: "Flags/papua-new-guinea", continent: .oceania),
+        FlagAssetEntry(isoCode: "PN", assetName: "Flags/pitcairn-islands", continent: .oceania),
+        FlagAssetEntry(isoCode: "WS", assetName: "Flags/samoa", continent: .oceania),
+        FlagAssetEntry(isoCode: "SB", assetName: "Flags/solomon-islands", continent: .oceania),
+        FlagAssetEntry(isoCode: "TK", assetName: "Flags/tokelau", continent: .oceania),
+        FlagAssetEntry(isoCode: "TO", assetName: "Flags/tonga", continent: .oceania),
+        FlagAssetEntry(isoCode: "TV", assetName: "Flags/tuvalu", continent: .oceania),
+        FlagAssetEntry(isoCode: "VU", assetName: "Flags/vanuatu", continent: .oceania),
+        FlagAssetEntry(isoCode: "WF", assetName: "Flags/wallis-and-futuna", continent: .oceania),
+        FlagAssetEntry(isoCode: "AR", assetName: "Flags/argentina", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "BO", assetName: "Flags/bolivia", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "BR", assetName: "Flags/brazil", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "CL", assetName: "Flags/chile", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "CO", assetName: "Flags/colombia", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "EC", assetName: "Flags/ecuador", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "FK", assetName: "Flags/falkland-islands", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "GF", assetName: "Flags/french-guiana", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "GY", assetName: "Flags/guyana", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "PY", assetName: "Flags/paraguay", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "PE", assetName: "Flags/peru", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "SR", assetName: "Flags/suriname", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "UY", assetName: "Flags/uruguay", continent: .southAmerica),
+        FlagAssetEntry(isoCode: "VE", assetName: "Flags/venezuela", continent: .southAmerica),
+    ]
+
+    /// Index range of each continent in entries
+    static let continentRanges: [Continent: Range<Int>] = [
+        .africa: 0..<58,
+        .antarctica: 58..<63,
+        .asia: 63..<114,
+        .europe: 114..<166,
+        .northAmerica: 166..<207,
+        .oceania: 207..<234,
+        .southAmerica: 234..<248,
+    ]
+
+    /// entries index for each alpha-2 code at (first letter * 26 + second letter), -1 if none
+    private static let isoSlots: [Int16] = [
+        -1, -1, -1, 116, 110, 63, 167, -1, 166, -1, -1, 115, 64, -1, 1, -1, 58, 234, 207, 117, 208, -1, 168, 114, -1, 65,
+        120, 170, -1, 67, 119, 4, 121, 66, 5, 2, -1, 196, 172, 69, 235, -1, 173, 236, 169, 68, -1, 59, 3, -1, 118, 171,
+        175, -1, 210, 12, -1, 8, 11, 162, 13, -1, 211, 237, 7, 71, 238, -1, -1, 177, -1, -1, 178, 6, 179, 209, 72, 123,
+        -1, -1, -1, -1, 129, -1, -1, -1, -1, 14, 124, -1, 180, -1, 181, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0,
+        -1, -1, 239, -1, 125, -1, 15, 55, -1, -1, -1, -1, -1, -1, -1, -1, -1, 17, 159, 19, -1, -1, -1, -1, -1, -1,
+        -1, -1, -1, -1, -1, -1, -1, -1, 127, 212, 240, -1, 217, -1, 126, -1, -1, 128, -1, -1, -1, -1, -1, -1, -1, -1,
+        20, 164, -1, 184, 73, 241, 132, 22, 130, -1, -1, 183, 21, 23, -1, 185, 16, 131, 62, 186, 214, -1, 24, -1, 242, -1,
+        -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, 61, 188, -1, -1, -1, 122, -1, 187, 133, -1, -1, -1, -1, -1,
+        -1, -1, -1, 76, 135, -1, -1, -1, -1, -1, -1, 79, 136, 75, -1, -1, 78, 77, 134, 137, -1, -1, -1, -1, -1, -1,
+        -1, -1, -1, -1, 138, -1, -1, -1, -1, -1, -1, -1, 189, -1, 81, 80, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+        -1, -1, -1, -1, 25, -1, 84, 70, 215, -1, -1, -1, 10, 197, -1, 93, -1, 101, -1, -1, -1, -1, 83, -1, 176, 82,
+        85, 86, 198, -1, -1, -1, -1, -1, 141, -1, 102, -1, -1, -1, -1, -1, -1, 27, 26, 142, 143, 140, -1, -1, 28, -1,
+        35, -1, 146, 145, 147, 199, 29, 216, -1, -1, 149, 31, 91, 90, 87, 223, 190, 32, 192, 144, 33, 89, 30, 191, 88, 36,
+        37, -1, 219, -1, 38, 222, 39, -1, 193, -1, -1, 148, -1, -1, 150, 92, -1, 218, -1, -1, 221, -1, -1, -1, -1, 220,
+        -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 94, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+        194, -1, -1, -1, 244, 213, 225, 97, -1, -1, 95, 151, 200, 226, -1, -1, -1, 195, 96, 152, -1, -1, 224, -1, 243, -1,
+        98, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+        -1, -1, -1, -1, 40, -1, -1, -1, -1, -1, -1, -1, -1, -1, 153, -1, -1, -1, 156, -1, 154, -1, 41, -1, -1, -1,
+        99, 228, 45, 50, 161, -1, 100, 42, 158, 160, 157, 46, 155, 44, 47, -1, -1, 245, 49, 43, -1, 182, -1, 202, 103, 18,
+        -1, -1, 204, 9, -1, 60, 52, 106, -1, 105, 229, 107, 109, 53, 230, -1, -1, 108, -1, 203, -1, 231, 104, -1, -1, 51,
+        163, -1, -1, -1, -1, -1, 54, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 205, -1, -1, -1, -1, -1, 246, 111,
+        165, -1, 201, -1, 247, -1, 174, -1, 206, -1, -1, -1, -1, 112, -1, -1, -1, -1, -1, -1, 232, -1, -1, -1, -1, -1,
+        -1, -1, -1, -1, -1, 233, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 227, -1, -1, -1, -1, -1, -1, -1,
+        -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 139, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+        -1, -1, -1, -1, 113, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 34, -1, -1, -1, -1, -1, -1,
+        48, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 56, -1, -1, -1, -1, -1, -1, -1, -1, -1, 57, -1, -1, -1,
+    ]
+
+    static func entry(forIsoCode isoCode: String) -> FlagAssetEntry? {
+        let letters = Array(isoCode.utf8)
+        guard letters.count == 2 else {
+            return nil
+        }
+        let first = Int(letters[0]) - 65
+        let second = Int(letters[1]) - 65
+        guard (0..<26).contains(first), (0..<26).contains(second) else {
+            return nil
+        }
+        let slot = Int(isoSlots[first * 26 + second])
+        return slot < 0 ? nil : entries[slot]
+    }
+
+    static func assetName(forIsoCode isoCode: String) -> String? {
+        entry(forIsoCode: isoCode)?.assetName
+    }
+
+    static func entries(in continent: Continent) -> ArraySlice<FlagAssetEntry> {
+        if continent == .all {
+            return entries[...]
+        }
+        return entries[continentRanges[continent] ?? 0..<0]
+    }
 }
\ No newline at end of file
@@ -0,0 +1,263 @@
+import Foundation
+
+// Generated by script - do not edit manually
+// This file is auto-generated from the flag images by flag_similarity.py
+
+extension FlagAssets {
+    /// The 5 flags most easily confused with each country's flag, most similar first
+    static let confusableIsoCodes: [String: [String]] = [
+        "AD": ["MD", "AM", "PH", "RO", "KH"],
+        "AE": ["KW", "SD", "PS", "GQ", "EG"],
+        "AF": ["EH", "JO", "SY", "KE", "SD"],
+        "AG": ["TL", "LB", "TT", "CL", "IQ"],
+        "AI": ["TC", "SH", "FK", "MS", "KY"],
+        "AL": ["TN", "WF", "IM", "MA", "TO"],
+        "AM": ["LT", "RU", "GM", "CO", "AD"],
+        "AO": ["PG", "LY", "UG", "EG", "KG"],
+        "AQ": ["HN", "PW", "TV", "LU", "KZ"],
+        "AR": ["SV", "BW", "GT", "SM", "NI"],
+        "AS": ["PA", "TK", "FR", "TH", "DO"],
+        "AT": ["ID", "PE", "MC", "CA", "PL"],
+        "AU": ["NZ", "CK", "GS", "SH", "KY"],
+        "AW": ["SO", "FM", "BW", "FJ", "AR"],
+        "AX": ["SE", "TF", "BS", "IS", "MD"],
+        "AZ": ["HN", "UG", "PM", "LU", "BI"],
+        "BA": ["MH", "MP", "HM", "CV", "BZ"],
+        "BB": ["TK", "NR", "CW", "PN", "GS"],
+        "BD": ["MO", "JM", "RS", "LT", "TG"],
+        "BE": ["DE", "UG", "MZ", "GP", "GN"],
+        "BF": ["MR", "VN", "CG", "MQ", "VU"],
+        "BG": ["RU", "HU", "PL", "ID", "MC"],
+        "BH": ["CA", "AT", "LB", "PE", "PF"],
+        "BI": ["LB", "TJ", "DO", "PL", "PF"],
+        "BJ": ["GW", "GN", "VE", "GD", "TD"],
+        "BL": ["JE", "KR", "CY", "YT", "JP"],
+        "BM": ["WF", "IM", "HK", "CN", "AL"],
+        "BN": ["VA", "GF", "CO", "EC", "NU"],
+        "BO": ["GH", "TJ", "CM", "MG", "VE"],
+        "BQ": ["CU", "RU", "SX", "KM", "CL"],
+        "BR": ["GY", "LS", "BJ", "NC", "GW"],
+        "BS": ["SE", "AX", "UA", "IS", "TF"],
+        "BT": ["VA", "NU", "BN", "NE", "CO"],
+        "BV": ["LR", "LV", "TH", "ES", "QA"],
+        "BW": ["SO", "AR", "AW", "FJ", "FM"],
+        "BY": ["MV", "PT", "OM", "DK", "TO"],
+        "BZ": ["KH", "PY", "MP", "HM", "CV"],
+        "CA": ["AT", "LB", "BH", "PF", "SG"],
+        "CC": ["TM", "ZM", "ST", "GF", "DJ"],
+        "CD": ["RE", "NI", "CN", "PR", "NA"],
+        "CF": ["KM", "GQ", "PY", "CR", "DJ"],
+        "CG": ["BF", "MR", "BJ", "MQ", "NA"],
+        "CH": ["TN", "TO", "TR", "PE", "DK"],
+        "CI": ["IE", "BG", "IT", "NG", "NE"],
+        "CK": ["NZ", "KY", "AU", "FK", "SH"],
+        "CL": ["PL", "GL", "LB", "PE", "PF"],
+        "CM": ["GD", "UG", "EC", "BO", "TG"],
+        "CN": ["WF", "VN", "IM", "HK", "MA"],
+        "CO": ["DE", "UA", "RU", "EC", "AM"],
+        "CR": ["PY", "RU", "HR", "CU", "PH"],
+        "CU": ["CR", "PY", "KH", "BQ", "RU"],
+        "CV": ["MP", "MH", "HM", "BZ", "KH"],
+        "CW": ["NR", "TK", "AU", "NZ", "CK"],
+        "CX": ["GU", "LA", "ST", "BB", "PN"],
+        "CY": ["BL", "JP", "JE", "YT", "VI"],
+        "CZ": ["RS", "PL", "GL", "MT", "MG"],
+        "DE": ["YE", "UG", "CO", "MU", "AM"],
+        "DJ": ["GT", "SM", "NE", "PS", "SL"],
+        "DK": ["TO", "CH", "AT", "PE", "KG"],
+        "DM": ["DZ", "NF", "SA", "PK", "KE"],
+        "DO": ["FR", "KI", "TJ", "PF", "EG"],
+        "DZ": ["PK", "IN", "DM", "GI", "JP"],
+        "EC": ["UG", "CM", "CO", "UA", "BO"],
+        "EE": ["SL", "YE", "PL", "DE", "TH"],
+        "EG": ["YE", "IQ", "PF", "HR", "IR"],
+        "EH": ["PS", "JO", "SY", "AF", "AE"],
+        "ER": ["TL", "TR", "KP", "AT", "CA"],
+        "ES": ["NO", "LK", "LV", "SZ", "SX"],
+        "ET": ["ML", "MD", "MM", "KN", "AD"],
+        "FI": ["PA", "FO", "IL", "KR", "GE"],
+        "FJ": ["SO", "FM", "BW", "AW", "AR"],
+        "FK": ["KY", "SH", "AI", "VG", "MS"],
+        "FM": ["SO", "AW", "FJ", "BW", "GT"],
+        "FO": ["IL", "FI", "GE", "NP", "SG"],
+        "FR": ["DO", "IT", "GB", "MX", "PE"],
+        "GA": ["MU", "UA", "EE", "GN", "DE"],
+        "GB": ["MY", "FR", "DO", "IR", "KI"],
+        "GD": ["CM", "MK", "BJ", "MZ", "TG"],
+        "GE": ["MT", "GG", "MC", "ID", "JE"],
+        "GF": ["ST", "ML", "BN", "CC", "EC"],
+        "GG": ["GE", "SG", "JE", "PA", "PL"],
+        "GH": ["BO", "VC", "CM", "PT", "ZW"],
+        "GI": ["GL", "SG", "JE", "ID", "MC"],
+        "GL": ["PL", "ID", "MC", "GI", "CL"],
+        "GM": ["RU", "AM", "LU", "PL", "HU"],
+        "GN": ["GW", "BJ", "ML", "RO", "MU"],
+        "GP": ["UG", "AO", "SY", "JM", "BE"],
+        "GQ": ["AE", "SD", "KW", "GL", "UZ"],
+        "GR": ["SV", "IS", "NL", "FO", "SE"],
+        "GS": ["KY", "NZ", "VG", "MS", "SH"],
+        "GT": ["DJ", "AR", "SM", "SO", "DO"],
+        "GU": ["CW", "KY", "NR", "AU", "TK"],
+        "GW": ["BJ", "GN", "TD", "VE", "MU"],
+        "GY": ["BR", "BJ", "GW", "SZ", "GA"],
+        "HK": ["TN", "WF", "ME", "IM", "VN"],
+        "HM": ["MP", "MH", "BZ", "CV", "KH"],
+        "HN": ["AQ", "LU", "KZ", "PW", "GT"],
+        "HR": ["PY", "RU", "CR", "PH", "EG"],
+        "HT": ["PH", "AM", "CU", "KH", "RU"],
+        "HU": ["LU", "YE", "AT", "BG", "RU"],
+        "ID": ["PL", "MC", "AT", "MT", "PE"],
+        "IE": ["NG", "IT", "CI", "BG", "FR"],
+        "IL": ["FO", "UY", "PY", "YT", "KR"],
+        "IM": ["TN", "VN", "WF", "KG", "TR"],
+        "IN": ["DZ", "NF", "PK", "NE", "SY"],
+        "IQ": ["EG", "YE", "SD", "LB", "SY"],
+        "IR": ["BG", "IT", "EG", "GI", "GB"],
+        "IS": ["SE", "TF", "AX", "SV", "XK"],
+        "IT": ["BG", "FR", "IR", "IE", "NG"],
+        "JE": ["BL", "GI", "GE", "GG", "CY"],
+        "JM": ["MZ", "LT", "AG", "GP", "BD"],
+        "JO": ["EH", "PS", "MG", "SY", "SS"],
+        "JP": ["CY", "KR", "BL", "JE", "GG"],
+        "KE": ["EH", "SY", "JO", "AF", "SD"],
+        "KG": ["IM", "WS", "ME", "HK", "TN"],
+        "KH": ["BZ", "PY", "PH", "CU", "LA"],
+        "KI": ["DO", "CH", "LA", "SC", "SG"],
+        "KM": ["CF", "BQ", "ST", "MM", "CZ"],
+        "KN": ["MW", "PS", "ET", "PG", "UG"],
+        "KP": ["SK", "MN", "DK", "GL", "OM"],
+        "KR": ["YT", "BL", "JP", "IL", "GE"],
+        "KW": ["SD", "AE", "GQ", "MG", "TJ"],
+        "KY": ["FK", "VG", "SH", "GS", "CK"],
+        "KZ": ["PW", "HN", "TV", "AQ", "RW"],
+        "LA": ["LI", "KI", "KH", "MV", "DO"],
+        "LB": ["PF", "MT", "CA", "BH", "MC"],
+        "LC": ["BL", "SR", "MR", "TK", "ZW"],
+        "LI": ["LA", "TW", "WS", "CW", "CN"],
+        "LK": ["ES", "LT", "SZ", "JM", "AX"],
+        "LR": ["NO", "NL", "TH", "SX", "US"],
+        "LS": ["BR", "IR", "SV", "IL", "HR"],
+        "LT": ["AM", "BG", "DE", "GM", "RU"],
+        "LU": ["HU", "YE", "ID", "PL", "AT"],
+        "LV": ["NL", "TH", "QA", "NO", "YE"],
+        "LY": ["MQ", "AO", "VU", "PG", "BJ"],
+        "MA": ["TN", "TO", "CN", "CH", "CA"],
+        "MC": ["ID", "PL", "AT", "MT", "SG"],
+        "MD": ["AD", "ET", "RO", "AX", "AL"],
+        "ME": ["HK", "KG", "VN", "TT", "MK"],
+        "MF": ["DO", "IT", "GB", "MX", "PE"],
+        "MG": ["TJ", "KW", "BO", "CZ", "BH"],
+        "MH": ["MP", "HM", "BA", "CV", "CU"],
+        "MK": ["ME", "KG", "GD", "TL", "DK"],
+        "ML": ["MM", "ET", "RO", "GN", "GD"],
+        "MM": ["ML", "ET", "RO", "VE", "BJ"],
+        "MN": ["KP", "MT", "SK", "TL", "MK"],
+        "MO": ["BD", "TG", "CM", "ZA", "US"],
+        "MP": ["HM", "MH", "CV", "BZ", "BA"],
+        "MQ": ["LY", "VU", "BF", "SD", "BJ"],
+        "MR": ["BF", "GN", "NA", "BJ", "CG"],
+        "MS": ["SH", "VG", "KY", "PN", "TC"],
+        "MT": ["ID", "MC", "GE", "LB", "PL"],
+        "MU": ["DE", "GA", "BG", "TD", "RO"],
+        "MV": ["VN", "PT", "BY", "OM", "TN"],
+        "MW": ["KN", "PS", "VU", "TZ", "AE"],
+        "MX": ["PY", "RS", "FR", "LB", "IT"],
+        "MY": ["GB", "FR", "HR", "CA", "GI"],
+        "MZ": ["TG", "GD", "CM", "UG", "JO"],
+        "NA": ["MR", "TW", "GW", "IR", "CG"],
+        "NC": ["NA", "BR", "LS", "BJ", "VU"],
+        "NE": ["SL", "DJ", "IN", "GQ", "CI"],
+        "NF": ["PK", "DM", "IN", "SR", "KW"],
+        "NG": ["BG", "IE", "IT", "CI", "IR"],
+        "NI": ["SV", "SL", "RE", "AR", "EE"],
+        "NL": ["TH", "LV", "SL", "YE", "LU"],
+        "NO": ["LR", "LV", "TH", "ES", "QA"],
+        "NP": ["SG", "PA", "PF", "GG", "MT"],
+        "NR": ["AU", "CW", "NZ", "BB", "TK"],
+        "NU": ["VA", "EC", "BT", "UA", "BN"],
+        "NZ": ["CK", "AU", "GS", "SH", "KY"],
+        "OM": ["PE", "DK", "BY", "AT", "ID"],
+        "PA": ["NP", "FI", "GG", "PL", "GE"],
+        "PE": ["AT", "PL", "ID", "BH", "MC"],
+        "PF": ["LB", "CA", "BH", "PL", "MT"],
+        "PG": ["AO", "LY", "TL", "EG", "DE"],
+        "PH": ["HR", "PY", "CR", "KH", "RU"],
+        "PK": ["DZ", "NF", "DM", "IN", "MG"],
+        "PL": ["ID", "MC", "PE", "GL", "AT"],
+        "PM": ["TV", "LU", "UZ", "SS", "KZ"],
+        "PN": ["VG", "MS", "SH", "KY", "FK"],
+        "PR": ["PE", "OM", "PL", "CU", "CA"],
+        "PS": ["EH", "AE", "JO", "EG", "KN"],
+        "PT": ["MV", "BY", "OM", "ME", "VN"],
+        "PW": ["KZ", "TV", "AQ", "HN", "RW"],
+        "PY": ["HR", "RU", "CR", "MX", "KH"],
+        "QA": ["LV", "NL", "US", "TH", "NO"],
+        "RE": ["CD", "NI", "GQ", "CG", "BI"],
+        "RO": ["TD", "ML", "GN", "VE", "MU"],
+        "RS": ["CZ", "MX", "CR", "LB", "GI"],
+        "RU": ["BG", "PY", "YE", "ID", "PL"],
+        "RW": ["TV", "PW", "BO", "GH", "KZ"],
+        "SA": ["DM", "PK", "NF", "PT", "DZ"],
+        "SB": ["EC", "NF", "BO", "SE", "UA"],
+        "SC": ["KI", "OM", "IQ", "ZW", "MY"],
+        "SD": ["KW", "AE", "YE", "GQ", "EG"],
+        "SE": ["IS", "BS", "AX", "UA", "XK"],
+        "SG": ["MC", "PL", "ID", "CA", "GG"],
+        "SH": ["AI", "MS", "TC", "VG", "FK"],
+        "SI": ["NP", "SK", "AT", "RU", "SG"],
+        "SJ": ["LR", "LV", "TH", "ES", "QA"],
+        "SK": ["KP", "CR", "SI", "PE", "GE"],
+        "SL": ["EE", "UZ", "ID", "NL", "LU"],
+        "SM": ["AR", "GT", "DJ", "GG", "UY"],
+        "SN": ["MW", "GH", "KN", "CG", "MV"],
+        "SO": ["FM", "BW", "AW", "FJ", "GT"],
+        "SR": ["NF", "KE", "TH", "LR", "QA"],
+        "SS": ["VU", "JO", "PS", "EH", "MQ"],
+        "ST": ["GF", "ZM", "KM", "TM", "CC"],
+        "SV": ["GR", "AR", "IS", "NI", "TF"],
+        "SX": ["CR", "BQ", "PH", "LR", "LV"],
+        "SY": ["EH", "IQ", "KW", "EG", "YE"],
+        "SZ": ["GY", "NL", "SV", "MD", "SX"],
+        "TC": ["AI", "SH", "MS", "FK", "VG"],
+        "TD": ["RO", "VE", "MU", "GW", "BJ"],
+        "TF": ["XK", "AX", "IS", "SV", "SE"],
+        "TG": ["CM", "MZ", "GD", "ZA", "LT"],
+        "TH": ["NL", "LV", "NO", "LR", "EE"],
+        "TJ": ["MG", "PF", "BO", "EG", "GI"],
+        "TK": ["CW", "BB", "NR", "GS", "AU"],
+        "TL": ["TW", "CN", "KG", "VN", "ME"],
+        "TM": ["ZM", "CC", "ST", "GF", "CX"],
+        "TN": ["HK", "IM", "WF", "CH", "TR"],
+        "TO": ["DK", "CH", "HK", "MA", "TR"],
+        "TR": ["TN", "IM", "VN", "CH", "HK"],
+        "TT": ["BH", "WF", "HK", "DK", "ME"],
+        "TV": ["PW", "AQ", "KZ", "RW", "MS"],
+        "TW": ["CN", "WS", "MA", "TL", "CH"],
+        "TZ": ["MW", "KN", "UZ", "SS", "PS"],
+        "UA": ["CO", "SE", "GA", "BS", "NL"],
+        "UG": ["DE", "EC", "CM", "VU", "AO"],
+        "US": ["QA", "LR", "TH", "AS", "NL"],
+        "UY": ["IL", "CR", "PY", "GG", "CU"],
+        "UZ": ["SL", "GQ", "TZ", "DJ", "LU"],
+        "VA": ["BN", "BT", "NU", "VC", "SM"],
+        "VC": ["GH", "TD", "VA", "BB", "RO"],
+        "VE": ["TD", "RO", "BJ", "GW", "MM"],
+        "VG": ["MS", "KY", "PN", "SH", "FK"],
+        "VI": ["YT", "BL", "CY", "JP", "KR"],
+        "VN": ["CN", "IM", "HK", "TR", "MV"],
+        "VU": ["LY", "UG", "SS", "MQ", "BF"],
+        "WF": ["CN", "TN", "IM", "HK", "BM"],
+        "WS": ["KG", "TW", "TO", "AL", "ME"],
+        "XK": ["TF", "IS", "SE", "AX", "BS"],
+        "YE": ["EG", "IQ", "LU", "HU", "RU"],
+        "YT": ["KR", "IL", "BL", "CY", "VI"],
+        "ZA": ["MZ", "HR", "TG", "MX", "PH"],
+        "ZM": ["TM", "CC", "ST", "GF", "SN"],
+        "ZW": ["GH", "SC", "BO", "SY", "KW"],
+    ]
+
+    /// Plausible wrong answers for a flag question, hardest first
+    static func distractors(forIsoCode isoCode: String, count: Int = 5) -> [String] {
+        Array((confusableIsoCodes[isoCode] ?? []).prefix(count))
+    }
+}
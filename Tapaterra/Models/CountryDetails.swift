@@ -17,12 +17,9 @@ struct CountryDetailsData {
     static var details: [String: CountryDetails] = [:]
 
     static func details(for country: Country) -> CountryDetails? {
-        if details.isEmpty {
-            loadDetails()
-        }
-        return details[country.isoCode]
+        details(forIsoCode: country.isoCode)
     }
 
-    // loadDetails() implementation is in CountryDetailsData.generated.swift
+    // loadDetails() and details(forIsoCode:) implementations are in CountryDetailsData.generated.swift
 }
 
@@ -4,6 +4,13 @@ import Foundation
 // This file is auto-generated from country_details.json
 
 extension CountryDetailsData {
+    static func details(forIsoCode isoCode: String) -> CountryDetails? {
+        if details.isEmpty {
+            loadDetails()
+        }
+        return details[isoCode]
+    }
+
     static func loadDetails() {
         var detailsDict: [String: CountryDetails] = [:]
 
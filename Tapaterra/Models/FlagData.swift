@@ -44,8 +44,18 @@ struct Country: Identifiable, Hashable {
     let continent: Continent
     let isoCode: String
 
+    /// Shared asset for this flag, looked up by ISO code in the generated table
+    var flagAssetName: String {
+        FlagAssets.assetName(forIsoCode: isoCode) ?? FlagAssets.resolve(imageName)
+    }
+
     var flagImage: Image {
-        Image(imageName)
+        Image(flagAssetName)
+    }
+
+    /// Grid-sized flag; the full-size asset until thumbnails have been imported
+    var thumbnailImage: Image {
+        FlagAssets.hasThumbnails ? Image(flagAssetName + FlagAssets.thumbnailSuffix) : flagImage
     }
 
     var localizedName: String {
@@ -330,7 +340,12 @@ struct FlagData {
         if continent == .all {
             return allCountries
         }
-        return allCountries.filter { $0.continent == continent }
+        // The generated table holds each continent as one contiguous range
+        return FlagAssets.entries(in: continent).compactMap { countriesByIsoCode[$0.isoCode] }
     }
+
+    private static let countriesByIsoCode = Dictionary(
+        uniqueKeysWithValues: allCountries.map { ($0.isoCode, $0) }
+    )
 }
 
@@ -0,0 +1,159 @@
+import Foundation
+
+// Generated by script - do not edit manually
+// This file is auto-generated from country_details.json by neighbour_graph.py
+
+/// Land borders between countries, keyed by ISO code, with precomputed hop distances
+enum NeighbourGraph {
+    /// Graph nodes, sorted by ISO code
+    static let isoCodes: [String] = [
+        "AD", "AE", "AF", "AG", "AI", "AL", "AM", "AO", "AQ", "AR", "AS", "AT", "AU", "AW", "AX", "AZ",
+        "BA", "BB", "BD", "BE", "BF", "BG", "BH", "BI", "BJ", "BL", "BM", "BN", "BO", "BQ", "BR", "BS",
+        "BT", "BV", "BW", "BY", "BZ", "CA", "CC", "CD", "CF", "CG", "CH", "CI", "CK", "CL", "CM", "CN",
+        "CO", "CR", "CU", "CV", "CW", "CX", "CY", "CZ", "DE", "DJ", "DK", "DM", "DO", "DZ", "EC", "EE",
+        "EG", "EH", "ER", "ES", "ET", "FI", "FJ", "FK", "FM", "FO", "FR", "GA", "GB", "GD", "GE", "GF",
+        "GG", "GH", "GI", "GL", "GM", "GN", "GP", "GQ", "GR", "GS", "GT", "GU", "GW", "GY", "HK", "HM",
+        "HN", "HR", "HT", "HU", "ID", "IE", "IL", "IM", "IN", "IQ", "IR", "IS", "IT", "JE", "JM", "JO",
+        "JP", "KE", "KG", "KH", "KI", "KM", "KN", "KP", "KR", "KW", "KY", "KZ", "LA", "LB", "LC", "LI",
+        "LK", "LR", "LS", "LT", "LU", "LV", "LY", "MA", "MC", "MD", "ME", "MF", "MG", "MH", "MK", "ML",
+        "MM", "MN", "MO", "MP", "MQ", "MR", "MS", "MT", "MU", "MV", "MW", "MX", "MY", "MZ", "NA", "NC",
+        "NE", "NF", "NG", "NI", "NL", "NO", "NP", "NR", "NU", "NZ", "OM", "PA", "PE", "PF", "PG", "PH",
+        "PK", "PL", "PM", "PN", "PR", "PS", "PT", "PW", "PY", "QA", "RE", "RO", "RS", "RU", "RW", "SA",
+        "SB", "SC", "SD", "SE", "SG", "SH", "SI", "SJ", "SK", "SL", "SM", "SN", "SO", "SR", "SS", "ST",
+        "SV", "SX", "SY", "SZ", "TC", "TD", "TF", "TG", "TH", "TJ", "TK", "TL", "TM", "TN", "TO", "TR",
+        "TT", "TV", "TW", "TZ", "UA", "UG", "US", "UY", "UZ", "VA", "VC", "VE", "VG", "VI", "VN", "VU",
+        "WF", "WS", "XK", "YE", "YT", "ZA", "ZM", "ZW",
+    ]
+
+    /// Number of connected components; component 0 is the largest
+    static let componentCount = 89
+
+    private static let unreachable: UInt8 = 255
+
+    /// Neighbours of node i are adjacency[adjacencyStart[i]..<adjacencyStart[i + 1]]
+    private static let adjacencyStart: [Int32] = [
+        0, 2, 4, 10, 10, 10, 14, 18, 22, 22, 27, 27, 35, 35, 35, 35, 40, 43, 43, 45, 49, 55, 60, 60, 63, 67, 67, 67, 68, 73, 73, 83,
+        83, 85, 85, 89, 94, 96, 97, 97, 106, 112, 117, 122, 127, 127, 130, 136, 152, 157, 159, 159, 159, 159, 159, 159, 163, 172, 175, 176, 176, 177, 184, 186,
+        188, 192, 195, 198, 203, 209, 212, 212, 212, 212, 212, 220, 223, 224, 224, 228, 230, 230, 233, 234, 234, 235, 241, 241, 243, 247, 247, 251, 251, 253, 256, 257,
+        257, 260, 265, 266, 273, 276, 277, 282, 282, 288, 294, 301, 301, 307, 307, 307, 312, 312, 317, 321, 324, 324, 324, 324, 327, 328, 330, 330, 335, 340, 342, 342,
+        344, 344, 347, 348, 352, 355, 359, 365, 368, 369, 371, 376, 377, 377, 377, 382, 389, 394, 396, 397, 397, 397, 401, 401, 401, 401, 401, 404, 407, 410, 416, 420,
+        420, 427, 427, 431, 433, 435, 438, 440, 440, 440, 440, 443, 445, 450, 450, 451, 451, 455, 462, 462, 462, 462, 465, 466, 466, 469, 470, 470, 475, 483, 497, 501,
+        508, 508, 508, 515, 517, 517, 517, 521, 521, 526, 528, 529, 534, 537, 540, 546, 546, 548, 549, 554, 556, 556, 562, 562, 565, 569, 573, 573, 574, 578, 580, 580,
+        588, 588, 588, 588, 596, 603, 608, 610, 612, 617, 618, 618, 621, 621, 621, 624, 624, 624, 624, 628, 630, 630, 636, 644, 648,
+    ]
+
+    private static let adjacency: [UInt8] = [
+        67, 74, 170, 191, 47, 106, 176, 217, 220, 232, 88, 138, 142, 242, 15, 78, 106, 223, 39, 41, 158, 246, 28, 30, 45, 184, 231, 42, 55, 56, 99, 108,
+        127, 198, 200, 6, 78, 106, 189, 223, 97, 138, 188, 104, 144, 56, 74, 132, 164, 24, 43, 81, 143, 160, 215, 88, 142, 187, 188, 223, 39, 190, 227, 20,
+        160, 162, 215, 156, 9, 30, 45, 172, 184, 9, 28, 48, 79, 93, 172, 184, 205, 231, 235, 47, 104, 158, 245, 246, 247, 131, 133, 177, 189, 228, 90, 155,
+        230, 7, 23, 40, 41, 190, 206, 227, 229, 246, 39, 41, 46, 194, 206, 213, 7, 39, 40, 46, 75, 11, 56, 74, 108, 127, 20, 81, 85, 129, 143, 9,
+        28, 172, 40, 41, 75, 87, 162, 213, 2, 32, 94, 104, 114, 119, 123, 124, 144, 145, 146, 166, 176, 189, 217, 238, 30, 62, 171, 172, 235, 163, 171, 11,
+        56, 177, 200, 11, 19, 42, 55, 58, 74, 132, 164, 177, 66, 68, 204, 56, 98, 65, 134, 135, 143, 149, 160, 221, 48, 172, 133, 189, 102, 134, 181, 194,
+        61, 135, 149, 57, 68, 194, 0, 74, 82, 135, 182, 57, 66, 113, 194, 204, 206, 165, 189, 195, 0, 19, 42, 56, 67, 108, 132, 136, 41, 46, 87, 101,
+        6, 15, 189, 223, 30, 205, 20, 43, 215, 67, 203, 43, 92, 129, 143, 201, 203, 46, 75, 5, 21, 142, 223, 36, 96, 155, 208, 85, 203, 30, 205, 235,
+        47, 90, 163, 208, 16, 99, 138, 188, 198, 60, 11, 97, 187, 188, 198, 200, 228, 156, 174, 219, 76, 64, 111, 125, 181, 210, 18, 32, 47, 144, 166, 176,
+        106, 111, 121, 191, 210, 223, 2, 6, 15, 105, 176, 220, 223, 11, 42, 74, 198, 202, 233, 102, 105, 181, 191, 210, 68, 204, 206, 227, 229, 47, 123, 217,
+        232, 124, 216, 238, 47, 120, 189, 119, 105, 191, 47, 114, 189, 220, 232, 47, 115, 144, 216, 238, 102, 210, 11, 42, 43, 85, 201, 245, 35, 133, 177, 189,
+        19, 56, 74, 35, 63, 131, 189, 61, 64, 160, 194, 213, 221, 61, 65, 67, 74, 187, 228, 5, 16, 97, 188, 242, 209, 5, 21, 88, 188, 242, 20, 43,
+        61, 85, 149, 160, 203, 18, 47, 104, 124, 216, 47, 189, 47, 61, 65, 143, 203, 157, 227, 246, 36, 90, 230, 27, 100, 216, 154, 211, 227, 245, 246, 247,
+        7, 34, 245, 246, 20, 24, 61, 134, 143, 162, 213, 24, 46, 160, 213, 49, 96, 19, 56, 69, 189, 195, 47, 104, 1, 191, 243, 48, 49, 28, 30, 45,
+        48, 62, 100, 2, 47, 104, 106, 35, 55, 56, 131, 189, 200, 228, 64, 102, 111, 67, 9, 28, 30, 191, 21, 99, 137, 188, 228, 16, 21, 97, 99, 138,
+        142, 187, 242, 15, 35, 47, 63, 69, 78, 119, 123, 131, 133, 145, 165, 177, 228, 23, 39, 227, 229, 1, 105, 111, 121, 170, 185, 243, 40, 64, 66, 68,
+        134, 206, 213, 69, 165, 11, 97, 99, 108, 11, 55, 99, 177, 228, 85, 129, 108, 84, 85, 92, 143, 149, 57, 68, 113, 30, 79, 93, 39, 40, 68, 113,
+        194, 229, 90, 96, 139, 102, 105, 111, 125, 223, 157, 245, 40, 46, 134, 160, 162, 194, 20, 24, 81, 115, 124, 144, 156, 2, 47, 114, 232, 100, 2, 106,
+        123, 232, 61, 134, 6, 15, 21, 78, 88, 105, 106, 210, 23, 39, 113, 154, 157, 190, 229, 246, 35, 99, 137, 177, 187, 189, 200, 39, 113, 190, 206, 227,
+        37, 155, 9, 30, 2, 114, 123, 217, 220, 108, 30, 48, 93, 47, 115, 124, 5, 138, 142, 188, 170, 191, 34, 130, 157, 158, 211, 247, 7, 34, 39, 154,
+        157, 158, 227, 247, 34, 157, 245, 246,
+    ]
+
+    /// Component of each node, numbered by size
+    private static let componentOfNode: [UInt8] = [
+        0, 0, 0, 5, 6, 0, 0, 0, 7, 1, 8, 0, 9, 10, 11, 0, 0, 12, 0, 0, 0, 0, 13, 0, 0, 14, 15, 0, 1, 16, 1, 17,
+        0, 18, 0, 0, 1, 1, 19, 0, 0, 0, 0, 0, 20, 1, 0, 0, 1, 1, 21, 22, 23, 24, 25, 0, 0, 0, 0, 26, 2, 0, 1, 0,
+        0, 0, 0, 0, 0, 0, 27, 28, 29, 30, 0, 0, 3, 31, 0, 1, 32, 0, 0, 33, 0, 0, 34, 0, 0, 35, 1, 36, 0, 1, 0, 37,
+        1, 0, 2, 0, 0, 3, 0, 38, 0, 0, 0, 39, 0, 40, 41, 0, 42, 0, 0, 0, 43, 44, 45, 0, 0, 0, 46, 0, 0, 0, 47, 0,
+        48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 49, 50, 0, 0, 0, 0, 0, 51, 52, 0, 53, 54, 55, 56, 0, 1, 0, 0, 0, 57,
+        0, 58, 0, 1, 0, 0, 0, 59, 60, 61, 0, 1, 1, 62, 0, 63, 0, 0, 64, 65, 66, 0, 0, 67, 1, 0, 68, 0, 0, 0, 0, 0,
+        69, 70, 0, 0, 71, 72, 0, 73, 0, 0, 0, 0, 0, 1, 0, 74, 1, 4, 0, 0, 75, 0, 76, 0, 0, 0, 77, 0, 0, 0, 78, 0,
+        79, 80, 81, 0, 0, 0, 1, 1, 0, 0, 82, 1, 83, 84, 0, 85, 86, 87, 0, 0, 88, 0, 0, 0,
+    ]
+
+    /// Border crossings for each pair of nodes i < j, row by row (255 = no land route)
+    private static let pairDistances: [UInt8] = Array(Data(base64Encoded: "CQb//wYGCP///wP///8FBf8HAgUG/wgF//8J/////wb/CQT///8HBgcCBf//BgX/////////AwIHA///A/8FBQMGAQYF/////wEH//8F//8GAv8GBf8HB////wb/Bv//BP8ECf8G/wYHBv8C//8H/wcGB////wUGCP8FBgf/A/8GCwQCBQQCAgUF////BgQGBQb//wT/////Cf8ICQn/BP8F/wMFBv///wn///8K/wYD////BgL//wn/BQUECAj//wUG//8D/wQGAwUH/wb///8HCv8F/wYHBv8KBgT/Bv///wgEB///BgP/////Bv///wYJ/woICQT//wUECP///wf///8EBv8GCAcE/wgH//8J/////wb/CQb///8HBgcICP//BwX/////////BwcHCP//Bv8GBAcGCAYG/////wgI//8E//8ICf8JCP8IBP///wn/Bv//Bv8GCf8D/wUCA/8I//8C/wcGB////wYHAv8FBgT/CP8JCwYIBgUHCQYG////BQcGBgb//wf/////Cf8ICQn/Bv8H/wgGBv///wH///8K/wQG////Awn//wL/BQUFCAH//wUH//8H/wcJCQgH/wb///8DCv8G/wgHBf8KBAb/A////wgGB///BQn/////Bv///wYC/woICf//BAIJ////Bf///wIF/wMFCAP/CQj//wX/////Av8KA////wgHCAUJ//8IAf////////8EBAgF//8H/wMFCAcGBwP/////BQn//wP//wkH/woJ/wkD////Cv8C//8F/wQF/wT/AgIB/wb//wP/CAID////AgMD/wICBP8G/woMAwUDBgcGBAX///8ECAICAv//CP////8K/wQKCv8H/wj/BQMC////BP///wb/AQP///8EB///BP8EBAIJA///BgT//wX/BAoHCQj/B////wML/wf/CQMB/wYBB/8C////CQMI//8BB/////8C////BQT/CwkK/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wMJ////BP///wMC/wYGCAL/CQj//wn/////Bv8KBf///wgHCAUJ//8IBf////////8FBQgG//8H/wUFCAcGBwX/////BQn//wP//wkH/woJ/wkB////Cv8G//8C/wMJ/wT/BQMD/wT//wT/CAYH////BQYE/wUGBP8F/woMBQYFBgcGBAH///8BCAYFBv//CP////8K/wgKCv8H/wj/BgUG////Bf///wr/BAX///8FB///Bf8DAgQJBP//Bgb//wP/BAoFCQj/B////wML/wf/CQcF/woEB/8C////CQQI//8FBf////8G////AQX/CwkKCP///wX///8BBP8EBQcC/wgH//8H/////wT/CQP///8HBgcFCP//BwP/////////BAQHBf//Bv8DBAcGBgYD/////wUI//8B//8IB/8JCP8IAv///wn/BP//BP8EB/8D/wMCAf8G//8D/wcEBf///wMEA/8DBAP/Bv8JCwMFAwUHBgQE////AwcEAwT//wf/////Cf8GCQn/Bv8H/wUDBP///wT///8I/wID////BAf//wT/AwMCCAP//wUE//8F/wQJBwgH/wb///8CCv8G/wgFA/8IAgb/Af///wgDB///Awf/////BP///wQE/woICf///wr///8ICv8LCQUI/wIE//8O/////wv/Agr///8BAgEJBv//Agr/////////CgkECv//Bf8KBAYEBwMK/////wgC//8I//8GCP8HBv8DCP///wf/C///Cv8KDv8F/woHCP8J//8G/wMLDP///woLCP8KCwb/Cv8HAwoJCgQGCQoK////CQULCgv//wb/////Av8NAgH/BP8D/woKC////wj///8P/wkK////BQj//wj/CQkJAgf//wML//8K/wsHCgYE/wL///8GA/8D/wUMCv8PCQX/B////wIKAv//Cgr/////C////woI/wIBAv//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////Af8B//////8ICv////////8B//8CBP///////////////wP/////////////////////Av////////////8H//8C//8G/////////////////////////////////////////////////////////////////////////////wj/////////Bf////////8DAv//////////////Af//////////////////////////Av//B////////////////////////////wkB////Av///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wQD/wYCBwP/Cgf//wj/////Bf8LA////wkICQEH//8IBP////////8BAQkC//8F/wQHBQgDCAT/////Agn//wT//wgE/wgH/wkE////CP8F//8C/wEI/wb/BQUF/wH//wb/CQUG////BAUG/wQFBv8B/wgNAwIEBgQDAwP///8DBgUEBf//Bv////8L/wcLC/8G/wf/AgQF////B////wn/BQL///8HBP//B/8CAgMKBv//BwX//wH/AQgCBwn/CP///wUM/wf/CAYF/wkFBv8E////CgIJ//8FAv////8F////Awf/DAoL////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////BP8EBAcC/wgH//8G/////wP/CQL///8HBgcECP//BwL/////////AwMHBP//Bv8CBAcGBQYC/////wQI//8B//8IBv8JCP8IAv///wn/A///BP8DBv8D/wMCAf8F//8D/wcDBP///wIDA/8CAwP/Bf8JCwIEAgUGBQME////AwcDAgP//wf/////Cf8FCQn/Bv8H/wQCA////wT///8H/wIC////BAb//wT/AwMBCAP//wUD//8E/wMJBggH/wb///8CCv8G/wgEA/8HAgb/Af///wgCB///Awb/////A////wQE/woICf8HBQkC/woJ//8J/////wb/CwT///8JCAkECf//CQX/////////BAQJBf//B/8FBgcIBQgF/////wQK//8E//8KBv8KCf8KA////wr/Bv//Af8CCf8F/wYEBP8D//8F/wkGB////wUGBf8FBgX/BP8KDQUFBQcGBQMB////AggGBQb//wj/////C/8ICwv/CP8J/wUFBv///wb///8K/wUE////Bgb//wb/AgEECgX//wcG//8C/wMKBAkJ/wj///8EDP8I/woHBv8KBQj/A////woDCf//BgT/////Bv///wIG/wwKC///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////BgoF/wsK//8E/////wL/DAT///8KCQoGC///CgL/////////BQUKBv//Cf8EBwkJBwkE/////wYL//8E//8LCP8MC/8LBf///wz/A///Bv8FBP8G/wEEA/8H//8F/woDA////wMEBf8DAgb/B/8MDgQGBAgIBwUH////BgoBAwP//wr/////DP8DDAz/Cf8K/wYEAv///wb///8F/wIE////Bgj//wb/BQYDCwX//wgF//8G/wUMCAsK/wn///8FDf8J/wsCA/8FBAn/BP///wsECv//BAj/////A////wcG/w0LDAYF/wkG//8I/////wX/CgP///8IBwgCBv//BwT/////////AgEIAv//BP8EBgQHAgcE/////wEI//8E//8HA/8HBv8IBv///wf/Bf//BP8DCP8H/wUGBf8C//8H/wgFBv///wQFB/8EBQf/A/8HDAMBBAUDAgQF////BQUFBAX//wX/////Cv8HCgr/Bf8G/wEEBf///wj///8J/wUC////BwP//wj/BAQDCQf//wYF//8D/wMHAwYI/wf///8GC/8G/wcGBf8JBQX/Bf///wkDCP//BQP/////Bf///wUI/wsJCgf/BQH//w3/////Cv8GCP///wQDBAYB//8DCf////////8HBgUH//8C/wkDAwQEBAn/////BQT//wf//wEF/wMC/wQH////A/8K//8I/wgN/wT/CQYH/wb//wX/BQoL////CQoH/wkKBf8H/wIICAYJAgMGCQn///8IAQoJCv//Av////8G/wwGBv8B/wL/BwkK////B////w7/CAf///8EBf//B/8ICAgFBv//Awr//wf/CAMHAgX/BP///wUH/wL/AQsJ/w4IA/8G////BQgF//8JB/////8K////CQf/BwUG/wgH//8I/////wX/CQP///8HBgcECP//BwT/////////BAQHBf//Bv8EBAcGBgYE/////wUI//8C//8IB/8JCP8IAf///wn/Bf//Av8CCP8D/wQCAv8E//8D/wcFBv///wQFA/8EBQP/BP8JCwQFBAUHBgIC////AQcFBAX//wf/////Cf8HCQn/Bv8H/wUEBf///wT///8J/wMD////BAf//wT/AQEDCAP//wUF//8D/wMJBQgH/wb///8CCv8G/wgGBP8JAwb/Af///wgCB///BAX/////Bf///wIE/woICf///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wX//w7/////C/8DCv///wECAgkG//8DCv////////8KCQQK//8F/woEBgQHAwr/////CAP//wj//wYI/wcG/wQI////B/8L//8K/woO/wX/CgcI/wn//wb/AgsM////CgsI/woLBv8K/wcECgkKBAYJCgr///8JBQsKC///Bv////8C/w0CA/8E/wT/CgoL////CP///w//CQr///8FCP//CP8JCQkBB///Awv//wr/CwcKBgP/Av///wYD/wP/BgwK/w8JBf8H////AQoC//8KCv////8L////Cgj/AwID//8N/////wr/Bgj///8EAwMGAv//Agn/////////BwYFB///Av8JAwMEBAQJ/////wUD//8H//8CBf8EA/8DB////wT/Cv//CP8IDf8E/wkGB/8G//8F/wUKC////wkKB/8JCgX/B/8DBwgGCQIDBgkJ////CAIKCQr//wP/////Bv8MBgX/Af8B/wcJCv///wf///8O/wgH////BAX//wf/CAgIBQb//wMK//8H/wgEBwMF/wT///8FB/8C/wELCf8OCAP/Bv///wUIBf//CQf/////Cv///wkH/wYFBv///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wX/Dwb///8NDA0IDf//DQT/////////BwcNCP//C/8GCgsMCQwG/////wgO//8G//8OCv8ODf8OCP///w7/Bf//CP8HAv8J/wQHBv8J//8I/w0FA////wUGCP8FAwn/Cf8OEQYIBgsKCQcJ////CQwDBQX//wz/////D/8BDw//DP8N/wgGBf///wn///8D/wUG////CQr//wn/BwgFDgj//wsH//8I/wcOCg0N/wz///8IEP8M/w4CBf8DBgz/B////w4GDf//Bgr/////BP///wkJ/xAOD/8B//////8ICv////////8B//8CBP///////////////wL/////////////////////Av////////////8H//8C//8G/////////////////////////////////////////////////////////////////////////////wj/////////Bf////////8DAf//////////////Af//////////////////////////Av//B////////////////////////////wkC////Av////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8HCf////////8C//8BA////////////////wL/////////////////////Af////////////8G//8B//8F/////////////////////////////////////////////////////////////////////////////wf/////////BP////////8CAf//////////////Af//////////////////////////Af//Bv///////////////////////////wgB////Af////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8MA////woJCgUK//8KAf////////8EBAoF//8I/wMHCAkGCQP/////BQv//wP//wsH/wsK/wsF////C/8C//8F/wQF/wb/AQQD/wb//wX/CgID////AgMF/wICBv8G/wsOAwUDCAcGBAb///8GCQICAv//Cf////8M/wQMDP8J/wr/BQMC////Bv///wb/AgP///8GB///Bv8EBQILBf//CAT//wX/BAsHCgr/Cf///wUN/wn/CwMC/wYDCf8E////CwMK//8DB/////8C////Bgb/DQsM/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wv///8CAwMKB///BAv/////////CwoFC///Bv8LBQcFCAQL/////wkE//8J//8HCf8IB/8FCf///wj/DP//C/8LD/8G/wsICf8K//8H/wMMDf///wsMCf8LDAf/C/8IAgsKCwUHCgsL////CgYMCwz//wf/////Av8OAgH/Bf8F/wsLDP///wn///8Q/woL////Bgn//wn/CgoKAwj//wQM//8L/wwICwcE/wP///8HAv8E/wcNC/8QCgb/CP///wILA///Cwv/////DP///wsJ/wEBAf///wkICQMI//8JAv////////8CAgkD//8G/wIGBggECAL/////Awr//wL//wkF/wkI/woE////Cf8D//8D/wIG/wX/AwQD/wT//wX/CQME////AgMF/wIDBf8E/wkNAQMBBwUEAgT///8EBwMCA///B/////8L/wULC/8H/wj/AwID////Bv///wf/AwH///8GBf//Bv8CAwEKBf//BwP//wP/AgkFCAn/CP///wQM/wj/CQQD/wcDB/8D////CgEJ//8DBf////8D////BAb/DAoLA/////////8I//8GBP///////////////wf/////////////////////CP////////////8B//8I//8C/////////////////////////////////////////////////////////////////////////////wH/////////A/////////8FB///////////////CP//////////////////////////CP//Av///////////////////////////wII////B/////////////////////////8K//8IBv///////////////wn/////////////////////Cv////////////8D//8K//8E/////////////////////////////////////////////////////////////////////////////wL/////////Bf////////8HCf//////////////Cv//////////////////////////Cv//BP///////////////////////////wEK////Cf//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AQEIBf//Agn/////////CQgDCf//BP8JAwUDBgIJ/////wcC//8H//8FB/8GBf8DB////wb/Cv//Cf8JDf8E/wkGB/8I//8F/wIKC////wkKB/8JCgX/Cf8GBAkICQMFCAkJ////CAQKCQr//wX/////Av8MAgL/A/8D/wkJCv///wf///8O/wgJ////BAf//wf/CAgIAQb//wIK//8J/woGCQUD/wH///8FA/8C/wULCf8OCAT/Bv///wEJAf//CQn/////Cv///wkH/wMBAgEHBP//AQj/////////CAcDCP//A/8IAgQCBQII/////wYC//8G//8EBv8FBP8CBv///wX/Cf//CP8IDP8D/wgFBv8H//8E/wIJCv///wgJBv8ICQT/CP8FBQgHCAIEBwgI////BwMJCAn//wT/////A/8LAwP/Av8C/wgICf///wb///8N/wcI////Awb//wb/BwcHAgX//wEJ//8I/wkFCAQD/wH///8EBP8B/wQKCP8NBwP/Bf///wIIAv//CAj/////Cf///wgG/wQCAwgF//8BCf////////8JCAQJ//8E/wkDBQMGAwn/////BwH//wf//wUH/wYF/wIH////Bv8K//8J/wkN/wT/CQYH/wj//wX/AwoL////CQoH/wkKBf8J/wYECQgJAwUICQn///8IBAoJCv//Bf////8D/wwDAv8D/wL/CQkK////B////w7/CAn///8EB///B/8ICAgCBv//Agr//wn/CgYJBQT/Av///wUE/wL/BAsJ/w4IBP8G////AgkC//8JCf////8K////CQf/AwIDBv//BwT/////////AgEIAv//BP8EBgQHAgcE/////wEI//8E//8HA/8HBv8IBf///wf/Bf//A/8CCP8H/wUGBf8B//8H/wgFBv///wQFB/8EBQf/Af8HDAMCBAUDAgQE////BAUFBAX//wX/////Cv8HCgr/Bf8G/wIEBf///wj///8J/wUC////BwP//wj/AwMDCQf//wYF//8C/wIHAgYI/wf///8GC/8G/wcGBf8JBQX/Bf///wkDCP//BQL/////Bf///wQI/wsJCv//BAn/////////BwYGB///Av8JBAMFBAUJ/////wUF//8I//8BBf8DAf8FCP///wL/Cv//CP8IDf8F/woHCP8G//8G/wYKC////wkKCP8JCgb/B/8BCQgGCQMDBgkJ////CQEKCQr//wL/////B/8MBwf/Av8D/wcJCv///wj///8O/wkH////BQX//wj/CQkIBgf//wQK//8H/wgCBwIG/wX///8GCP8D/wILCv8OCQP/B////wYIBv//Cgf/////Cv///woI/wgGB/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8CBP///////////////wL/////////////////////A/////////////8H//8D//8G/////////////////////////////////////////////////////////////////////////////wj/////////Bf////////8DAf//////////////Av//////////////////////////A///B////////////////////////////wkC////A////////////////wn/////////CAcECP//A/8JAwQDBQMJ/////wYB//8H//8EBv8FBP8BB////wX/Cv//Cf8JDf8E/wkGB/8H//8F/wMKC////wkKB/8JCgX/CP8FBQkHCQIEBwkJ////CAMKCQr//wT/////BP8MBAP/Av8B/wgJCv///wf///8O/wgI////BAb//wf/CAgIAwb//wIK//8I/wkFCAQE/wL///8FBf8B/wMLCf8OCAP/Bv///wMJA///CQj/////Cv///wkH/wQDBP////////8DAwkE//8H/wIGBwgFCAL/////BAr//wL//woG/woJ/woE////Cv8B//8E/wME/wX/AQMC/wX//wT/CQEC////AQIE/wEBBf8F/woNAgQCBwYFAwX///8FCAEBAf//CP////8L/wMLC/8I/wn/BAIB////Bf///wX/AQL///8FBv//Bf8DBAEKBP//BwP//wT/AwoGCQn/CP///wQM/wj/CgIB/wUCCP8D////CgIJ//8CBv////8B////BQX/DAoLAv///////////////wH/////////////////////Av////////////8F//8C//8E/////////////////////////////////////////////////////////////////////////////wb/////////A/////////8BAf//////////////Av//////////////////////////Av//Bf///////////////////////////wcC////Af///////////////////////////////wP/////////////////////BP////////////8D//8E//8C/////////////////////////////////////////////////////////////////////////////wT/////////Af////////8BA///////////////BP//////////////////////////BP//A////////////////////////////wUE////A////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wEJAv//Bf8DBwUIAwgD/////wIJ//8D//8IBP8IB/8JBf///wj/BP//A/8CB/8G/wQFBP8C//8G/wkEBf///wMEBv8DBAb/Av8IDQICAwYEAwME////BAYEAwT//wb/////C/8GCwv/Bv8H/wIDBP///wf///8I/wQB////BwT//wf/AwMCCgb//wcE//8C/wEIAwcJ/wj///8FDP8H/wgFBP8IBAb/BP///woCCf//BAP/////BP///wQH/wwKCwgB//8E/wMGBAcCBwP/////AQj//wP//wcD/wcG/wgF////B/8E//8D/wIH/wb/BAUE/wL//wb/CAQF////AwQG/wMEBv8C/wcMAgEDBQMCAwT///8EBQQDBP//Bf////8K/wYKCv8F/wb/AQME////B////wj/BAH///8HA///B/8DAwIJBv//BgT//wL/AgcDBgj/B////wUL/wb/BwUE/wgEBf8E////CQII//8EA/////8E////BAf/CwkKCf//BP8JAwUBBgEJ/////wcF//8H//8GB/8HBv8FB////wf/Cv//Cf8JDf8E/wkGB/8I//8F/wIKC////wkKB/8JCgX/Cf8HBgkICQMFCAkJ////CAUKCQr//wX/////BP8MBAX/BP8E/wkJCv///wf///8O/wgJ////BAf//wf/CAgIBAb//wIK//8J/woHCQYB/wL///8FBf8D/wYLCf8OCAT/Bv///wMJA///CQn/////Cv///wkH/wUEBf//Bf8EBwUIAwgE/////wIJ//8E//8IBP8IB/8JBv///wj/Bf//BP8DCP8H/wUGBf8D//8H/wkFBv///wQFB/8EBQf/A/8IDQMCBAYEAwQF////BQYFBAX//wb/////C/8HCwv/Bv8H/wIEBf///wj///8J/wUC////CAT//wj/BAQDCgf//wcF//8D/wMIBAcJ/wj///8GDP8H/wgGBf8JBQb/Bf///woDCf//BQT/////Bf///wUI/wwKC////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wH///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8HAgEDAgMH/////wME//8G//8DA/8DAv8EBv///wP/CP//Bv8GC/8D/wgFBv8E//8E/wQICf///wcIBv8HCAT/Bf8DCAYEBwEBBAcH////BwEIBwj//wH/////Bv8KBgb/Af8C/wUHCP///wb///8M/wcF////AwP//wb/BwcGBQX//wII//8F/wYDBQIE/wP///8EB/8C/wMJCP8MBwH/Bf///wUGBP//CAX/////CP///wgG/wcFBv////////////////////8D/////////////wb//wP//wX/////////////////////////////////////////////////////////////////////////////B/////////8E/////////wIB//////////////8D//////////////////////////8D//8G////////////////////////////CAP///8C////////////////BgcIBQgC/////wQK//8C//8KBv8KCf8KBP///wr/A///BP8DBv8F/wMEA/8F//8F/wkDBP///wIDBf8CAwX/Bf8KDQIEAQcGBQMF////BQgDAgP//wj/////C/8FCwv/CP8J/wQCA////wb///8H/wMC////Bgb//wb/AwQBCgX//wcD//8E/wMKBgkJ/wj///8EDP8I/woEA/8HAwj/A////woCCf//Awb/////A////wUG/wwKCwMCBAIG/////wUE//8E//8EBf8FBP8EBP///wX/B///Bv8GCv8B/wYDBP8G//8C/wMHCP///wYHBP8GBwL/B/8FBwYGBgEDBgYG////BQMHBgf//wP/////Bf8JBQX/Av8D/wcGB////wT///8L/wUG////AQX//wT/BQUFBAP//wEH//8H/wcFBwQD/wL///8CBv8C/wQIBv8LBQL/A////wQGA///Bgf/////B////wYE/wYEBQQCBAf/////AwX//wf//wQD/wMD/wUH////A/8I//8G/wYL/wT/CAYH/wT//wX/BQgJ////BwgH/wcIBf8F/wQJBgQHAgEEBwf///8IAggHCP//Af////8H/woHB/8C/wP/BQcI////B////wz/CAX///8EA///B/8HBwYGBv//Awj//wX/BgQFAgX/BP///wUI/wP/BAkI/wwIAv8G////BgYF//8IBf////8I////CAf/CAYHBQEI/////wYE//8G//8FBv8GBf8EBv///wb/Cf//CP8IDP8D/wgFBv8H//8E/wIJCv///wgJBv8ICQT/CP8GBggHCAIEBwgI////BwQJCAn//wT/////BP8LBAX/A/8D/wgICf///wb///8N/wcI////Awb//wb/BwcHBAX//wEJ//8I/wkGCAUC/wL///8EBf8C/wUKCP8NBwP/Bf///wMIA///CAj/////Cf///wgG/wUEBQUF/////wEG//8F//8FAf8FBP8GB////wX/Bv//BP8ECf8F/wYHBv8C//8G/wYGB////wUGCP8FBgb/A/8FCgQCBQMBAgUF////BgMGBQb//wP/////CP8ICAj/A/8E/wMFBv///wj///8K/wYD////BQH//wj/BQUEBwf//wQG//8D/wQFAwQG/wX///8GCf8E/wUHBv8KBgP/Bv///wcEBv//BgP/////Bv///wYI/wkHCAj/////BgT//wb//wUG/wYF/wQG////Bv8J//8I/wgM/wP/CAUG/wf//wT/AQkK////CAkG/wgJBP8I/wYFCAcIAgQHCAj///8HBAkICf//BP////8D/wsDBP8D/wP/CAgJ////Bv///w3/Bwj///8DBv//Bv8HBwcDBf//AQn//wj/CQYIBQH/Af///wQE/wL/BQoI/w0HA/8F////AggC//8ICP////8J////CAb/BAME/////wQK//8C//8KBv8KCf8KBP///wr/A///BP8DBv8F/wMEA/8F//8F/wkDBP///wIDBf8CAwX/Bf8KDQIEAgcGBQMF////BQgDAgP//wj/////C/8FCwv/CP8J/wQBA////wb///8H/wMC////Bgb//wb/AwQBCgX//wcB//8E/wMKBgkJ/wj///8EDP8I/woEA/8HAwj/A////woCCf//Awb/////A////wUG/wwKC////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wf//wT//wYC/wYF/wcG////Bv8F//8D/wMI/wb/BQYF/wH//wf/BwUG////BAUH/wQFB/8C/wYLAwEEBAIBBAT///8FBAUEBf//BP////8J/wcJCf8E/wX/AgQF////CP///wn/BQL///8GAv//CP8EBAMIB///BQX//wL/AwYCBQf/Bv///wYK/wX/BgYF/wkFBP8F////CAMH//8FAv////8F////BQj/CggJ//8I//8FB/8GBf8BCP///wb/C///Cv8KDv8F/woHCP8I//8G/wQLDP///woLCP8KCwb/Cf8GBQoICgMFCAoK////CQQLCgv//wX/////BP8NBAP/A/8C/wkKC////wj///8P/wkJ////BQf//wj/CQkJAwf//wML//8J/woGCQUF/wP///8GBf8C/wQMCv8PCQT/B////wMKA///Cgn/////C////woI/wQDBP///////////////////////////////wH///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8IBv8JCP8IAv///wn/A///BP8DBv8D/wMCAv8F//8D/wcDBP///wIDA/8CAwP/Bf8JCwIEAgUGBQME////AwcDAgP//wf/////Cf8FCQn/Bv8H/wQCA////wT///8H/wMC////BAb//wT/AwMBCAP//wUD//8E/wMJBggH/wb///8CCv8G/wgEA/8HAwb/Af///wgCB///Awb/////A////wQE/woICf////////////8H//8C//8G/////////////////////////////////////////////////////////////////////////////wj/////////Bf////////8DAv//////////////Av//////////////////////////Af//B////////////////////////////wkC////Av//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////Bv8EAv8FCP///wP/C///Cf8JDv8F/woHCP8H//8G/wYLDP///woLCP8KCwb/CP8CCQkHCgMEBwoK////CQILCgv//wP/////B/8NBwf/Av8D/wgKC////wj///8P/wkI////BQb//wj/CQkJBgf//wQL//8I/wkDCAMG/wX///8GCP8D/wEMCv8PCQT/B////wYJBv//Cgj/////C////woI/wgGB/8GBf8HCP///wb/B///Bf8FCv8G/wcIB/8D//8H/wcHCP///wYHCf8GBwf/BP8GCwUDBgQCAwYG////BwQHBgf//wT/////Cf8JCQn/BP8F/wQGB////wn///8L/wcE////BgL//wn/BgYFCAj//wUH//8E/wUGBAUH/wb///8HCv8F/wYIB/8LBwT/B////wgFB///BwT/////B////wcJ/woICf//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////Av8GCf///wL/C///Cf8JDv8G/wsICf8H//8H/wcLDP///woLCf8KCwf/CP8DCgkHCgQEBwoK////CgILCgv//wL/////CP8NCAj/A/8E/wgKC////wn///8P/woI////Bgb//wn/CgoJBwj//wUL//8I/wkDCAEH/wb///8HCf8E/wQMC/8PCgT/CP///wcJB///Cwj/////C////wsJ/wkHCP8FCP///wH/Cv//CP8IDf8F/woHCP8G//8G/wYKC////wkKCP8JCgb/B/8BCQgGCQMDBgkJ////CQEKCQr//wL/////B/8MBwf/Av8D/wcJCv///wj///8O/wkH////BQX//wj/CQkIBgf//wQK//8H/wgBBwEG/wX///8GCP8D/wMLCv8OCQP/B////wYIBv//Cgf/////Cv///woI/wgGB///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CP///wb/C///Cv8KDv8F/woHCP8I//8G/wQLDP///woLCP8KCwb/Cf8GBgoICgMFCAoK////CQQLCgv//wX/////Bf8NBQT/A/8C/wkKC////wj///8P/wkJ////BQf//wj/CQkJBAf//wML//8J/woGCQUF/wP///8GBv8C/wQMCv8PCQT/B////wQKBP//Cgn/////C////woI/wUEBf///wn/Bf//A/8DCP8D/wQCAv8F//8D/wcFBv///wQFA/8EBQP/Bf8JCwQGBAUHBwMC////AQcFBAX//wf/////Cf8HCQn/Bv8H/wYEBf///wT///8J/wME////BAj//wT/AgIDCAP//wUF//8E/wQJBggH/wb///8CCv8G/wgGBP8JAwb/Af///wgDB///BAb/////Bf///wIE/woICf////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8H//8B/////////////////////////////////////////////////////////////////////////////wH/////////Av////////8EBv//////////////B///////////////////////////B///Af///////////////////////////wIH////Bv////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8L//8J/wkO/wb/CwgJ/wf//wf/BwsM////CgsJ/woLB/8I/wIKCQcKBAQHCgr///8KAgsKC///Av////8I/w0ICP8D/wT/CAoL////Cf///w//Cgj///8GBv//Cf8KCgkHCP//BQv//wj/CQIIAQf/Bv///wcJ/wT/BAwL/w8KBP8I////BwkH//8LCP////8L////Cwn/CQcI//8G/////////////////////////////////////////////////////////////////////////////wj/////////Bf////////8DAv//////////////Av//////////////////////////Af//B////////////////////////////wkC////Af//////////////////Bf8EBf8G/wIEA/8G//8F/woCA////wIDBf8CAgb/Bv8LDgMFAwgHBgQG////BgkCAgL//wn/////DP8EDAz/Cf8K/wUDAv///wb///8G/wID////Bgf//wb/BAUCCwX//wgE//8F/wQLBwoK/wn///8FDf8J/wsDAv8GAwn/BP///wsDCv//Awf/////Av///wYG/w0LDP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wL/////////Af////////8DBf//////////////Bv//////////////////////////Bv//Af///////////////////////////wMG////Bf////////////////8BCP8F/wUEBP8C//8F/wkFBv///wQFBf8EBQX/A/8JDQQEBAcFBAMB////AgcFBAX//wf/////C/8HCwv/B/8I/wQEBf///wb///8J/wUD////BgX//wb/AgEDCgX//wcF//8B/wIJAwgJ/wj///8EDP8I/wkGBf8JBQf/A////woCCf//BQP/////Bf///wIG/wwKC///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////B/8F/wQEBP8C//8F/wkEBf///wMEBf8DBAX/Av8JDQMDAwcFBAIC////AgcEAwT//wf/////C/8GCwv/B/8I/wMDBP///wb///8I/wQC////BgX//wb/AQECCgX//wcE//8B/wEJAwgJ/wj///8EDP8I/wkFBP8IBAf/A////woBCf//BAP/////BP///wIG/wwKC/8J/wQHBv8J//8I/w0FA////wUGCP8FAwn/Cf8OEQYIBgsKCQcJ////CQwDBQX//wz/////D/8BDw//DP8N/wgGBf///wn///8B/wUG////CQr//wn/BwgFDgj//wsH//8I/wcOCg0N/wz///8IEP8M/w4CBf8BBgz/B////w4GDf//Bgr/////BP///wkJ/xAOD////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wUCA/8H//8B/wQGB////wUGA/8FBgH/B/8GCAUHBQIEBwUF////BAQGBQb//wT/////Bv8IBgb/A/8E/wcFBv///wP///8K/wQF////AQb//wP/BAQEBQL//wIG//8G/wYGCAUE/wP///8BB/8D/wUHBf8KBAP/Av///wUFBP//BQj/////Bv///wUD/wcFBv///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wMC/wb//wT/CQID////AgME/wICBf8G/wsNAwUDBwcGBAb///8FCQECAv//Cf////8L/wMLC/8I/wn/BQMB////Bf///wX/AQP///8FB///Bf8EBQIKBP//BwT//wX/BAsHCgn/CP///wQM/wj/CgIC/wUDCP8D////CgMJ//8DB/////8C////BgX/DAoLAf8G//8B/wYEBf///wQFAf8DBAL/Bv8ICgQGBAQGBwQE////AwYEBAT//wb/////CP8GCAj/Bf8G/wYEBP///wL///8I/wIE////Agj//wL/AwMDBwH//wQF//8F/wUIBwcG/wX///8BCf8F/wcFA/8IAgX/Af///wcEBv//Awf/////BP///wQC/wkHCP8G//8C/wcDBP///wMEAv8CAwP/Bv8JCwMFAwUHBgQE////AwcDAwP//wf/////Cf8FCQn/Bv8H/wUDA////wP///8H/wED////Awf//wP/AwMCCAL//wUE//8F/wQJBwgH/wb///8CCv8G/wgEAv8HAQb/Af///wgDB///Agf/////A////wQD/woICf////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8H/wgGB////wUGB/8FBgf/Av8HDAQCBQUDAgQD////BAUGBQb//wX/////Cv8ICgr/Bf8G/wMFBv///wj///8K/wYD////BwP//wj/AwMECQf//wYG//8B/wIHAQYI/wf///8GC/8G/wcHBv8KBgX/Bf///wkDCP//BgH/////Bv///wQI/wsJCv///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wUFBv///wUGAv8EBQL/B/8HCQUHBQMFCAUF////BAUFBQX//wX/////B/8HBwf/BP8F/wcFBf///wL///8J/wMF////AQf//wL/BAQEBgH//wMG//8G/wYHCAYF/wT///8BCP8E/wYGBP8JAwT/Av///wYFBf//BAj/////Bf///wUC/wgGB////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////woL////CQoH/wkKBf8J/wcECQgJAwUICQn///8IBQoJCv//Bf////8C/wwCA/8E/wT/CQkK////B////w7/CAn///8EB///B/8ICAgCBv//Agr//wn/CgcJBgH/Af///wUD/wP/BgsJ/w4IBP8G////AQkB//8JCf////8K////CQf/AwIDA////wIDBf8BAgb/Bv8LDgMFAwgHBgQG////BgkCAgL//wn/////DP8EDAz/Cf8K/wUDAv///wb///8G/wID////Bgf//wb/BAUCCwX//wgE//8F/wQLBwoK/wn///8FDf8J/wsDAf8GAgn/BP///wsDCv//AQf/////Av///wYG/w0LDP///wMEBv8DAQf/B/8MDwQGBAkIBwUH////BwoCAwP//wr/////Df8CDQ3/Cv8L/wYEA////wf///8E/wME////Bwj//wf/BQYDDAb//wkF//8G/wUMCAsL/wr///8GDv8K/wwBA/8EBAr/Bf///wwEC///BAj/////Af///wcH/w4MDf///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wEF/wICBf8F/woNAgQCBwYFAwX///8FCAICAv//CP////8L/wQLC/8I/wn/BAIC////Bv///wb/AgL///8GBv//Bv8DBAEKBf//BwP//wT/AwoGCQn/CP///wQM/wj/CgMC/wYDCP8D////CgIJ//8DBv////8C////BQb/DAoLBv8DAwb/Bv8LDgMFAwgHBgQG////BgkDAwP//wn/////DP8FDAz/Cf8K/wUDA////wf///8H/wMD////Bwf//wf/BAUCCwb//wgE//8F/wQLBwoK/wn///8FDf8J/wsEA/8HBAn/BP///wsDCv//BAf/////A////wYH/w0LDP8EBQP/B/8JCwUHBQUHCAUF////BAcFBQX//wf/////Cf8HCQn/Bv8H/wcFBf///wL///8J/wMF////Awn//wL/BAQECAH//wUG//8G/wYJCAgH/wb///8CCv8G/wgGBP8JAwb/Av///wgFB///BAj/////Bf///wUC/woICf//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////AgX/Bf8KDQIEAgcGBQMF////BQgCAgL//wj/////C/8ECwv/CP8J/wQCAv///wX///8G/wIC////BQb//wX/AwQBCgT//wcD//8E/wMKBgkJ/wj///8EDP8I/woDAv8GAQj/A////woCCf//AQb/////Av///wUF/wwKCwb/Bv8LDgMFAwgHBgQG////BgkBAgL//wn/////DP8CDAz/Cf8K/wUDAv///wb///8E/wID////Bgf//wb/BAUCCwX//wgE//8F/wQLBwoK/wn///8FDf8J/wsBAv8EAwn/BP///wsDCv//Awf/////Af///wYG/w0LDP8H/wcJBQcFAwUIBQX///8EBQYFBv//Bf////8H/wgHB/8E/wX/BwUG////BP///wr/BAX///8CB///BP8EBAQGA///Awb//wb/BgcIBgX/BP///wEI/wT/BgcF/woEBP8C////BgUF//8FCP////8G////BQT/CAYH//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8IDQQDBQYEAwQE////BAYGBQb//wb/////C/8ICwv/Bv8H/wMFBv///wj///8K/wYD////CAT//wj/AwMECgf//wcG//8C/wIIAwcJ/wj///8GDP8H/wgHBv8KBgb/Bf///woDCf//BgP/////Bv///wQI/wwKC///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////CgkHCgQEBwoK////CgILCgv//wP/////CP8NCAj/A/8E/wgKC////wn///8P/woI////Bgb//wn/CgoJBwj//wUL//8I/wkBCAIH/wb///8HCf8E/wMMC/8PCgT/CP///wcJB///Cwj/////C////wsJ/wkHCA0MDQcJDA0N////DAgODQ7//wn/////A/8QAgL/B/8G/w0NDv///wv///8S/wwN////CAv//wv/DAwMBAr//wYO//8N/w4KDQkF/wX///8JAv8G/wgPDf8SDAj/Cv///wMNBP//DQ3/////Dv///w0L/wEDAgMBBwUEAwX///8FBwMCA///B/////8L/wULC/8H/wj/AwID////Bv///wf/AwH///8GBf//Bv8DBAEKBf//BwP//wT/AgkFCAn/CP///wQM/wj/CQQD/wcDB/8D////CgIJ//8DBf////8D////BQb/DAoLBAUDAgQF////BQUFBAX//wX/////Cv8HCgr/Bf8G/wIEBf///wj///8J/wUC////BwP//wj/BAQDCQf//wYF//8D/wMHAwYI/wf///8GC/8G/wcGBf8JBQX/Bf///wkDCP//BQP/////Bf///wUI/wsJCgcGBQMF////BQgDAgP//wj/////C/8FCwv/CP8J/wQCA////wb///8H/wMC////Bgb//wb/AwQBCgX//wcD//8E/wMKBgkJ/wj///8EDP8I/woEA/8HAwj/A////woCCf//Awb/////A////wUG/wwKCwIFBwf///8GAggHCP//Av////8F/woFBf8B/wL/BgcI////Bf///wz/Bgb///8CBP//Bf8GBgYEBP//AQj//wb/BwQGAwP/Av///wMG/wH/AwkH/wwGAf8E////BAcD//8HBv////8I////BwX/BgQFAwYG////BwIHBgf//wL/////B/8JBwf/Av8D/wQGB////wf///8L/wcE////BAL//wf/BgYFBgb//wMH//8E/wUEBAMF/wT///8FCP8D/wQIB/8LBwL/Bv///wYFBf//BwT/////B////wcH/wgGBwUF////BgUGBQb//wX/////Cv8ICgr/Bf8G/wMFBv///wn///8K/wYD////BwP//wn/BQUECQj//wYG//8D/wQHAwYI/wf///8HC/8G/wcHBv8KBgX/Bv///wkECP//BgP/////Bv///wYJ/wsJCgP///8DCAQDBP//CP////8L/wYLC/8I/wn/BAME////Bv///wj/BAL///8GBv//Bv8BAgIKBf//BwT//wP/AgoFCQn/CP///wQM/wj/CgUE/wgECP8D////CgEJ//8EBf////8E////Awb/DAoL////AggGBQb//wj/////C/8ICwv/CP8J/wUFBv///wb///8K/wUE////Bgb//wb/AgEECgX//wcG//8C/wMKBAkJ/wj///8EDP8I/woHBv8KBQj/A////woDCf//BgT/////Bv///wEG/wwKC////////////////////////////////////////////////////////////////////////////////////////////wH//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wgGBQb//wj/////Cv8ICgr/B/8I/wUFBv///wX///8K/wQE////BQf//wX/AgEECQT//wYG//8D/wMKBQkI/wf///8DC/8H/wkHBf8KBAf/Av///wkDCP//BQX/////Bv///wEF/wsJCgkICf//Af////8G/wsGBv8B/wL/BggJ////B////w3/CAb///8EBP//B/8ICAcFBv//Awn//wb/BwIGAQX/BP///wUH/wL/AgoJ/w0IAv8G////BQcF//8JBv////8J////CQf/BwUGAgL//wn/////DP8CDAz/Cf8K/wUDAv///wb///8E/wID////Bgf//wb/BAUCCwX//wgE//8F/wQLBwoK/wn///8FDf8J/wsBAv8EAwn/BP///wsDCv//Awf/////Av///wYG/w0LDAL//wj/////C/8ECwv/CP8J/wQCAv///wb///8G/wIC////Bgb//wb/AwQBCgX//wcD//8E/wMKBgkJ/wj///8EDP8I/woDAv8GAwj/A////woCCf//Awb/////Av///wUG/wwKC///Cf////8M/wQMDP8J/wr/BQMC////Bv///wb/AgP///8GB///Bv8EBQILBf//CAT//wX/BAsHCgr/Cf///wUN/wn/CwMC/wYDCf8E////CwMK//8DB/////8C////Bgb/DQsM//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8H/wsHB/8C/wP/BggJ////B////w3/CAb///8EBP//B/8ICAcGBv//Awn//wb/BwMGAQX/BP///wUI/wP/AwoJ/w0IAv8G////BgcF//8JBv////8J////CQf/CAYH//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8OAQL/Bf8F/wsLDP///wn///8Q/woL////Bgn//wn/CgoKAgj//wQM//8L/wwICwcD/wP///8HAv8E/wcNC/8QCgb/CP///wELAv//Cwv/////DP///wsJ/wIBAv////////8D/////////wUH//////////////8I//////////////////////////8I//8C////////////////////////////AQj///8H////////////////Dg7/C/8M/wcFBP///wj///8C/wQF////CAn//wj/BgcEDQf//woG//8H/wYNCQwM/wv///8HD/8L/w0BBP8CBQv/Bv///w0FDP//BQn/////A////wgI/w8NDgL/Bf8F/wsLDP///wn///8Q/woL////Bgn//wn/CgoKAgj//wQM//8L/wwICwcD/wP///8HAf8E/wcNC/8QCgb/CP///wELAv//Cwv/////DP///wsJ/wEBAf8F/wT/CwsM////Cf///xD/Cgv///8GCf//Cf8KCgoDCP//BAz//wv/DAgLBwT/A////wcC/wT/Bg0L/xAKBv8I////AgsD//8LC/////8M////Cwn/AQEC//////////////////////////////////////////////////////////////////////////////////////////////////////////////////////8B/wYICf///wb///8N/wcG////AwT//wb/BwcHBAX//wIJ//8G/wcDBgIE/wP///8EBv8B/wIKCP8NBwL/Bf///wQHBP//CAb/////Cf///wgG/wYEBf///////////////////////////////////////////////////////////////////////////////////////////////////////////////////wcJCv///wf///8O/wgH////BAX//wf/CAgIBAb//wIK//8H/wgEBwME/wP///8FBv8B/wILCf8OCAP/Bv///wQIBP//CQf/////Cv///wkH/wUEBf////////8CBP//////////////Bf//////////////////////////Bf//Av///////////////////////////wQF////BP///////////////wQF////CP///wn/BQL///8IBP//CP8EBAMKB///BwX//wP/AwgEBwn/CP///wYM/wf/CAYF/wkFBv8F////CgMJ//8FBP////8F////BQj/DAoLA////wb///8H/wMC////Bgb//wb/AwQBCgX//wcB//8E/wMKBgkJ/wj///8EDP8I/woEA/8HAwj/A////woCCf//Awb/////A////wUG/wwKC////wb///8G/wID////Bgf//wb/BAUCCwX//wgE//8F/wQLBwoK/wn///8FDf8J/wsDAv8GAwn/BP///wsDCv//Awf/////Av///wYG/w0LDP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wr/BAb///8DCf//Av8FBQUIAf//BQf//wf/BwkJCAf/Bv///wMK/wb/CAcF/woEBv8D////CAYH//8FCf////8G////BgH/CggJAv//////////////A///////////////////////////A///BP///////////////////////////wYD////Av//////////////////////////////Av//////////////////////////Av//Bv///////////////////////////wgC////Av///////////////////////////////////////////////////////////////////////////////////////////////////////////////////wYH////Cgv//wr/CAkGDwn//wwI//8J/wgPCw4O/w3///8JEf8N/w8DBv8CBw3/CP///w8HDv//Bwv/////Bf///woK/xEPEP///////////////////////////////////////////////////////////////////////////////////////////////wP///8EB///BP8EBAIJA///BgT//wX/BAoHCQj/B////wML/wf/CQMC/wYCB/8C////CQMI//8CB/////8C////BQT/CwkK////BgT//wb/AgMBCgX//wcD//8D/wEIBAcJ/wj///8EDP8H/wgEA/8HAwb/A////woBCf//AwT/////A////wQG/wwKC////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wb//wP/BQUFBQL//wIH//8H/wcGCAUE/wP///8CB/8D/wUHBf8KBAP/A////wUGBP//BQj/////Bv///wYD/wcFBv//Cf8GBgUICP//BQf//wT/BQYEBQf/Bv///wcK/wX/BggH/wsHBP8H////CAUH//8HBP////8H////Bwn/CggJ////////////////////////////////////////////////////////////////////////////////////////////////////////////////Av//B////////////////////////////wkC////Av////////////////8FBQUIAf//BQf//wf/BwkJCAf/Bv///wMK/wb/CAcF/woEBv8D////CAYH//8FCf////8G////BgL/CggJ/////////////////////////////////////////////////////////////////////////////////wECCQT//wYE//8C/wIKBAkI/wf///8DC/8H/wkFBP8IBAf/Av///wkBCP//BAT/////BP///wIF/wsJCgMJBP//BgX//wL/AgoECQj/B////wML/wf/CQYF/wkEB/8C////CQII//8FBP////8F////AQX/CwkKCQT//wYC//8D/wIJBQgI/wf///8DC/8H/wkDAv8GAgf/Av///wkBCP//AgX/////Av///wQF/wsJCgf//wML//8K/wsHCgYD/wL///8GA/8D/wYMCv8PCQX/B////wEKAf//Cgr/////C////woI/wMCA///BAb//wb/BggIBwb/Bf///wIJ/wX/BwYE/wkDBf8C////BwUG//8ECP////8F////BQH/CQcI/////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wj//wf/CAUHBAL/Af///wMF/wH/BAkH/wwGAv8E////AwcC//8HB/////8I////BwX/BQME//8F/wQLBwoK/wn///8FDf8J/wsFBP8IBAn/BP///wsDCv//BAf/////BP///wYH/w0LDP///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////wIIAgcJ/wj///8FDP8H/wgGBf8JBQb/BP///woCCf//BQL/////Bf///wMH/wwKC////////////////////////////////////////////////////////////////wkDCAr/Cf///wUN/wj/CQUE/wgEB/8E////CwEK//8EA/////8E////Awf/DQsMCAIH/wb///8HCf8E/wQMC/8PCgT/CP///wcJB///Cwj/////C////wsJ/wkHCAcJ/wj///8HDP8H/wgIB/8LBwb/Bv///woECf//BwL/////B////wUJ/wwKCwb/Bf///wYI/wP/AwsK/w4JA/8H////BggG//8KB/////8K////Cgj/CAYH/wL///8FBP8D/wYLCf8OCAT/Bv///wIJAv//CQn/////Cv///wkH/wQDBP//B////////////////////////////wkC////Av///////////////////wQE/wL/BQoI/w0HA/8F////AggB//8ICP////8J////CAb/BAID/////////////////////////////////////////////////////////////////////////////////wMH////Bv//////////////////////////////////////////////////////////////////CP8E/wYGBP8JAwT/Af///wYEBf//BAf/////Bf///wQD/wgGB/8F/wgODP8RCwf/Cf///wIMA///DAz/////Df///wwK/wECAv///////////////////////////////////////////////wMKCP8NBwL/Bf///wMIA///CAf/////Cf///wgG/wUDBP///////////////////////////////////////////wwK/w8JBP8H////BgkG//8KCP////8L////Cgj/BwYHA/8DBAr/Bf///wwEC///BAj/////Av///wcH/w4MDf8GAgj/A////woDCf//AQf/////Av///wYF/wwKC///////////////////////////////////////Bw3/CP///w8HDv//Bwv/////Bf///woK/xEPEAf/Av///wkDCP//AQf/////A////wUE/wsJCv8F////BQcE//8IBv////8J////CAb/BwUG/////////////////////////////////////wcDBv//Awb/////BP///wMD/wkHCP///////////////////////////////////////////////////////////////////////////////////////woB//8KCv////8L////Cgj/AgECCf//AwT/////A////wMG/wwKC///CQn/////Cv///wkH/wMCAwn///8I////////////////////Av///////////////wf/////A////wYF/wwKC/////8H////BQn/DAoL/////////////////////////////////////////////////////////////////wYG/w0LDP///////////////////////////wb/DAoL/woICf///wIBAQ==")!)
+
+    private static let indexByIsoCode: [String: Int] = Dictionary(
+        uniqueKeysWithValues: isoCodes.enumerated().map { ($0.element, $0.offset) }
+    )
+
+    static func index(ofIsoCode isoCode: String) -> Int? {
+        indexByIsoCode[isoCode]
+    }
+
+    private static func neighbourIndices(_ node: Int) -> [Int] {
+        adjacency[Int(adjacencyStart[node])..<Int(adjacencyStart[node + 1])].map { Int($0) }
+    }
+
+    private static func distance(_ a: Int, _ b: Int) -> Int? {
+        if a == b {
+            return 0
+        }
+        let (i, j) = a < b ? (a, b) : (b, a)
+        let value = pairDistances[i * (2 * isoCodes.count - i - 1) / 2 + j - i - 1]
+        return value == unreachable ? nil : Int(value)
+    }
+
+    static func neighbours(ofIsoCode isoCode: String) -> [String] {
+        guard let node = index(ofIsoCode: isoCode) else {
+            return []
+        }
+        return neighbourIndices(node).map { isoCodes[$0] }
+    }
+
+    /// Number of borders crossed on the shortest land route, nil if there is none
+    static func hopDistance(from source: String, to target: String) -> Int? {
+        guard let a = index(ofIsoCode: source), let b = index(ofIsoCode: target) else {
+            return nil
+        }
+        return distance(a, b)
+    }
+
+    /// Countries at most `hops` borders away, nearest first (the country itself excluded)
+    static func countries(within hops: Int, of isoCode: String) -> [String] {
+        guard let node = index(ofIsoCode: isoCode) else {
+            return []
+        }
+        return isoCodes.indices
+            .compactMap { other -> (Int, Int)? in
+                guard other != node, let hopCount = distance(node, other), hopCount <= hops else {
+                    return nil
+                }
+                return (hopCount, other)
+            }
+            .sorted { $0 < $1 }
+            .map { isoCodes[$0.1] }
+    }
+
+    /// One shortest land route, both ends included; nil if the countries are not connected
+    static func shortestPath(from source: String, to target: String) -> [String]? {
+        guard let a = index(ofIsoCode: source), let b = index(ofIsoCode: target),
+              var remaining = distance(a, b) else {
+            return nil
+        }
+        var path = [a]
+        var node = a
+        while remaining > 0 {
+            // Some neighbour is always one border closer to the target
+            guard let next = neighbourIndices(node).first(where: { distance($0, b) == remaining - 1 }) else {
+                return nil
+            }
+            path.append(next)
+            node = next
+            remaining -= 1
+        }
+        return path.map { isoCodes[$0] }
+    }
+
+    static func component(ofIsoCode isoCode: String) -> Int? {
+        index(ofIsoCode: isoCode).map { Int(componentOfNode[$0]) }
+    }
+}
@@ -153,7 +153,7 @@ struct FlagCard: View {
     var body: some View {
         Button(action: onTap) {
             VStack(spacing: 8) {
-                country.flagImage
+                country.thumbnailImage
                     .resizable()
                     .scaledToFit()
                     .frame(height: 80)
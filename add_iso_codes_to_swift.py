@@ -4,13 +4,16 @@ Add ISO codes to Country() calls in FlagData.swift
 """
 
 import re
-from generate_iso_codes import get_iso_code
+
+import country_dataset
+from file_utils import write_if_changed
 
 SWIFT_FILE = "Tapaterra/Models/FlagData.swift"
 
 def main():
     with open(SWIFT_FILE, "r") as f:
         content = f.read()
+    dataset = country_dataset.load()
 
     # Pattern to match Country(name: "...", imageName: "...", continent: ...)
     pattern = r'Country\(name: "([^"]+)", imageName: "([^"]+)", continent: (\.\w+)\)'
@@ -19,15 +22,16 @@ def main():
         country_name = match.group(1)
         image_name = match.group(2)
         continent = match.group(3)
-        iso_code = get_iso_code(country_name)
+        country = dataset.by_name.get(country_name)
+        iso_code = country.alpha2 if country else "XX"
         return f'Country(name: "{country_name}", imageName: "{image_name}", continent: {continent}, isoCode: "{iso_code}")'
 
     updated_content = re.sub(pattern, replace_match, content)
 
-    with open(SWIFT_FILE, "w") as f:
-        f.write(updated_content)
-
-    print(f"Updated {SWIFT_FILE} with ISO codes")
+    if write_if_changed(SWIFT_FILE, updated_content):
+        print(f"Updated {SWIFT_FILE} with ISO codes")
+    else:
+        print(f"{SWIFT_FILE} already has ISO codes")
 
 if __name__ == "__main__":
     main()
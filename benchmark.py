@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Benchmark the data scripts against a local REST Countries stand-in.
+Starts an HTTP server on 127.0.0.1 that serves REST Countries payloads, either
+a recorded dump (e.g. the JSON of /v3.1/all) or records synthesized from the
+country dataset, with configurable latency and error injection. Each script
+then runs in its own process in a scratch directory, so the repository's
+files are left alone.
+
+For every stage the wall time, requests served, bytes sent and peak memory
+(max RSS) are written to a JSON file. With --baseline the results are
+compared with an earlier file and the exit status is 1 on a regression.
+
+Usage:
+  python benchmark.py                                   # all stages, no latency
+  python benchmark.py --latency 0.05 --error-rate 0.05  # a slow, flaky server
+  python benchmark.py --payloads all.json --repeat 3
+  python benchmark.py --baseline old.json --tolerance 0.2
+"""
+
+import argparse
+import contextlib
+import gzip
+import importlib
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import country_dataset
+
+OUTPUT_FILE = "benchmark_results.json"
+API_PREFIX = "/v3.1"
+SPARQL_PATH = "/sparql"
+METRICS = ("wall_time", "requests", "bytes", "peak_rss_bytes")
+
+# Files the scripts read from their working directory
+WORKDIR_FILES = (country_dataset.FLAG_DATA_FILE, country_dataset.ALIASES_FILE, country_dataset.DETAILS_FILE)
+
+
+class Benchmark(NamedTuple):
+    name: str
+    module: str
+    args: Tuple[str, ...] = ()
+    network: bool = True
+    clear_neighbours: bool = False  # start from details without neighbours, so every country is fetched
+
+
+BENCHMARKS = [
+    Benchmark("fetch_details", "fetch_country_details", ("--no-cache",)),
+    Benchmark("fetch_details_bulk", "fetch_country_details", ("--bulk", "--no-cache")),
+    Benchmark("fetch_details_wikidata", "fetch_country_details", ("--bulk", "--no-cache", "--wikidata")),
+    Benchmark("neighbours", "update_neighbours", ("--no-cache",), clear_neighbours=True),
+    Benchmark("neighbours_fast", "update_neighbours_fast", ("--no-cache",), clear_neighbours=True),
+    Benchmark("details_swift", "generate_country_details_swift", network=False),
+]
+
+
+def synthesize_payloads() -> List[Dict]:
+    """REST Countries records rebuilt from the country dataset (what the scripts read, plus the key fields)."""
+    dataset = country_dataset.load()
+    records = []
+    for country in dataset:
+        details = country.details or {}
+        borders = [dataset.by_name[name].alpha3 for name in details.get("neighbours", []) if name in dataset.by_name]
+        record = {
+            "name": {"common": country.common_name, "official": country.name},
+            "cca2": country.alpha2,
+            "cca3": country.alpha3,
+            "ccn3": country.numeric,
+            "capital": [details["capital"]] if details.get("capital") else [],
+            "borders": borders,
+            "population": details.get("population"),
+            "area": details.get("area"),
+            "currencies": {"XXX": {"name": details["currency"]}} if details.get("currency") else {},
+            "languages": {"xxx": details["language"]} if details.get("language") else {},
+        }
+        records.append({key: value for key, value in record.items() if value is not None})
+    return records
+
+
+def synthesize_features() -> Dict[str, Dict[str, List[str]]]:
+    """{Wikidata class id: {alpha-2 code: labels, largest first}} from the curated feature lists."""
+    import wikidata
+
+    curated = {"cities": country_dataset.MAJOR_CITIES, "rivers": country_dataset.MAJOR_RIVERS,
+               "mountains": country_dataset.MAJOR_MOUNTAINS}
+    return {feature.class_id: curated[name] for name, feature in wikidata.FEATURES.items()}
+
+
+def load_payloads(path: str) -> List[Dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class RestCountriesStandIn:
+    """
+    Threaded local server for /all, /alpha?codes= and /alpha/{code}, with injected latency and errors.
+    It also answers the batched Wikidata queries on /sparql from the curated feature lists.
+    """
+
+    def __init__(self, records: List[Dict], latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: Optional[int] = None):
+        self.records = records
+        self.features = synthesize_features()
+        self.by_code = {}
+        for record in records:
+            for key in ("cca2", "cca3"):
+                if record.get(key):
+                    self.by_code[record[key].upper()] = record
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.server.daemon_threads = True
+        self.root_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.errors = 0
+            self.bytes_sent = 0
+
+    def start(self) -> None:
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _draw(self) -> Tuple[float, bool]:
+        with self._lock:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            return delay, self.random.random() < self.error_rate
+
+    def _count(self, body_size: int, error: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += error
+            self.bytes_sent += body_size
+
+    def respond(self, path: str) -> Tuple[int, Optional[object]]:
+        """Status and JSON body for a request path."""
+        parts = urllib.parse.urlsplit(path)
+        query = urllib.parse.parse_qs(parts.query)
+        fields = query["fields"][0].split(",") if "fields" in query else None
+
+        def project(record):
+            return {key: value for key, value in record.items() if key in fields} if fields else record
+
+        if parts.path == SPARQL_PATH and "query" in query:
+            return 200, self.sparql(query["query"][0])
+        route = parts.path[len(API_PREFIX):] if parts.path.startswith(API_PREFIX) else None
+        if route == "/all":
+            return 200, [project(record) for record in self.records]
+        if route == "/alpha" and "codes" in query:
+            codes = [code.upper() for code in query["codes"][0].split(",")]
+            return 200, [project(self.by_code[code]) for code in codes if code in self.by_code]
+        if route and route.startswith("/alpha/"):
+            record = self.by_code.get(route[len("/alpha/"):].upper())
+            if record is None:
+                return 404, None
+            # Like the real API: a projected lookup returns an object, a full one a list
+            return 200, project(record) if fields else [record]
+        return 404, None
+
+    def sparql(self, text: str) -> Dict:
+        """SPARQL JSON results for a query built by wikidata.build_query()."""
+        codes = re.search(r"VALUES \?iso \{([^}]*)\}", text)
+        class_id = re.search(r"wd:(Q\d+)", text)
+        labels_by_code = self.features.get(class_id.group(1), {}) if class_id else {}
+        bindings = []
+        for code in re.findall(r'"([A-Z]{2})"', codes.group(1) if codes else ""):
+            labels = labels_by_code.get(code, [])
+            # Smallest first, with a second, smaller measure per item, so the client has to rank
+            for rank, label in reversed(list(enumerate(labels))):
+                item = f"http://www.wikidata.org/entity/{code}{rank}"
+                for measure in (1000 * (len(labels) - rank), 1000 * (len(labels) - rank) - 1):
+                    bindings.append({
+                        "iso": {"type": "literal", "value": code},
+                        "item": {"type": "uri", "value": item},
+                        "label": {"type": "literal", "value": label, "xml:lang": "en"},
+                        "measure": {"type": "literal", "value": str(measure)},
+                    })
+        return {"head": {"vars": ["iso", "item", "label", "measure"]}, "results": {"bindings": bindings}}
+
+    def _handler_class(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body are separate writes
+
+            def log_message(self, *args):
+                pass
+
+            def send_body(self, status: int, body: bytes, headers: Dict[str, str]) -> None:
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                delay, fail = stand_in._draw()
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    stand_in._count(0, True)
+                    self.send_body(stand_in.error_status, b"", {"Retry-After": "0"})
+                    return
+                status, payload = stand_in.respond(self.path)
+                headers = {"Content-Type": "application/json"}
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+                if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    headers["Content-Encoding"] = "gzip"
+                stand_in._count(len(body), False)
+                self.send_body(status, body, headers)
+
+        return Handler
+
+
+def prepare_workdir(workdir: str, benchmark: Benchmark) -> None:
+    """Fresh copies of the input files, so every stage starts from the same state."""
+    for path in WORKDIR_FILES:
+        if os.path.exists(path):
+            os.makedirs(os.path.join(workdir, os.path.dirname(path)), exist_ok=True)
+            shutil.copyfile(path, os.path.join(workdir, path))
+    if benchmark.clear_neighbours:
+        details_path = os.path.join(workdir, country_dataset.DETAILS_FILE)
+        with open(details_path, "r", encoding="utf-8") as f:
+            details = json.load(f)
+        for record in details.values():
+            record["neighbours"] = []
+        with open(details_path, "w", encoding="utf-8") as f:
+            json.dump(details, f, indent=2, ensure_ascii=False)
+
+
+def run_child(module_name: str, root_url: str, result_path: str, args: List[str]) -> None:
+    """Run one script's main() in this process and write its wall time and peak memory to result_path."""
+    import resource
+
+    sys.argv = [f"{module_name}.py", *args]
+    module = importlib.import_module(module_name)
+    for loaded in list(sys.modules.values()):
+        if hasattr(loaded, "REST_COUNTRIES_BASE"):
+            loaded.REST_COUNTRIES_BASE = root_url + API_PREFIX
+        if hasattr(loaded, "SPARQL_ENDPOINT"):
+            loaded.SPARQL_ENDPOINT = root_url + SPARQL_PATH
+
+    returncode = 0
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            module.main()
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+    wall_time = time.perf_counter() - start
+
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_bytes = max_rss if sys.platform == "darwin" else max_rss * 1024
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump({"wall_time": wall_time, "peak_rss_bytes": peak_rss_bytes, "returncode": returncode}, f)
+
+
+def run_benchmark(benchmark: Benchmark, server: RestCountriesStandIn, extra_args: List[str]) -> Dict:
+    """Run one stage in a scratch directory and return its metrics."""
+    with tempfile.TemporaryDirectory(prefix=f"bench-{benchmark.name}-") as workdir:
+        prepare_workdir(workdir, benchmark)
+        result_path = os.path.join(workdir, "result.json")
+        args = list(benchmark.args) + (extra_args if benchmark.network else [])
+        command = [sys.executable, os.path.abspath(__file__), "--child",
+                   benchmark.module, server.root_url, result_path, *args]
+
+        server.reset()
+        process = subprocess.run(command, cwd=workdir, stderr=subprocess.PIPE, text=True)
+        if process.returncode != 0 or not os.path.exists(result_path):
+            print(process.stderr, file=sys.stderr)
+            return {"returncode": process.returncode or 1}
+        with open(result_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+
+    return {
+        "wall_time": round(result["wall_time"], 4),
+        "requests": server.requests,
+        "errors_injected": server.errors,
+        "bytes": server.bytes_sent,
+        "peak_rss_bytes": result["peak_rss_bytes"],
+        "returncode": result["returncode"],
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions of more than tolerance (a fraction) against a baseline results file."""
+    regressions = []
+    for name, metrics in results["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+        if not previous:
+            continue
+        for metric in METRICS:
+            old, new = previous.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else (1.0 if new else 0.0)
+            marker = ""
+            if change > tolerance:
+                marker = "  REGRESSION"
+                regressions.append(f"{name}.{metric}")
+            style = ".3f" if metric == "wall_time" else ",d"
+            print(f"  {name:<24} {metric:<15} {old:>14{style}} -> {new:>14{style}} ({change:+.1%}){marker}")
+    return regressions
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3], sys.argv[4], sys.argv[5:])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("stages", nargs="*", help=f"stages to run (default: all of {', '.join(b.name for b in BENCHMARKS)})")
+    parser.add_argument("--payloads", help="recorded REST Countries records (a JSON list, e.g. /v3.1/all); "
+                                           "synthesized from the country dataset by default")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503, help="status of injected errors (default: 503)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter and error injection")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stage; the fastest is reported")
+    parser.add_argument("--max-in-flight", type=int, help="passed to the network scripts")
+    parser.add_argument("--rps", type=float, help="passed to the network scripts (0 for unlimited)")
+    parser.add_argument("--output", default=OUTPUT_FILE, help=f"results file (default: {OUTPUT_FILE})")
+    parser.add_argument("--baseline", help="earlier results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="allowed increase over the baseline, as a fraction (default: 0.1)")
+    args = parser.parse_args()
+
+    benchmarks = [b for b in BENCHMARKS if not args.stages or b.name in args.stages]
+    unknown = set(args.stages) - {b.name for b in BENCHMARKS}
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    extra_args = []
+    if args.max_in_flight is not None:
+        extra_args += ["--max-in-flight", str(args.max_in_flight)]
+    if args.rps is not None:
+        extra_args += ["--rps", str(args.rps)]
+
+    records = load_payloads(args.payloads) if args.payloads else synthesize_payloads()
+    server = RestCountriesStandIn(records, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                                  error_status=args.error_status, seed=args.seed)
+    server.start()
+    stages = {}
+    try:
+        for benchmark in benchmarks:
+            runs = [run_benchmark(benchmark, server, extra_args) for _ in range(max(1, args.repeat))]
+            best = min(runs, key=lambda run: run.get("wall_time", float("inf")))
+            stages[benchmark.name] = best
+            if "wall_time" in best:
+                print(f"{benchmark.name:<24} {best['wall_time']:8.3f}s  {best['requests']:5} requests  "
+                      f"{best['bytes']:>10,} bytes  {best['peak_rss_bytes'] / 1024 / 1024:7.1f} MiB peak"
+                      + (f"  exit {best['returncode']}" if best["returncode"] else ""))
+            else:
+                print(f"{benchmark.name:<24} failed (exit {best['returncode']})")
+    finally:
+        server.stop()
+
+    results = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "server": {
+            "payloads": args.payloads or "synthesized",
+            "records": len(records),
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "error_status": args.error_status,
+            "seed": args.seed,
+        },
+        "options": {"repeat": args.repeat, "max_in_flight": args.max_in_flight, "rps": args.rps},
+        "stages": stages,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+    print(f"\nWrote {args.output}")
+
+    failed = [name for name, metrics in stages.items() if metrics.get("returncode")]
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.baseline} ({baseline.get('commit') or 'unknown commit'}):")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.tolerance:.0%}: {', '.join(regressions)}")
+    if failed or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
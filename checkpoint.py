@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Append-only checkpoint journal for resumable fetch runs.
+Each finished country is appended as one JSON line, so a killed run loses at
+most the line being written. The journal is discarded once the results are in
+the country store.
+"""
+
+import json
+import os
+import threading
+from typing import Dict
+
+
+class CheckpointJournal:
+    """JSONL journal of finished work, keyed by ISO code."""
+
+    def __init__(self, output_file: str, resume: bool = False):
+        self.path = f"{output_file}.journal.jsonl"
+        self._lock = threading.Lock()
+        if not resume and os.path.exists(self.path):
+            os.remove(self.path)
+        elif resume and os.path.exists(self.path):
+            self._terminate_torn_line()
+
+    def _terminate_torn_line(self) -> None:
+        """Make sure new records start on a fresh line after a crash mid-write."""
+        with open(self.path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def load(self) -> Dict[str, object]:
+        """Return journaled values by key; a torn last line from a crash is ignored."""
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                entries[entry["key"]] = entry["value"]
+        return entries
+
+    def record(self, key: str, value) -> None:
+        """Append one finished entry and flush it to disk."""
+        line = json.dumps({"key": key, "value": value}, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def discard(self) -> None:
+        """Drop the journal once its entries are saved elsewhere."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def add_arguments(parser) -> None:
+    """Add the --resume option to an argparse parser."""
+    parser.add_argument("--resume", action="store_true",
+                        help="skip countries recorded in the checkpoint journal of an interrupted run")
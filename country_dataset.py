@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Canonical country dataset shared by the scripts.
+Joins ISO_MAPPING and the ISO 3166 index (generate_iso_codes.py), the
+Country() entries of FlagData.swift (continent and flag asset), the flag
+aliases written by import_flags.py and country_details.json (exported from
+country_store.py) into one record per country, with indexes by name,
+alpha-2, alpha-3, continent and asset name.
+
+Loading parses the sources once and stores the records in a pickle snapshot;
+later loads read the snapshot while the sources' sizes and mtimes match.
+
+Usage:
+  python country_dataset.py            # rebuild the snapshot if stale and print a summary
+  python country_dataset.py --rebuild  # always rebuild
+"""
+
+import argparse
+import json
+import os
+import pickle
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from generate_iso_codes import ISO_3166, ISO_MAPPING
+from file_utils import write_if_changed
+
+FLAG_DATA_FILE = "Tapaterra/Models/FlagData.swift"
+ALIASES_FILE = "flag_aliases.json"
+DETAILS_FILE = "country_details.json"
+SOURCES = (__file__, "generate_iso_codes.py", FLAG_DATA_FILE, ALIASES_FILE, DETAILS_FILE)
+SNAPSHOT_FILE = ".country_dataset.pickle"
+SNAPSHOT_VERSION = 1
+
+COUNTRY_PATTERN = re.compile(
+    r'Country\(name: "([^"]+)", imageName: "([^"]+)", continent: \.(\w+)(?:, isoCode: "(\w+)")?\)')
+
+# Curated geographic features used when no better source is available
+MAJOR_CITIES = {
+    "US": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"],
+    "CA": ["Toronto", "Montreal", "Vancouver", "Calgary", "Edmonton"],
+    "GB": ["London", "Manchester", "Birmingham", "Glasgow", "Liverpool"],
+    "FR": ["Paris", "Marseille", "Lyon", "Toulouse", "Nice"],
+    "DE": ["Berlin", "Munich", "Hamburg", "Frankfurt", "Cologne"],
+    "IT": ["Rome", "Milan", "Naples", "Turin", "Palermo"],
+    "ES": ["Madrid", "Barcelona", "Valencia", "Seville", "Bilbao"],
+    "PL": ["Warsaw", "Krakow", "Wroclaw", "Gdansk", "Poznan"],
+    "BR": ["São Paulo", "Rio de Janeiro", "Brasília", "Salvador", "Fortaleza"],
+    "CN": ["Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Chengdu"],
+    "JP": ["Tokyo", "Osaka", "Yokohama", "Nagoya", "Sapporo"],
+    "IN": ["Mumbai", "Delhi", "Bangalore", "Hyderabad", "Chennai"],
+    "AU": ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide"],
+    "MX": ["Mexico City", "Guadalajara", "Monterrey", "Puebla", "Tijuana"],
+    "RU": ["Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Kazan"],
+    "ZA": ["Cape Town", "Johannesburg", "Durban", "Pretoria", "Port Elizabeth"],
+    "EG": ["Cairo", "Alexandria", "Giza", "Shubra El Kheima", "Port Said"],
+    "NG": ["Lagos", "Kano", "Ibadan", "Abuja", "Port Harcourt"],
+    "KE": ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret"],
+    "AR": ["Buenos Aires", "Córdoba", "Rosario", "Mendoza", "La Plata"],
+    "CL": ["Santiago", "Valparaíso", "Concepción", "La Serena", "Antofagasta"],
+    "CO": ["Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena"],
+    "PE": ["Lima", "Arequipa", "Trujillo", "Chiclayo", "Piura"],
+}
+
+MAJOR_RIVERS = {
+    "US": ["Mississippi", "Missouri", "Colorado", "Rio Grande", "Columbia"],
+    "CA": ["Mackenzie", "Yukon", "Saint Lawrence", "Nelson", "Churchill"],
+    "BR": ["Amazon", "Paraná", "Madeira", "São Francisco", "Tocantins"],
+    "CN": ["Yangtze", "Yellow River", "Pearl River", "Mekong", "Amur"],
+    "RU": ["Volga", "Yenisei", "Lena", "Ob", "Amur"],
+    "IN": ["Ganges", "Yamuna", "Godavari", "Krishna", "Narmada"],
+    "EG": ["Nile"],
+    "PL": ["Vistula", "Oder", "Warta", "Bug", "San"],
+    "DE": ["Rhine", "Elbe", "Danube", "Main", "Weser"],
+    "FR": ["Loire", "Seine", "Rhône", "Garonne", "Meuse"],
+    "GB": ["Thames", "Severn", "Trent", "Great Ouse", "Wye"],
+    "IT": ["Po", "Adige", "Tiber", "Arno", "Piave"],
+    "ES": ["Tagus", "Ebro", "Douro", "Guadiana", "Guadalquivir"],
+    "AR": ["Paraná", "Uruguay", "Colorado", "Salado", "Negro"],
+    "AU": ["Murray", "Darling", "Murrumbidgee", "Lachlan", "Cooper"],
+}
+
+MAJOR_MOUNTAINS = {
+    "US": ["Mount McKinley", "Mount Whitney", "Mount Rainier", "Mount Elbert", "Mount Shasta"],
+    "CA": ["Mount Logan", "Mount Saint Elias", "Mount Lucania", "King Peak", "Mount Steele"],
+    "PL": ["Rysy", "Śnieżka", "Babia Góra", "Śnieżnik", "Tarnica"],
+    "FR": ["Mont Blanc", "Barre des Écrins", "Grandes Jorasses", "Aiguille Verte", "Grand Combin"],
+    "IT": ["Monte Bianco", "Monte Rosa", "Matterhorn", "Gran Paradiso", "Monte Cervino"],
+    "ES": ["Teide", "Mulhacén", "Aneto", "Veleta", "Posets"],
+    "CH": ["Monte Rosa", "Matterhorn", "Jungfrau", "Eiger", "Monch"],
+    "AT": ["Grossglockner", "Wildspitze", "Weißkugel", "Hochgall", "Großvenediger"],
+    "DE": ["Zugspitze", "Watzmann", "Hochwanner", "Feldberg", "Großer Arber"],
+    "JP": ["Mount Fuji", "Mount Kita", "Mount Hotaka", "Mount Yari", "Mount Aino"],
+    "CN": ["Mount Everest", "K2", "Kangchenjunga", "Lhotse", "Makalu"],
+    "NP": ["Mount Everest", "Kanchenjunga", "Lhotse", "Makalu", "Cho Oyu"],
+    "PK": ["K2", "Nanga Parbat", "Gasherbrum I", "Broad Peak", "Gasherbrum II"],
+    "IN": ["Kangchenjunga", "Nanda Devi", "Kamet", "Saltoro Kangri", "Saser Kangri"],
+    "AR": ["Aconcagua", "Cerro Bonete", "Monte Pissis", "Cerro Mercedario", "Huascarán"],
+    "CL": ["Ojos del Salado", "Monte Pissis", "Cerro Bonete", "Llullaillaco", "Tres Cruces"],
+    "PE": ["Huascarán", "Yerupajá", "Coropuna", "Ampato", "Chopicalqui"],
+    "TZ": ["Mount Kilimanjaro", "Mount Meru", "Mount Kenya"],
+    "KE": ["Mount Kenya", "Mount Elgon", "Aberdare Range"],
+    "RU": ["Mount Elbrus", "Dykh-Tau", "Koshtan-Tau", "Shkhara", "Jangi-Tau"],
+}
+
+
+class Country:
+    """One country or territory."""
+    __slots__ = ("name", "alpha2", "alpha3", "numeric", "common_name", "continent", "asset_name", "flag_asset",
+                 "details")
+
+    def __init__(self, name: str, alpha2: str, alpha3: Optional[str], numeric: Optional[str],
+                 common_name: Optional[str], continent: Optional[str], asset_name: Optional[str],
+                 flag_asset: Optional[str], details: Optional[Dict]):
+        self.name = name                # Country(name:) in FlagData.swift, key of ISO_MAPPING
+        self.alpha2 = alpha2
+        self.alpha3 = alpha3
+        self.numeric = numeric
+        self.common_name = common_name  # REST Countries name.common
+        self.continent = continent      # Continent case in Swift, e.g. "northAmerica"
+        self.asset_name = asset_name    # flag imageset name, e.g. "bouvet-island"
+        self.flag_asset = flag_asset    # imageset actually stored, after aliases, e.g. "norway"
+        self.details = details          # record from country_details.json
+
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return f"Country({self.alpha2}, {self.name!r})"
+
+
+class CountryDataset:
+    """All countries in ISO_MAPPING order, with lookup indexes."""
+
+    def __init__(self, countries: List[Country], details: Dict[str, Dict], aliases: Dict[str, Dict]):
+        self.countries = countries
+        self.details = details  # country_details.json, in file order
+        self.aliases = aliases  # flag_aliases.json
+        self.by_alpha2: Dict[str, Country] = {c.alpha2: c for c in countries}
+        self.by_alpha3: Dict[str, Country] = {c.alpha3: c for c in countries if c.alpha3}
+        self.by_asset: Dict[str, Country] = {c.asset_name: c for c in countries if c.asset_name}
+        self.by_name: Dict[str, Country] = {
+            **{c.common_name: c for c in countries if c.common_name},
+            **{c.name: c for c in countries},
+        }
+        self.by_continent: Dict[str, List[Country]] = {}
+        for country in countries:
+            if country.continent:
+                self.by_continent.setdefault(country.continent, []).append(country)
+
+    def __len__(self):
+        return len(self.countries)
+
+    def __iter__(self):
+        return iter(self.countries)
+
+    def __getstate__(self):
+        return self.countries, self.details, self.aliases
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def lookup(self, code_or_name: str) -> Optional[Country]:
+        """Find a country by alpha-2 or alpha-3 code, FlagData name or common name."""
+        key = code_or_name.strip()
+        upper = key.upper()
+        if len(key) == 2 and upper in self.by_alpha2:
+            return self.by_alpha2[upper]
+        if len(key) == 3 and upper in self.by_alpha3:
+            return self.by_alpha3[upper]
+        return self.by_name.get(key)
+
+    def alpha3_to_names(self, alpha3_codes: Iterable[str], unknown: Optional[Set[str]] = None) -> List[str]:
+        """
+        Convert alpha-3 codes (REST Countries "borders") to common names.
+        Codes missing from the dataset are skipped and added to `unknown` for bulk reporting.
+        """
+        names = []
+        for alpha3 in alpha3_codes:
+            country = self.by_alpha3.get(alpha3.upper())
+            if country:
+                names.append(country.common_name)
+            elif unknown is not None:
+                unknown.add(alpha3)
+        return names
+
+
+def load_json(path: str, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_flag_data(path: str = FLAG_DATA_FILE) -> Dict[str, tuple]:
+    """{Country name: (asset name, continent)} from the Country() entries of FlagData.swift."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    flags = {}
+    for name, image_name, continent, _ in COUNTRY_PATTERN.findall(content):
+        flags[name] = (image_name.split("/")[-1], continent)
+    return flags
+
+
+def build() -> CountryDataset:
+    """Parse every source and join them into a dataset."""
+    flags = parse_flag_data()
+    aliases = load_json(ALIASES_FILE, {})
+    details = load_json(DETAILS_FILE, {})
+
+    countries = []
+    for name, alpha2 in ISO_MAPPING.items():
+        alpha3, numeric, common_name = ISO_3166.get(alpha2, (None, None, None))
+        asset_name, continent = flags.get(name, (None, None))
+        flag_asset = aliases[asset_name]["asset"] if asset_name in aliases else asset_name
+        countries.append(Country(name, alpha2, alpha3, numeric, common_name, continent, asset_name, flag_asset,
+                                 details.get(alpha2)))
+    return CountryDataset(countries, details, aliases)
+
+
+def source_signature() -> list:
+    """Sizes and mtimes of the sources; the snapshot is reused while these match."""
+    signature = [SNAPSHOT_VERSION]
+    for path in SOURCES:
+        try:
+            stat = os.stat(path)
+            signature.append((os.path.basename(path), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append((os.path.basename(path), None, None))
+    return signature
+
+
+def load_snapshot(signature: list) -> Optional[CountryDataset]:
+    try:
+        with open(SNAPSHOT_FILE, "rb") as f:
+            stored_signature, dataset = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+        return None
+    return dataset if stored_signature == signature else None
+
+
+_dataset: Optional[CountryDataset] = None
+
+
+def load(rebuild: bool = False) -> CountryDataset:
+    """The dataset, from the snapshot when the sources are unchanged (cached per process)."""
+    global _dataset
+    if _dataset is not None and not rebuild:
+        return _dataset
+    signature = source_signature()
+    dataset = None if rebuild else load_snapshot(signature)
+    if dataset is None:
+        dataset = build()
+        write_if_changed(SNAPSHOT_FILE, pickle.dumps((signature, dataset), protocol=pickle.HIGHEST_PROTOCOL))
+    _dataset = dataset
+    return dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the snapshot even if the sources are unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dataset = load(rebuild=args.rebuild)
+    elapsed = time.perf_counter() - start
+
+    print(f"Loaded {len(dataset)} countries in {elapsed * 1000:.1f} ms")
+    for continent, countries in sorted(dataset.by_continent.items()):
+        print(f"  {continent}: {len(countries)}")
+    print(f"With details: {sum(1 for c in dataset if c.details)}, "
+          f"sharing another flag: {sum(1 for c in dataset if c.flag_asset != c.asset_name)}")
+    missing = [c.name for c in dataset if c.asset_name is None]
+    if missing:
+        print(f"Warning: not in {FLAG_DATA_FILE}: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+SQLite store for the country details, the canonical copy of the data.
+Countries are rows of one table and their cities, rivers, mountains and
+neighbours rows of one table each, keyed by (ISO code, position). Updaters
+change single countries or lists in small transactions instead of rewriting
+a whole file, and concurrent updaters no longer overwrite each other's work.
+
+country_details.json and the generated Swift are exports built from queries
+on the store. When the JSON was changed outside the store (a checkout, a
+manual edit) the store reimports it on open, so the JSON stays the file that
+is reviewed and committed.
+
+Usage:
+  python country_store.py            # sync with country_details.json and print a summary
+  python country_store.py --export   # rewrite country_details.json from the store
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import sqlite3
+from typing import Dict, Iterator, List, Optional
+
+from file_utils import write_json_atomic
+
+DB_FILE = "country_details.sqlite"
+JSON_FILE = "country_details.json"
+
+# JSON field -> table of (iso_code, position, name) rows
+LIST_TABLES = {
+    "mainCities": "cities",
+    "mainRivers": "rivers",
+    "mainMountains": "mountains",
+    "neighbours": "neighbours",
+}
+SCALAR_FIELDS = ("capital", "population", "area", "currency", "language")
+# Key order of an exported record, as written by fetch_country_details.py
+RECORD_FIELDS = ("isoCode", "capital", "mainCities", "mainRivers", "mainMountains", "neighbours",
+                 "population", "area", "currency", "language")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS countries (
+    iso_code TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,  -- export order
+    capital TEXT,
+    population INTEGER,
+    area REAL,
+    currency TEXT,
+    language TEXT
+);
+CREATE INDEX IF NOT EXISTS countries_position ON countries (position);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+""" + "".join(f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    iso_code TEXT NOT NULL REFERENCES countries (iso_code) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (iso_code, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS {table}_name ON {table} (name);
+""" for table in LIST_TABLES.values())
+
+
+def file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class CountryStore:
+    """Connection to the store; every public method that writes runs in its own transaction."""
+
+    def __init__(self, path: str = DB_FILE, json_file: str = JSON_FILE):
+        self.path = path
+        self.json_file = json_file
+        # Autocommit mode: transactions are opened explicitly by transaction()
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode = WAL")  # readers never block the writer
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(SCHEMA)
+        self.imported = self.sync_from_json()
+
+    def close(self) -> None:
+        self.db.close()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction; the write lock is taken up front so concurrent updaters queue instead of failing."""
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.db
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        self.db.execute("COMMIT")
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.db.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                        "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, value))
+
+    def _upsert(self, iso_code: str, details: Dict, position: Optional[int] = None) -> None:
+        if position is None:
+            row = self.db.execute("SELECT position FROM countries WHERE iso_code = ?", (iso_code,)).fetchone()
+            if row is None:
+                row = self.db.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM countries").fetchone()
+            position = row[0]
+        self.db.execute(
+            "INSERT INTO countries (iso_code, position, capital, population, area, currency, language) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (iso_code) DO UPDATE SET position = excluded.position, "
+            "capital = excluded.capital, population = excluded.population, area = excluded.area, "
+            "currency = excluded.currency, language = excluded.language",
+            (iso_code, position, *(details.get(field) for field in SCALAR_FIELDS)))
+        for field in LIST_TABLES:
+            self._set_list(field, iso_code, details.get(field) or [])
+
+    def _set_list(self, field: str, iso_code: str, names: List[str]) -> None:
+        table = LIST_TABLES[field]
+        self.db.execute(f"DELETE FROM {table} WHERE iso_code = ?", (iso_code,))
+        self.db.executemany(f"INSERT INTO {table} (iso_code, position, name) VALUES (?, ?, ?)",
+                            [(iso_code, position, name) for position, name in enumerate(names)])
+
+    def upsert_country(self, iso_code: str, details: Dict) -> None:
+        """Insert or replace one country's record (new countries are exported last)."""
+        with self.transaction():
+            self._upsert(iso_code, details)
+
+    def _replace_all(self, records: Dict[str, Dict]) -> None:
+        placeholders = ",".join("?" * len(records))
+        self.db.execute(f"DELETE FROM countries WHERE iso_code NOT IN ({placeholders})", list(records))
+        for position, (iso_code, details) in enumerate(records.items()):
+            self._upsert(iso_code, details, position)
+
+    def replace_all(self, records: Dict[str, Dict]) -> None:
+        """Make the store hold exactly these records, in this order."""
+        with self.transaction():
+            self._replace_all(records)
+
+    def set_list(self, field: str, iso_code: str, names: List[str]) -> None:
+        """Replace one list (e.g. "neighbours") of one country."""
+        self.set_lists(field, {iso_code: names})
+
+    def set_lists(self, field: str, names_by_country: Dict[str, List[str]]) -> None:
+        """Replace one list of several countries in a single transaction."""
+        with self.transaction():
+            for iso_code, names in names_by_country.items():
+                if self.db.execute("SELECT 1 FROM countries WHERE iso_code = ?", (iso_code,)).fetchone() is None:
+                    raise KeyError(f"{iso_code} is not in {self.path}")
+                self._set_list(field, iso_code, names)
+
+    def set_neighbours(self, iso_code: str, names: List[str]) -> None:
+        self.set_list("neighbours", iso_code, names)
+
+    def export(self) -> Dict[str, Dict]:
+        """All records in export order, shaped like country_details.json."""
+        records = {}
+        for iso_code, *values in self.db.execute(
+                f"SELECT iso_code, {', '.join(SCALAR_FIELDS)} FROM countries ORDER BY position"):
+            record = dict.fromkeys(RECORD_FIELDS)
+            record.update(zip(SCALAR_FIELDS, values), isoCode=iso_code)
+            for field in LIST_TABLES:
+                record[field] = []
+            records[iso_code] = record
+        for field, table in LIST_TABLES.items():
+            for iso_code, name in self.db.execute(f"SELECT iso_code, name FROM {table} ORDER BY iso_code, position"):
+                records[iso_code][field].append(name)
+        return records
+
+    def export_json(self) -> None:
+        """Rewrite country_details.json from the store (skipped if unchanged)."""
+        # The write lock spans the file and its recorded hash, so no connection sees the new JSON
+        # with the old hash and reimports it over concurrent updates
+        with self.transaction():
+            write_json_atomic(self.json_file, self.export())
+            self._set_meta("json_sha256", file_sha256(self.json_file))
+
+    def sync_from_json(self) -> bool:
+        """Reimport country_details.json if it differs from the last export; True if it did."""
+        digest = file_sha256(self.json_file)
+        if digest is None or digest == self._get_meta("json_sha256"):
+            return False
+        with self.transaction():
+            # Check again under the write lock: an export may have finished while we waited for it
+            with open(self.json_file, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if digest == self._get_meta("json_sha256"):
+                return False
+            self._replace_all(json.loads(content))
+            self._set_meta("json_sha256", digest)
+        return True
+
+    def summary(self) -> str:
+        counts = [f"{self.db.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]} {table}"
+                  for table in ("countries", *LIST_TABLES.values())]
+        return f"Country store {self.path}: {', '.join(counts)}"
+
+
+def connect(path: str = DB_FILE, json_file: str = JSON_FILE) -> CountryStore:
+    return CountryStore(path, json_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--export", action="store_true", help=f"rewrite {JSON_FILE} from the store")
+    args = parser.parse_args()
+
+    store = connect()
+    if store.imported:
+        print(f"Imported {JSON_FILE} into {DB_FILE}")
+    if args.export:
+        store.export_json()
+        print(f"Exported {JSON_FILE}")
+    print(store.summary())
+
+
+if __name__ == "__main__":
+    main()
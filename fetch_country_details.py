@@ -4,33 +4,99 @@ Fetch country details from public APIs and generate country_details.json
 Uses REST Countries API and Wikidata for comprehensive data.
 """
 
-import json
-import urllib.request
-import urllib.error
-import time
-from typing import Dict, List, Optional
-from generate_iso_codes import ISO_MAPPING
+import argparse
+import urllib.parse
+from typing import Dict, Iterable, List, Optional
+import checkpoint
+import fetch_engine
+import http_cache
+import http_client
+import rest_countries_dump
+import telemetry
+import wikidata
+from http_cache import fetch_json
+import country_dataset
+import country_store
+from country_dataset import MAJOR_CITIES, MAJOR_MOUNTAINS, MAJOR_RIVERS
+from generate_iso_codes import report_unknown_codes
 
 REST_COUNTRIES_BASE = "https://restcountries.com/v3.1"
-WIKIDATA_BASE = "https://www.wikidata.org/w/api.php"
 
-# Rate limiting: be nice to APIs
-REQUEST_DELAY = 0.05  # seconds between requests (reduced for faster execution)
+# Bulk mode: fields needed to key records, on top of those the extractors read
+BULK_KEY_FIELDS = ("cca2",)
+BULK_CHUNK_SIZE = 50  # codes per /alpha?codes= request when /all is unavailable
+
+# Neighbour codes missing from the ISO index, collected for a single report
+UNKNOWN_ALPHA3 = set()
+
+# Wikidata features for every country, fetched in a few batched queries with --wikidata
+WIKIDATA_FEATURES: Dict[str, Dict[str, List[str]]] = {}
 
 def fetch_rest_country_data(iso_code: str) -> Optional[Dict]:
-    """Fetch basic country data from REST Countries API."""
+    """Fetch basic country data from REST Countries API (or the offline dump)."""
     try:
-        url = f"{REST_COUNTRIES_BASE}/alpha/{iso_code.lower()}"
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            if isinstance(data, list) and len(data) > 0:
-                return data[0]
-            return data
+        fields = projected_fields(DETAIL_EXTRACTORS)
+        if rest_countries_dump.default_index is not None:
+            return rest_countries_dump.default_index.lookup(iso_code, fields.split(","))
+        data = fetch_json(f"{REST_COUNTRIES_BASE}/alpha/{iso_code.lower()}?fields={fields}", timeout=10)
+        if isinstance(data, list) and len(data) > 0:
+            return data[0]
+        return data
     except Exception as e:
         print(f"Error fetching REST Countries data for {iso_code}: {e}")
         return None
 
+def index_by_alpha2(records: Iterable[Dict]) -> Dict[str, Dict]:
+    """Key REST Countries records by their alpha-2 code."""
+    return {record["cca2"].upper(): record for record in records if record.get("cca2")}
+
+def fetch_all_rest_country_data() -> Dict[str, Dict]:
+    """Fetch every country in a single /all request, keyed by alpha-2 code."""
+    fields = projected_fields(DETAIL_EXTRACTORS, extra=BULK_KEY_FIELDS)
+    data = fetch_json(f"{REST_COUNTRIES_BASE}/all?fields={fields}", timeout=30)
+    return index_by_alpha2(data)
+
+def fetch_rest_country_data_chunked(iso_codes: List[str]) -> Dict[str, Dict]:
+    """Fetch countries through chunked /alpha?codes= requests, keyed by alpha-2 code."""
+    fields = projected_fields(DETAIL_EXTRACTORS, extra=BULK_KEY_FIELDS)
+
+    def fetch_chunk(chunk: List[str]) -> Dict[str, Dict]:
+        codes = ",".join(code.lower() for code in chunk)
+        query = urllib.parse.urlencode({"codes": codes, "fields": fields}, safe=",")
+        try:
+            return index_by_alpha2(fetch_json(f"{REST_COUNTRIES_BASE}/alpha?{query}", timeout=30))
+        except Exception as e:
+            print(f"Error fetching REST Countries chunk {chunk[0]}..{chunk[-1]}: {e}")
+            return {}
+
+    chunks = [iso_codes[start:start + BULK_CHUNK_SIZE] for start in range(0, len(iso_codes), BULK_CHUNK_SIZE)]
+    records = {}
+    for chunk_records in fetch_engine.imap_ordered(fetch_chunk, chunks):
+        records.update(chunk_records)
+    return records
+
+def fetch_bulk_rest_country_data(iso_codes: List[str]) -> Dict[str, Dict]:
+    """Fetch all countries with /all, falling back to chunked /alpha?codes= requests."""
+    if rest_countries_dump.default_index is not None:
+        fields = projected_fields(DETAIL_EXTRACTORS, extra=BULK_KEY_FIELDS)
+        return index_by_alpha2(rest_countries_dump.default_index.all(fields.split(",")))
+    try:
+        records = fetch_all_rest_country_data()
+    except Exception as e:
+        print(f"Error fetching /all, falling back to chunked requests: {e}")
+        records = {}
+    missing = [code for code in iso_codes if code not in records]
+    if missing:
+        records.update(fetch_rest_country_data_chunked(missing))
+
+    # Final pass for chunks that still failed after retries
+    missing = [code for code in iso_codes if code not in records]
+    if missing:
+        print(f"Retrying {len(missing)} countries missing from bulk data...")
+        fetch_engine.wait_for_circuits()
+        records.update(fetch_rest_country_data_chunked(missing))
+    return records
+
 def get_capital(rest_data: Optional[Dict]) -> Optional[str]:
     """Extract capital city from REST Countries data."""
     if rest_data and "capital" in rest_data and rest_data["capital"]:
@@ -71,148 +137,78 @@ def get_language(rest_data: Optional[Dict]) -> Optional[str]:
         return list(rest_data["languages"].values())[0]
     return None
 
+# REST Countries fields read by each extractor, used for ?fields= projection
+EXTRACTOR_FIELDS = {
+    get_capital: ("capital",),
+    get_neighbours: ("borders",),
+    get_population: ("population",),
+    get_area: ("area",),
+    get_currency: ("currencies",),
+    get_language: ("languages",),
+}
+
+# Extractors that build_country_details() runs on each REST Countries record
+DETAIL_EXTRACTORS = (get_capital, get_neighbours, get_population, get_area, get_currency, get_language)
+
+def projected_fields(extractors, extra=()) -> str:
+    """Return the ?fields= value covering everything the given extractors read."""
+    fields = {field for extractor in extractors for field in EXTRACTOR_FIELDS[extractor]}
+    fields.update(extra)
+    return ",".join(sorted(fields))
+
 def fetch_wikidata_geographic_features(iso_code: str, country_name: str) -> Dict[str, List[str]]:
     """
-    Fetch cities, rivers, and mountains from Wikidata.
-    This is a simplified version - in production you'd want more sophisticated queries.
+    Cities, rivers, and mountains from Wikidata, ranked by population, length and elevation.
+    Every country is fetched up front in a few batched SPARQL queries (see wikidata.py);
+    this returns empty lists unless the run was started with --wikidata.
     """
-    # For now, return empty lists - Wikidata queries are complex and would require
-    # SPARQL queries or entity lookups. We'll use a fallback approach.
-    return {
-        "cities": [],
-        "rivers": [],
-        "mountains": []
-    }
+    return WIKIDATA_FEATURES.get(iso_code, {"cities": [], "rivers": [], "mountains": []})
 
 def get_main_cities_fallback(iso_code: str, country_name: str) -> List[str]:
     """
     Fallback: Use a curated list of major cities per country.
     This is a simplified approach - in production, you'd query a comprehensive database.
     """
-    # Major cities mapping (simplified - you'd want a comprehensive database)
-    major_cities_db = {
-        "US": ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"],
-        "CA": ["Toronto", "Montreal", "Vancouver", "Calgary", "Edmonton"],
-        "GB": ["London", "Manchester", "Birmingham", "Glasgow", "Liverpool"],
-        "FR": ["Paris", "Marseille", "Lyon", "Toulouse", "Nice"],
-        "DE": ["Berlin", "Munich", "Hamburg", "Frankfurt", "Cologne"],
-        "IT": ["Rome", "Milan", "Naples", "Turin", "Palermo"],
-        "ES": ["Madrid", "Barcelona", "Valencia", "Seville", "Bilbao"],
-        "PL": ["Warsaw", "Krakow", "Wroclaw", "Gdansk", "Poznan"],
-        "BR": ["São Paulo", "Rio de Janeiro", "Brasília", "Salvador", "Fortaleza"],
-        "CN": ["Beijing", "Shanghai", "Guangzhou", "Shenzhen", "Chengdu"],
-        "JP": ["Tokyo", "Osaka", "Yokohama", "Nagoya", "Sapporo"],
-        "IN": ["Mumbai", "Delhi", "Bangalore", "Hyderabad", "Chennai"],
-        "AU": ["Sydney", "Melbourne", "Brisbane", "Perth", "Adelaide"],
-        "MX": ["Mexico City", "Guadalajara", "Monterrey", "Puebla", "Tijuana"],
-        "RU": ["Moscow", "Saint Petersburg", "Novosibirsk", "Yekaterinburg", "Kazan"],
-        "ZA": ["Cape Town", "Johannesburg", "Durban", "Pretoria", "Port Elizabeth"],
-        "EG": ["Cairo", "Alexandria", "Giza", "Shubra El Kheima", "Port Said"],
-        "NG": ["Lagos", "Kano", "Ibadan", "Abuja", "Port Harcourt"],
-        "KE": ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret"],
-        "AR": ["Buenos Aires", "Córdoba", "Rosario", "Mendoza", "La Plata"],
-        "CL": ["Santiago", "Valparaíso", "Concepción", "La Serena", "Antofagasta"],
-        "CO": ["Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena"],
-        "PE": ["Lima", "Arequipa", "Trujillo", "Chiclayo", "Piura"],
-    }
-
-    return major_cities_db.get(iso_code, [])
+    return list(MAJOR_CITIES.get(iso_code, []))
 
 def get_main_rivers_fallback(iso_code: str, country_name: str) -> List[str]:
     """Fallback: Use a curated list of major rivers per country."""
-    major_rivers_db = {
-        "US": ["Mississippi", "Missouri", "Colorado", "Rio Grande", "Columbia"],
-        "CA": ["Mackenzie", "Yukon", "Saint Lawrence", "Nelson", "Churchill"],
-        "BR": ["Amazon", "Paraná", "Madeira", "São Francisco", "Tocantins"],
-        "CN": ["Yangtze", "Yellow River", "Pearl River", "Mekong", "Amur"],
-        "RU": ["Volga", "Yenisei", "Lena", "Ob", "Amur"],
-        "IN": ["Ganges", "Yamuna", "Godavari", "Krishna", "Narmada"],
-        "EG": ["Nile"],
-        "PL": ["Vistula", "Oder", "Warta", "Bug", "San"],
-        "DE": ["Rhine", "Elbe", "Danube", "Main", "Weser"],
-        "FR": ["Loire", "Seine", "Rhône", "Garonne", "Meuse"],
-        "GB": ["Thames", "Severn", "Trent", "Great Ouse", "Wye"],
-        "IT": ["Po", "Adige", "Tiber", "Arno", "Piave"],
-        "ES": ["Tagus", "Ebro", "Douro", "Guadiana", "Guadalquivir"],
-        "AR": ["Paraná", "Uruguay", "Colorado", "Salado", "Negro"],
-        "AU": ["Murray", "Darling", "Murrumbidgee", "Lachlan", "Cooper"],
-    }
-
-    return major_rivers_db.get(iso_code, [])
+    return list(MAJOR_RIVERS.get(iso_code, []))
 
 def get_main_mountains_fallback(iso_code: str, country_name: str) -> List[str]:
     """Fallback: Use a curated list of major mountains per country."""
-    major_mountains_db = {
-        "US": ["Mount McKinley", "Mount Whitney", "Mount Rainier", "Mount Elbert", "Mount Shasta"],
-        "CA": ["Mount Logan", "Mount Saint Elias", "Mount Lucania", "King Peak", "Mount Steele"],
-        "PL": ["Rysy", "Śnieżka", "Babia Góra", "Śnieżnik", "Tarnica"],
-        "FR": ["Mont Blanc", "Barre des Écrins", "Grandes Jorasses", "Aiguille Verte", "Grand Combin"],
-        "IT": ["Monte Bianco", "Monte Rosa", "Matterhorn", "Gran Paradiso", "Monte Cervino"],
-        "ES": ["Teide", "Mulhacén", "Aneto", "Veleta", "Posets"],
-        "CH": ["Monte Rosa", "Matterhorn", "Jungfrau", "Eiger", "Monch"],
-        "AT": ["Grossglockner", "Wildspitze", "Weißkugel", "Hochgall", "Großvenediger"],
-        "DE": ["Zugspitze", "Watzmann", "Hochwanner", "Feldberg", "Großer Arber"],
-        "JP": ["Mount Fuji", "Mount Kita", "Mount Hotaka", "Mount Yari", "Mount Aino"],
-        "CN": ["Mount Everest", "K2", "Kangchenjunga", "Lhotse", "Makalu"],
-        "NP": ["Mount Everest", "Kanchenjunga", "Lhotse", "Makalu", "Cho Oyu"],
-        "PK": ["K2", "Nanga Parbat", "Gasherbrum I", "Broad Peak", "Gasherbrum II"],
-        "IN": ["Kangchenjunga", "Nanda Devi", "Kamet", "Saltoro Kangri", "Saser Kangri"],
-        "AR": ["Aconcagua", "Cerro Bonete", "Monte Pissis", "Cerro Mercedario", "Huascarán"],
-        "CL": ["Ojos del Salado", "Monte Pissis", "Cerro Bonete", "Llullaillaco", "Tres Cruces"],
-        "PE": ["Huascarán", "Yerupajá", "Coropuna", "Ampato", "Chopicalqui"],
-        "TZ": ["Mount Kilimanjaro", "Mount Meru", "Mount Kenya"],
-        "KE": ["Mount Kenya", "Mount Elgon", "Aberdare Range"],
-        "RU": ["Mount Elbrus", "Dykh-Tau", "Koshtan-Tau", "Shkhara", "Jangi-Tau"],
-    }
-
-    return major_mountains_db.get(iso_code, [])
+    return list(MAJOR_MOUNTAINS.get(iso_code, []))
 
 def convert_neighbour_iso_to_names(neighbour_isos: List[str]) -> List[str]:
-    """Convert neighbour ISO codes (alpha-3) to country names."""
-    # REST Countries returns alpha-3 codes, we need to convert to names
-    # We'll fetch each neighbour to get its name
-    names = []
-    for iso3 in neighbour_isos:
-        try:
-            # Try to get country name from REST Countries
-            url = f"{REST_COUNTRIES_BASE}/alpha/{iso3.lower()}"
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
-                if isinstance(data, list) and len(data) > 0:
-                    country_data = data[0]
-                else:
-                    country_data = data
-                if "name" in country_data and "common" in country_data["name"]:
-                    names.append(country_data["name"]["common"])
-            time.sleep(0.05)  # Small delay
-        except Exception as e:
-            # Fallback: try to map alpha-3 to alpha-2 and then to name
-            # This is a simplified approach - in production you'd want a full mapping
-            pass
-    return names
+    """Convert neighbour ISO codes (alpha-3) to country names using the offline ISO index."""
+    # REST Countries returns alpha-3 codes; unresolved ones are reported once at the end
+    return country_dataset.load().alpha3_to_names(neighbour_isos, UNKNOWN_ALPHA3)
 
-def fetch_country_details(iso_code: str, country_name: str) -> Dict:
-    """Fetch all details for a country."""
-    print(f"Fetching data for {country_name} ({iso_code})...")
+def fetch_country_details(iso_code: str, country_name: str) -> Optional[Dict]:
+    """Fetch all details for a country; None if the REST Countries request failed."""
+    # Fetch from REST Countries; the span times the country and tags its requests
+    with telemetry.span("country", country=iso_code):
+        rest_data = fetch_rest_country_data(iso_code)
+    if rest_data is None:
+        return None
 
-    # Fetch from REST Countries
-    rest_data = fetch_rest_country_data(iso_code)
-    time.sleep(REQUEST_DELAY)
+    neighbours = convert_neighbour_iso_to_names(get_neighbours(rest_data))
+    return build_country_details(iso_code, country_name, rest_data, neighbours)
 
+def build_country_details(iso_code: str, country_name: str, rest_data: Optional[Dict], neighbours: List[str]) -> Dict:
+    """Build the details record for a country from its REST Countries data."""
     # Extract basic info
     capital = get_capital(rest_data)
-    neighbours_iso = get_neighbours(rest_data)
-    neighbours = convert_neighbour_iso_to_names(neighbours_iso)
     population = get_population(rest_data)
     area = get_area(rest_data)
     currency = get_currency(rest_data)
     language = get_language(rest_data)
 
-    # Get geographic features (fallback for now)
-    cities = get_main_cities_fallback(iso_code, country_name)
-    rivers = get_main_rivers_fallback(iso_code, country_name)
-    mountains = get_main_mountains_fallback(iso_code, country_name)
+    # Get geographic features, falling back to the curated lists where Wikidata has none
+    features = fetch_wikidata_geographic_features(iso_code, country_name)
+    cities = features["cities"] or get_main_cities_fallback(iso_code, country_name)
+    rivers = features["rivers"] or get_main_rivers_fallback(iso_code, country_name)
+    mountains = features["mountains"] or get_main_mountains_fallback(iso_code, country_name)
 
     return {
         "isoCode": iso_code,
@@ -227,31 +223,110 @@ def fetch_country_details(iso_code: str, country_name: str) -> Dict:
         "language": language
     }
 
-def main():
-    """Generate country_details.json for all countries."""
+def fetch_all_country_details_bulk() -> Dict[str, Dict]:
+    """Fetch details for all countries with a handful of bulk requests."""
+    dataset = country_dataset.load()
+    records = fetch_bulk_rest_country_data(list(dataset.by_alpha2))
+    print(f"Fetched {len(records)} countries in bulk")
+
     all_details = {}
-    total = len(ISO_MAPPING)
-    processed = 0
+    for country in dataset:
+        country_name, iso_code = country.name, country.alpha2
+        rest_data = records.get(iso_code)
+        if rest_data is None:
+            print(f"Warning: no REST Countries data for {country_name} ({iso_code})")
+        neighbours = convert_neighbour_iso_to_names(get_neighbours(rest_data))
+        all_details[iso_code] = build_country_details(iso_code, country_name, rest_data, neighbours)
+    return all_details
+
+def fetch_all_country_details(journal: checkpoint.CheckpointJournal) -> Dict[str, Dict]:
+    """Fetch details for all countries, one country per concurrent task, journaling each one."""
+    journaled = journal.load()
+    if journaled:
+        print(f"Resuming: {len(journaled)} countries already in {journal.path}")
+    dataset = country_dataset.load()
+    total = len(dataset)
+    processed = len(journaled)
 
-    # Process all countries
-    for country_name, iso_code in ISO_MAPPING.items():
-        details = fetch_country_details(iso_code, country_name)
-        all_details[iso_code] = details
+    # Process remaining countries; results arrive in dataset (ISO_MAPPING) order
+    countries = [(c.name, c.alpha2) for c in dataset if c.alpha2 not in journaled]
+    retry_queue = []
+    results = fetch_engine.imap_ordered(lambda item: fetch_country_details(item[1], item[0]), countries)
+    for (country_name, iso_code), details in zip(countries, results):
+        if details is None:
+            retry_queue.append((country_name, iso_code))
+            continue
+        journal.record(iso_code, details)
+        journaled[iso_code] = details
         processed += 1
         if processed % 10 == 0:
             print(f"Progress: {processed}/{total} ({processed*100//total}%)")
-        time.sleep(REQUEST_DELAY)  # Rate limiting
 
-    # Write JSON file
-    output_file = "country_details.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(all_details, f, indent=2, ensure_ascii=False)
+    # Final pass over countries that failed even after per-request retries
+    if retry_queue:
+        print(f"Retrying {len(retry_queue)} failed countries...")
+        fetch_engine.wait_for_circuits()
+        with telemetry.span("retry_pass", countries=len(retry_queue)):
+            results = fetch_engine.imap_ordered(lambda item: fetch_country_details(item[1], item[0]), retry_queue)
+            for (country_name, iso_code), details in zip(retry_queue, results):
+                if details is None:
+                    print(f"Warning: giving up on {country_name} ({iso_code}); its details will be empty")
+                    details = build_country_details(iso_code, country_name, None, [])
+                else:
+                    journal.record(iso_code, details)
+                journaled[iso_code] = details
+    return {iso_code: journaled[iso_code] for iso_code in dataset.by_alpha2}
+
+def main():
+    """Generate country_details.json for all countries."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bulk", action="store_true",
+                        help="fetch all countries with /all (or chunked /alpha?codes=) instead of one request per country")
+    fetch_engine.add_arguments(parser)
+    http_cache.add_arguments(parser)
+    checkpoint.add_arguments(parser)
+    rest_countries_dump.add_arguments(parser)
+    telemetry.add_arguments(parser)
+    wikidata.add_arguments(parser)
+    args = parser.parse_args()
+    fetch_engine.configure_from_args(args)
+    http_cache.configure_from_args(args)
+    telemetry.configure_from_args(args)
+    wikidata.configure_from_args(args)
+    with telemetry.span("load_dump"):
+        rest_countries_dump.configure_from_args(args)
+
+    if wikidata.enabled:
+        with telemetry.span("wikidata"):
+            WIKIDATA_FEATURES.update(wikidata.fetch_features([c.alpha2 for c in country_dataset.load()]))
+
+    output_file = country_store.JSON_FILE
+    journal = checkpoint.CheckpointJournal(output_file, resume=args.resume)
+    with telemetry.span("fetch", mode="bulk" if args.bulk else "per_country"):
+        if args.bulk:
+            all_details = fetch_all_country_details_bulk()
+        else:
+            all_details = fetch_all_country_details(journal)
+
+    # Replace the stored records in one transaction, then export the JSON
+    with telemetry.span("write"):
+        store = country_store.connect()
+        store.replace_all(all_details)
+        store.export_json()
+        journal.discard()
 
     print(f"\nGenerated {output_file} with {len(all_details)} countries")
     print(f"Countries with capital: {sum(1 for d in all_details.values() if d.get('capital'))}")
     print(f"Countries with cities: {sum(1 for d in all_details.values() if d.get('mainCities'))}")
     print(f"Countries with rivers: {sum(1 for d in all_details.values() if d.get('mainRivers'))}")
     print(f"Countries with mountains: {sum(1 for d in all_details.values() if d.get('mainMountains'))}")
+    report_unknown_codes(UNKNOWN_ALPHA3)
+    if rest_countries_dump.default_index is not None:
+        print(rest_countries_dump.default_index.summary())
+    print(http_cache.default_cache.summary())
+    print(http_client.default_client.summary())
+    print(fetch_engine.summary())
+    print(telemetry.report())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Concurrent fetch engine shared by the REST Countries scripts.
+Runs work on a bounded thread pool and paces every HTTP request through
+a global token-bucket limiter instead of sleeping after each call.
+Throttled and failed requests are retried with exponential backoff and
+jitter (honouring Retry-After), a per-host circuit breaker stops hammering
+a failing server, and the concurrency limit adapts AIMD-style: it halves on
+throttling and creeps back up while requests succeed.
+"""
+
+import email.utils
+import http.client
+import json
+import random
+import threading
+import time
+import urllib.parse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+import http_client
+import telemetry
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Defaults: be nice to APIs, but keep the allowed rate saturated
+MAX_IN_FLIGHT = 8           # concurrent HTTP requests (upper bound for the adaptive limit)
+REQUESTS_PER_SECOND = 20.0  # global request rate ceiling
+BURST = 5                   # requests allowed back-to-back after an idle period
+
+# Retry policy
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 0.5          # seconds, doubled on every attempt
+BACKOFF_MAX = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+# Circuit breaker
+BREAKER_THRESHOLD = 5       # distinct requests failing in a row before a host's circuit opens
+BREAKER_COOLDOWN = 30.0     # seconds before a half-open trial request is let through
+
+
+class TokenBucket:
+    """Thread-safe token bucket enforcing a global requests-per-second rate."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, float(BURST))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveConcurrency:
+    """
+    Semaphore whose limit follows AIMD: +1 per limit's worth of successes,
+    halved on throttling (at most once per cooldown, so one burst of 429s counts once).
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, decrease_cooldown: float = 1.0):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max_limit)
+        self.lowest_limit = self.limit
+        self.decrease_cooldown = decrease_cooldown
+        self._active = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        with self._condition:
+            while self._active >= int(self.limit):
+                self._condition.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        with self._condition:
+            if self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self._condition.notify_all()
+
+    def on_throttle(self) -> None:
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.decrease_cooldown:
+                self.limit = max(self.min_limit, self.limit / 2)
+                self.lowest_limit = min(self.lowest_limit, self.limit)
+                self._last_decrease = now
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: opens once `threshold` distinct requests have failed in a row, half-opens after
+    a cooldown. Retries of one request count once, so a single bad URL does not cut off the whole host.
+    """
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failing: Set[str] = set()  # requests that failed since the last success
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self, host: str) -> bool:
+        """Raise CircuitOpenError while the circuit is open; True if this request is the half-open trial."""
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            if time.monotonic() - self.opened_at < self.cooldown or self._trial_in_flight:
+                raise CircuitOpenError(f"circuit open for {host}")
+            self._trial_in_flight = True  # half-open: let one trial request through
+            return True
+
+    def end_trial(self) -> None:
+        """Let the next trial through once this one is over, however it ended."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failing.clear()
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self, request: str) -> None:
+        with self._lock:
+            self.failing.add(request)
+            self._trial_in_flight = False
+            if self.opened_at is not None or len(self.failing) >= self.threshold:
+                if self.opened_at is None:
+                    self.trips += 1
+                self.opened_at = time.monotonic()
+
+    def remaining_cooldown(self) -> float:
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+_limiter = TokenBucket(REQUESTS_PER_SECOND)
+_in_flight = AdaptiveConcurrency(MAX_IN_FLIGHT)
+_max_in_flight = MAX_IN_FLIGHT
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_stats = {"retries": 0, "throttled": 0, "failed": 0}
+_stats_lock = threading.Lock()
+
+
+def configure(max_in_flight: Optional[int] = None, requests_per_second: Optional[float] = None) -> None:
+    """Change the global concurrency and rate limits (call before fetching)."""
+    global _limiter, _in_flight, _max_in_flight
+    if max_in_flight is not None:
+        _max_in_flight = max(1, max_in_flight)
+        _in_flight = AdaptiveConcurrency(_max_in_flight)
+        http_client.default_client.pool_size = _max_in_flight
+    if requests_per_second is not None:
+        _limiter = TokenBucket(requests_per_second)
+
+
+def add_arguments(parser) -> None:
+    """Add --max-in-flight/--rps options to an argparse parser."""
+    parser.add_argument("--max-in-flight", type=int, default=MAX_IN_FLIGHT,
+                        help=f"maximum concurrent HTTP requests (default: {MAX_IN_FLIGHT})")
+    parser.add_argument("--rps", type=float, default=REQUESTS_PER_SECOND,
+                        help=f"global requests per second ceiling, 0 for unlimited (default: {REQUESTS_PER_SECOND:g})")
+
+
+def configure_from_args(args) -> None:
+    """Apply options added by add_arguments()."""
+    configure(max_in_flight=args.max_in_flight, requests_per_second=args.rps)
+
+
+def _count(stat: str) -> None:
+    with _stats_lock:
+        _stats[stat] += 1
+
+
+def _breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
+
+
+def retry_after_seconds(headers: Dict[str, str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given (1-based) attempt."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)))
+
+
+def fetch(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 10,
+          parse: Optional[Callable[[Any], Any]] = None, retry_errors: bool = True) -> Tuple[int, Dict[str, str], Any]:
+    """
+    Fetch a URL, respecting the global limits and retrying transient failures.
+    Returns (status, lower-cased response headers, body); 304 Not Modified is returned rather than raised.
+    With parse (e.g. json.load) the body is decoded from the response stream.
+    With retry_errors=False, server errors and timeouts are raised at once and not counted against
+    the host's circuit (for requests that fail on their own, like an expensive query); throttling is
+    still retried.
+    """
+    host = urllib.parse.urlsplit(url).netloc
+    breaker = _breaker(host)
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        trial = breaker.before_request(host)
+        _limiter.acquire()
+        limit = _in_flight
+        started = time.perf_counter()
+        try:
+            with limit:
+                result = http_client.default_client.request(url, headers=headers, timeout=timeout, parse=parse)
+        except http_client.HTTPStatusError as e:
+            telemetry.record_request(url, e.status, time.perf_counter() - started,
+                                     http_client.default_client.last_request_bytes(), attempt, error=str(e))
+            if e.status not in RETRY_STATUSES:
+                breaker.record_success()  # the host answered; the request itself is wrong
+                raise
+            if not retry_errors and e.status not in THROTTLE_STATUSES:
+                raise
+            breaker.record_failure(url)
+            if e.status in THROTTLE_STATUSES:
+                _count("throttled")
+                limit.on_throttle()
+            delay = retry_after_seconds(e.headers)
+            error: Exception = e
+        except (OSError, http.client.HTTPException, json.JSONDecodeError, EOFError, zlib.error) as e:
+            # A body that does not decode was cut off in transit; retry it like a dropped connection
+            telemetry.record_request(url, None, time.perf_counter() - started, 0, attempt, error=repr(e))
+            if not retry_errors:
+                raise
+            breaker.record_failure(url)
+            delay = None
+            error = e
+        else:
+            telemetry.record_request(url, result[0], time.perf_counter() - started,
+                                     http_client.default_client.last_request_bytes(), attempt)
+            breaker.record_success()
+            limit.on_success()
+            return result
+        finally:
+            if trial:
+                breaker.end_trial()  # also after errors that are neither a success nor a failure
+
+        if attempt == MAX_ATTEMPTS:
+            _count("failed")
+            raise error
+        _count("retries")
+        time.sleep(delay if delay is not None else backoff_delay(attempt))
+    raise AssertionError("unreachable")
+
+
+def fetch_json(url: str, timeout: int = 10, retry_errors: bool = True):
+    """Fetch and decode a JSON document from the response stream, respecting the global limits."""
+    _, _, data = fetch(url, timeout=timeout, parse=json.load, retry_errors=retry_errors)
+    return data
+
+
+def wait_for_circuits() -> None:
+    """Sleep until every open circuit is ready for a trial request (before a retry pass)."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    delay = max((breaker.remaining_cooldown() for breaker in breakers), default=0.0)
+    if delay > 0:
+        print(f"Waiting {delay:.0f}s for open circuits to cool down...")
+        time.sleep(delay)
+
+
+def summary() -> str:
+    """One-line description of retries, throttling and the adaptive limit."""
+    with _breakers_lock:
+        trips = sum(breaker.trips for breaker in _breakers.values())
+    return (f"Fetch engine: {_stats['retries']} retries, {_stats['throttled']} throttled, "
+            f"{_stats['failed']} failed after {MAX_ATTEMPTS} attempts, {trips} circuit trips, "
+            f"concurrency limit {_in_flight.limit:.1f}/{_max_in_flight} (lowest {_in_flight.lowest_limit:.1f})")
+
+
+def imap_ordered(func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> Iterator[R]:
+    """Run func over items concurrently, yielding results in input order."""
+    with ThreadPoolExecutor(max_workers=max_workers or _max_in_flight) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        for future in futures:
+            yield future.result()
+
+
+def map_ordered(func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> List[R]:
+    """Run func over items concurrently and return results in input order."""
+    return list(imap_ordered(func, items, max_workers))
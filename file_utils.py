@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+File writing helpers shared by the pipeline stages and the country store.
+Outputs are written atomically and only when their bytes change, so rerunning
+a stage leaves mtimes alone and does not trigger Xcode rebuilds.
+"""
+
+import json
+import os
+import tempfile
+from typing import Union
+
+
+def write_if_changed(path: str, content: Union[str, bytes]) -> bool:
+    """
+    Atomically write content to path unless the file already holds exactly these bytes.
+    Returns True if the file was written.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def write_json_atomic(path: str, data) -> None:
+    """Write JSON through a temp file in the same directory and rename it into place (skipped if unchanged)."""
+    write_if_changed(path, json.dumps(data, indent=2, ensure_ascii=False))
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Rank the most confusable flags of every country for quiz distractors.
+Each flag in Assets.xcassets/Flags is reduced to a 32x32 RGB thumbnail,
+from which batched NumPy operations compute a DCT perceptual hash (64 bits)
+and a 64-bin colour histogram. The pairwise similarity of all flags (hash
+agreement plus histogram intersection) is one vectorised matrix, and the
+top-k flags per country are written to FlagSimilarity.swift.
+
+Features are cached in .flag_similarity_cache.npz by image content hash, so
+only new or changed flags are decoded again. Territories sharing a flag
+(aliases) are never offered as each other's distractors, and a shared flag
+appears at most once in any list.
+
+Usage:
+  python flag_similarity.py           # top 5 per country
+  python flag_similarity.py --top 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+import country_dataset
+from file_utils import write_if_changed
+
+ASSETS_DIR = "Tapaterra/Assets.xcassets/Flags"
+OUTPUT_FILE = "Tapaterra/FlagSimilarity.swift"
+CACHE_FILE = ".flag_similarity_cache.npz"
+FEATURE_VERSION = 1  # bump to invalidate cached features when the feature code changes
+DEFAULT_TOP_K = 5
+
+THUMBNAIL_SIZE = 32
+HASH_SIZE = 8          # low-frequency DCT block: 8x8 = 64 hash bits
+COLOUR_LEVELS = 4      # per channel: 4 x 4 x 4 = 64 histogram bins
+HASH_WEIGHT = 0.5      # similarity = HASH_WEIGHT * hash agreement + (1 - HASH_WEIGHT) * histogram intersection
+REPORT_PAIRS = 10
+
+
+def flag_images(assets_dir=ASSETS_DIR):
+    """{imageset name: path of its largest rendition} for every flag in the catalogue."""
+    images = {}
+    for region in sorted(os.listdir(assets_dir)):
+        region_path = os.path.join(assets_dir, region)
+        if not os.path.isdir(region_path):
+            continue
+        for item in sorted(os.listdir(region_path)):
+            if not item.endswith(".imageset"):
+                continue
+            imageset_path = os.path.join(region_path, item)
+            with open(os.path.join(imageset_path, "Contents.json"), "r", encoding="utf-8") as f:
+                renditions = [image for image in json.load(f)["images"] if image.get("filename")]
+            if renditions:
+                largest = max(renditions, key=lambda image: image.get("scale", "1x"))
+                images[item[:-len(".imageset")]] = os.path.join(imageset_path, largest["filename"])
+    return images
+
+
+def content_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f"{FEATURE_VERSION}:".encode() + f.read()).hexdigest()
+
+
+def thumbnail(path):
+    """THUMBNAIL_SIZE x THUMBNAIL_SIZE RGB pixels, transparency composited onto white."""
+    with Image.open(path) as img:
+        rgba = img.convert("RGBA")
+    background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+    rgb = Image.alpha_composite(background, rgba).convert("RGB")
+    return np.asarray(rgb.resize((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.LANCZOS), dtype=np.uint8)
+
+
+def dct_matrix(n):
+    """Orthonormal DCT-II basis, so dct(x) = C @ x @ C.T for a 2-D block."""
+    k = np.arange(n)[:, None]
+    basis = np.sqrt(2.0 / n) * np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n))
+    basis[0] /= np.sqrt(2.0)
+    return basis
+
+
+def compute_features(thumbnails):
+    """Perceptual hash bits (N, 64) and normalised colour histograms (N, 64) for a batch of thumbnails."""
+    pixels = thumbnails.astype(np.float32)
+    gray = pixels @ np.array([0.299, 0.587, 0.114], dtype=np.float32)  # (N, 32, 32)
+    basis = dct_matrix(THUMBNAIL_SIZE).astype(np.float32)
+    low = (basis @ gray @ basis.T)[:, :HASH_SIZE, :HASH_SIZE].reshape(len(pixels), -1)
+    # Compare with the median of the AC terms; the DC term only reflects overall brightness
+    hashes = low > np.median(low[:, 1:], axis=1, keepdims=True)
+
+    levels = thumbnails // (256 // COLOUR_LEVELS)
+    bins = (levels[..., 0].astype(np.int64) * COLOUR_LEVELS + levels[..., 1]) * COLOUR_LEVELS + levels[..., 2]
+    bin_count = COLOUR_LEVELS ** 3
+    offsets = np.arange(len(thumbnails))[:, None, None] * bin_count
+    histograms = np.bincount((bins + offsets).ravel(), minlength=len(thumbnails) * bin_count)
+    histograms = histograms.reshape(len(thumbnails), bin_count).astype(np.float32) / (THUMBNAIL_SIZE * THUMBNAIL_SIZE)
+    return hashes, histograms
+
+
+def load_cache():
+    """{content hash: (hash bits, histogram)} from the previous run."""
+    try:
+        with np.load(CACHE_FILE, allow_pickle=False) as cache:
+            return {key: (bits, histogram) for key, bits, histogram
+                    in zip(cache["keys"], cache["hashes"], cache["histograms"])}
+    except (OSError, KeyError, ValueError):
+        return {}
+
+
+def save_cache(keys, hashes, histograms):
+    with open(CACHE_FILE, "wb") as f:
+        np.savez(f, keys=np.array(keys), hashes=hashes, histograms=histograms)
+
+
+def flag_features(paths):
+    """Hash bits and histograms for the given images, decoding only the ones missing from the cache."""
+    keys = [content_hash(path) for path in paths]
+    cache = load_cache()
+    missing = [i for i, key in enumerate(keys) if key not in cache]
+    if missing:
+        new_hashes, new_histograms = compute_features(np.stack([thumbnail(paths[i]) for i in missing]))
+        for row, i in enumerate(missing):
+            cache[keys[i]] = (new_hashes[row], new_histograms[row])
+    hashes = np.stack([cache[key][0] for key in keys])
+    histograms = np.stack([cache[key][1] for key in keys])
+    save_cache(keys, hashes, histograms)
+    return hashes, histograms, len(missing)
+
+
+def similarity_matrix(hashes, histograms):
+    """(N, N) similarity in [0, 1]: fraction of agreeing hash bits blended with histogram intersection."""
+    bits = hashes.astype(np.float32)
+    agreement = (bits @ bits.T + (1 - bits) @ (1 - bits).T) / bits.shape[1]
+    intersection = np.minimum(histograms[:, None, :], histograms[None, :, :]).sum(axis=2)
+    return HASH_WEIGHT * agreement + (1 - HASH_WEIGHT) * intersection
+
+
+def top_k(similarity, groups, representatives, k):
+    """
+    Indices of the k most similar columns per row, excluding the row's own group (the same image).
+    Only representative columns are candidates, one per group, so no image is offered twice.
+    """
+    groups = np.asarray(groups)
+    excluded = (groups[:, None] == groups[None, :]) | ~np.asarray(representatives)[None, :]
+    masked = np.where(excluded, -np.inf, similarity)
+    k = min(k, int(np.isfinite(masked).sum(axis=1).min()))
+    candidates = np.argpartition(-masked, k - 1, axis=1)[:, :k] if k > 0 else np.empty((len(groups), 0), int)
+    # Order the k candidates by similarity, then by index for a stable output
+    scores = np.take_along_axis(masked, candidates, axis=1)
+    order = np.lexsort((candidates, -scores))
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def generate_swift_code(iso_codes, ranked, k):
+    lines = []
+    lines.append("import Foundation")
+    lines.append("")
+    lines.append("// Generated by script - do not edit manually")
+    lines.append("// This file is auto-generated from the flag images by flag_similarity.py")
+    lines.append("")
+    lines.append("extension FlagAssets {")
+    lines.append(f"    /// The {k} flags most easily confused with each country's flag, most similar first")
+    lines.append("    static let confusableIsoCodes: [String: [String]] = [")
+    for row, iso_code in enumerate(iso_codes):
+        similar = ", ".join(f'"{iso_codes[column]}"' for column in ranked[row])
+        lines.append(f"        \"{iso_code}\": [{similar}],")
+    lines.append("    ]")
+    lines.append("")
+    lines.append("    /// Plausible wrong answers for a flag question, hardest first")
+    lines.append(f"    static func distractors(forIsoCode isoCode: String, count: Int = {k}) -> [String] {{")
+    lines.append("        Array((confusableIsoCodes[isoCode] ?? []).prefix(count))")
+    lines.append("    }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_K,
+                        help=f"confusable flags kept per country (default: {DEFAULT_TOP_K})")
+    args = parser.parse_args()
+
+    if not os.path.exists(ASSETS_DIR):
+        print("Assets dir not found")
+        return
+
+    images = flag_images()
+    countries = sorted(country_dataset.load(), key=lambda country: country.alpha2)
+    missing = [country.alpha2 for country in countries if country.flag_asset not in images]
+    if missing:
+        raise SystemExit(f"No flag image for {', '.join(missing)}; run import_flags.py first")
+
+    # Features are computed once per stored image; countries sharing a flag share its row
+    assets = sorted({country.flag_asset for country in countries})
+    hashes, histograms, computed = flag_features([images[asset] for asset in assets])
+    row_of = {asset: row for row, asset in enumerate(assets)}
+    rows = np.array([row_of[country.flag_asset] for country in countries])
+    # A shared image is offered once, as the country whose own flag it is (Norway, not Bouvet Island)
+    owners = {country.flag_asset: index for index, country in enumerate(countries)
+              if country.asset_name == country.flag_asset}
+    representatives = np.zeros(len(countries), dtype=bool)
+    representatives[[owners.get(asset, int(np.argmax(rows == row_of[asset]))) for asset in assets]] = True
+
+    similarity = similarity_matrix(hashes, histograms)[np.ix_(rows, rows)]
+    ranked = top_k(similarity, rows, representatives, args.top)
+
+    iso_codes = [country.alpha2 for country in countries]
+    write_if_changed(OUTPUT_FILE, generate_swift_code(iso_codes, ranked, args.top))
+    print(f"Generated {OUTPUT_FILE}: top {args.top} of {len(iso_codes)} flags "
+          f"({computed} decoded, {len(assets) - computed} from cache)")
+
+    upper = np.triu_indices(len(iso_codes), 1)
+    distinct = (rows[upper[0]] != rows[upper[1]]) & representatives[upper[0]] & representatives[upper[1]]
+    pair_scores = np.where(distinct, similarity[upper], -np.inf)
+    print("Most confusable pairs: " + ", ".join(
+        f"{iso_codes[upper[0][i]]}/{iso_codes[upper[1][i]]} {pair_scores[i]:.2f}"
+        for i in np.argsort(-pair_scores, kind="stable")[:REPORT_PAIRS]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,195 @@
 #!/usr/bin/env python3
-"""Generate all required app icon sizes from tapaterra.png"""
+"""
+Generate all required app icon sizes from tapaterra.png
+
+Each distinct pixel size is rendered once and shared by every Contents.json
+entry that needs it (e.g. mac 16pt@2x and 32pt@1x both use icon-32.png).
+Renditions are downscaled in a cascade: each size is resized from the
+smallest rendition that is still at least CASCADE_MIN_RATIO times larger,
+so LANCZOS quality is kept without resampling the full master every time.
+PNG encoding runs on a process pool, and nothing is regenerated while the
+source hash and size table match the previous run.
+
+Usage:
+  python generate_app_icons.py                        # ios + mac
+  python generate_app_icons.py --platforms ios,mac,ipad,watchos
+"""
 
 from PIL import Image
+import argparse
+import hashlib
+import io
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+from file_utils import write_if_changed
 
 SOURCE_IMAGE = "../tapaterra.png"
 OUTPUT_DIR = "Tapaterra/Assets.xcassets/AppIcon.appiconset"
+STATE_FILE = ".app_icons_state.json"
+CASCADE_MIN_RATIO = 2  # resize from an intermediate only if it is at least this many times larger
+
+
+class IconSpec(NamedTuple):
+    """One Contents.json image entry."""
+    idiom: str
+    points: float
+    scale: Optional[int] = None       # None for single-size icons
+    platform: Optional[str] = None
+    appearance: Optional[str] = None  # "dark" or "tinted" luminosity variant
+
+    @property
+    def pixels(self) -> int:
+        return round(self.points * (self.scale or 1))
+
+
+def _scaled(idiom, points_list, scales, platform=None):
+    return [IconSpec(idiom, points, scale, platform) for points in points_list for scale in scales]
 
-# Icon sizes needed: (filename, size_in_pixels)
-ICONS = [
-    # iOS - single 1024x1024 (Xcode generates the rest)
-    ("icon-1024.png", 1024),
 
+# Icon sizes needed per platform
+PLATFORM_ICONS = {
+    # iOS - single 1024x1024 (Xcode generates the rest)
+    "ios": [
+        IconSpec("universal", 1024, platform="ios"),
+        IconSpec("universal", 1024, platform="ios", appearance="dark"),
+        IconSpec("universal", 1024, platform="ios", appearance="tinted"),
+    ],
     # macOS icons
-    ("icon-16.png", 16),
-    ("icon-16@2x.png", 32),
-    ("icon-32.png", 32),
-    ("icon-32@2x.png", 64),
-    ("icon-128.png", 128),
-    ("icon-128@2x.png", 256),
-    ("icon-256.png", 256),
-    ("icon-256@2x.png", 512),
-    ("icon-512.png", 512),
-    ("icon-512@2x.png", 1024),
-]
-
-def generate_icons():
+    "mac": _scaled("mac", (16, 32, 128, 256, 512), (1, 2)),
+    # Legacy per-size iPad set, for deployment targets without single-size icons
+    "ipad": _scaled("ipad", (20, 29, 40, 76), (1, 2)) + [IconSpec("ipad", 83.5, 2)],
+    # watchOS - single 1024x1024
+    "watchos": [IconSpec("universal", 1024, platform="watchos")],
+}
+DEFAULT_PLATFORMS = ("ios", "mac")
+
+
+def icon_filename(pixels: int) -> str:
+    return f"icon-{pixels}.png"
+
+
+def contents_json(specs) -> str:
+    """Contents.json for the icon set, formatted the way Xcode writes it."""
+    images = []
+    for spec in specs:
+        entry = {"filename": icon_filename(spec.pixels), "idiom": spec.idiom}
+        points = f"{spec.points:g}"
+        entry["size"] = f"{points}x{points}"
+        if spec.scale is not None:
+            entry["scale"] = f"{spec.scale}x"
+        if spec.platform:
+            entry["platform"] = spec.platform
+        if spec.appearance:
+            entry["appearances"] = [{"appearance": "luminosity", "value": spec.appearance}]
+        images.append(entry)
+    data = {"images": images, "info": {"author": "xcode", "version": 1}}
+    return json.dumps(data, indent=2, sort_keys=True, separators=(",", " : ")) + "\n"
+
+
+def cascade_plan(master_size: int, sizes):
+    """Map each target size to the size it is resized from (master_size for the master itself)."""
+    plan = {}
+    rendered = [master_size]
+    for size in sorted(sizes, reverse=True):
+        candidates = [source for source in rendered if source >= size * CASCADE_MIN_RATIO or source == master_size]
+        plan[size] = min(candidates)
+        rendered.append(size)
+    return plan
+
+
+def encode_png(image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def generate_icons(platforms=DEFAULT_PLATFORMS, force=False):
+    specs = [spec for platform in platforms for spec in PLATFORM_ICONS[platform]]
+    sizes = sorted({spec.pixels for spec in specs}, reverse=True)
+
+    with open(SOURCE_IMAGE, "rb") as f:
+        source = f.read()
+    signature = hashlib.sha256(source + json.dumps([specs, CASCADE_MIN_RATIO]).encode()).hexdigest()
+
+    # Skip when the source and size table are unchanged and the outputs are intact
+    state = load_state()
+    if not force and state.get("signature") == signature and all(
+            file_sha256(os.path.join(OUTPUT_DIR, name)) == digest for name, digest in state.get("files", {}).items()):
+        print(f"Up to date: {len(sizes)} icons for {', '.join(platforms)}")
+        return
+
     # Open source image
-    img = Image.open(SOURCE_IMAGE)
+    img = Image.open(io.BytesIO(source))
+    img.load()
+    if img.width != img.height:
+        raise ValueError(f"{SOURCE_IMAGE} must be square, got {img.width}x{img.height}")
 
-    # Ensure output directory exists
+    # Downscale in a cascade; each resize reads from an already rendered size
+    renditions = {img.width: img}
+    for size, from_size in cascade_plan(img.width, sizes).items():
+        if size not in renditions:
+            renditions[size] = renditions[from_size].resize((size, size), Image.Resampling.LANCZOS)
+            print(f"Resized: {from_size} -> {size}")
+
+    # Encode the distinct sizes in parallel, then write each shared file once
     os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with ProcessPoolExecutor() as executor:
+        encoded = dict(zip(sizes, executor.map(encode_png, [renditions[size] for size in sizes])))
 
-    for filename, size in ICONS:
+    files = {}
+    for size in sizes:
+        filename = icon_filename(size)
         output_path = os.path.join(OUTPUT_DIR, filename)
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(output_path, "PNG")
-        print(f"Generated: {output_path} ({size}x{size})")
+        status = "Generated" if write_if_changed(output_path, encoded[size]) else "Unchanged"
+        users = sum(1 for spec in specs if spec.pixels == size)
+        print(f"{status}: {output_path} ({size}x{size}, used by {users} entries)")
+        files[filename] = hashlib.sha256(encoded[size]).hexdigest()
 
-    print(f"\nDone! Generated {len(ICONS)} icons.")
+    write_if_changed(os.path.join(OUTPUT_DIR, "Contents.json"), contents_json(specs))
+
+    # Drop renditions no longer referenced by the size table
+    for name in os.listdir(OUTPUT_DIR):
+        if name.startswith("icon-") and name.endswith(".png") and name not in files:
+            os.remove(os.path.join(OUTPUT_DIR, name))
+            print(f"Removed: {name}")
+
+    write_if_changed(STATE_FILE, json.dumps({"signature": signature, "files": files}, indent=2))
+    print(f"\nDone! Generated {len(sizes)} icons for {len(specs)} entries ({', '.join(platforms)}).")
 
-if __name__ == "__main__":
-    generate_icons()
 
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--platforms", default=",".join(DEFAULT_PLATFORMS),
+                        help=f"comma-separated platform size sets: {', '.join(PLATFORM_ICONS)} "
+                             f"(default: {','.join(DEFAULT_PLATFORMS)})")
+    parser.add_argument("--force", action="store_true", help="regenerate even if the source is unchanged")
+    args = parser.parse_args()
+
+    platforms = [name.strip() for name in args.platforms.split(",") if name.strip()]
+    unknown = [name for name in platforms if name not in PLATFORM_ICONS]
+    if unknown:
+        parser.error(f"unknown platform(s): {', '.join(unknown)}")
+    generate_icons(platforms, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,42 @@
 #!/usr/bin/env python3
 """
-Generate Swift file from country_details.json
+Generate Swift file from the country store (country_store.py)
 Creates CountryDetailsData.generated.swift with static data.
+
+Two output modes:
+  literal   one Swift dictionary literal built eagerly by loadDetails() (default)
+  resource  a packed CountryDetails.bin bundle resource plus a thin Swift loader
+            that memory-maps it and decodes each country on first access
+
+Resource layout (little-endian, format version 1):
+  header       magic "TPCD", version u16, record count u16,
+               list count u32, list item count u32, string count u32
+  records      48 bytes each, sorted by ISO code: iso 2s + 2 pad,
+               capital/currency/language string ids u32,
+               cities/rivers/mountains/neighbours list ids u32,
+               population i64 (-1 = nil), area f64 (NaN = nil)
+  lists        (first item u32, item count u32) per distinct list
+  list items   string ids u32
+  strings      offsets u32 (string count + 1), then UTF-8 bytes
+Strings and lists are deduplicated, so repeated neighbour names cost 4 bytes.
 """
 
-import json
+import argparse
+import math
+import os
+import struct
+
+import country_store
+from file_utils import write_if_changed
 
-JSON_FILE = "country_details.json"
 SWIFT_FILE = "Tapaterra/Models/CountryDetailsData.generated.swift"
+RESOURCE_FILE = "Tapaterra/Resources/CountryDetails.bin"
+
+RESOURCE_MAGIC = b"TPCD"
+RESOURCE_VERSION = 1
+HEADER_FORMAT = "<4sHHIII"
+RECORD_FORMAT = "<2s2xIIIIIIIqd"
+NO_STRING = 0xFFFFFFFF
 
 def swift_string_literal(value):
     """Convert a string to Swift string literal with proper escaping."""
@@ -44,6 +73,13 @@ def generate_swift_code(details_dict):
     lines.append("// This file is auto-generated from country_details.json")
     lines.append("")
     lines.append("extension CountryDetailsData {")
+    lines.append("    static func details(forIsoCode isoCode: String) -> CountryDetails? {")
+    lines.append("        if details.isEmpty {")
+    lines.append("            loadDetails()")
+    lines.append("        }")
+    lines.append("        return details[isoCode]")
+    lines.append("    }")
+    lines.append("")
     lines.append("    static func loadDetails() {")
     lines.append("        var detailsDict: [String: CountryDetails] = [:]")
     lines.append("")
@@ -79,17 +115,267 @@ def generate_swift_code(details_dict):
 
     return "\n".join(lines)
 
+class StringTable:
+    """Deduplicated UTF-8 strings, addressed by id in first-use order."""
+
+    def __init__(self):
+        self.ids = {}
+        self.blobs = []
+
+    def add(self, value):
+        if value is None:
+            return NO_STRING
+        if value not in self.ids:
+            self.ids[value] = len(self.blobs)
+            self.blobs.append(value.encode("utf-8"))
+        return self.ids[value]
+
+    def pack(self):
+        offsets = [0]
+        for blob in self.blobs:
+            offsets.append(offsets[-1] + len(blob))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(self.blobs)
+
+class ListTable:
+    """Deduplicated string lists stored as runs of string ids."""
+
+    def __init__(self, strings):
+        self.strings = strings
+        self.ids = {}
+        self.entries = []
+        self.items = []
+
+    def add(self, values):
+        key = tuple(values or [])
+        if key not in self.ids:
+            self.ids[key] = len(self.entries)
+            self.entries.append((len(self.items), len(key)))
+            self.items.extend(self.strings.add(value) for value in key)
+        return self.ids[key]
+
+    def pack(self):
+        entries = b"".join(struct.pack("<II", start, count) for start, count in self.entries)
+        return entries + struct.pack(f"<{len(self.items)}I", *self.items)
+
+def pack_details(details_dict):
+    """Pack country details into the binary resource format described above."""
+    strings = StringTable()
+    lists = ListTable(strings)
+    records = []
+
+    for iso_code, details in sorted(details_dict.items()):
+        iso_bytes = iso_code.encode("ascii")
+        if len(iso_bytes) != 2:
+            raise ValueError(f"ISO code {iso_code!r} is not two letters")
+        population = details.get("population")
+        area = details.get("area")
+        records.append(struct.pack(
+            RECORD_FORMAT,
+            iso_bytes,
+            strings.add(details.get("capital")),
+            strings.add(details.get("currency")),
+            strings.add(details.get("language")),
+            lists.add(details.get("mainCities")),
+            lists.add(details.get("mainRivers")),
+            lists.add(details.get("mainMountains")),
+            lists.add(details.get("neighbours")),
+            -1 if population is None else population,
+            math.nan if area is None else float(area),
+        ))
+
+    header = struct.pack(HEADER_FORMAT, RESOURCE_MAGIC, RESOURCE_VERSION, len(records),
+                         len(lists.entries), len(lists.items), len(strings.blobs))
+    return header + b"".join(records) + lists.pack() + strings.pack()
+
+def generate_loader_code():
+    """Generate the Swift loader for the binary resource."""
+    resource_name = os.path.splitext(os.path.basename(RESOURCE_FILE))[0]
+    return f"""import Foundation
+
+// Generated by script - do not edit manually
+// This file is auto-generated from country_details.json
+// Country details are read lazily from {os.path.basename(RESOURCE_FILE)}
+
+extension CountryDetailsData {{
+    private static let store = CountryDetailsStore(resource: "{resource_name}")
+
+    static func details(forIsoCode isoCode: String) -> CountryDetails? {{
+        if let cached = details[isoCode] {{
+            return cached
+        }}
+        guard let decoded = store?.details(forIsoCode: isoCode) else {{
+            return nil
+        }}
+        details[isoCode] = decoded
+        return decoded
+    }}
+
+    static func loadDetails() {{
+        // Only maps the resource; records are decoded on first access
+        _ = store
+    }}
+}}
+
+/// Read-only view of the packed country details resource (format version {RESOURCE_VERSION}).
+struct CountryDetailsStore {{
+    private static let magic = Data("{RESOURCE_MAGIC.decode()}".utf8)
+    private static let version: UInt16 = {RESOURCE_VERSION}
+    private static let headerSize = {struct.calcsize(HEADER_FORMAT)}
+    private static let recordSize = {struct.calcsize(RECORD_FORMAT)}
+    private static let noString = UInt32.max
+
+    private let data: Data
+    private let recordCount: Int
+    private let recordsOffset: Int
+    private let listsOffset: Int
+    private let listItemsOffset: Int
+    private let stringOffsetsOffset: Int
+    private let stringBytesOffset: Int
+
+    init?(resource name: String, bundle: Bundle = .main) {{
+        guard let url = bundle.url(forResource: name, withExtension: "{os.path.splitext(RESOURCE_FILE)[1][1:]}"),
+              let data = try? Data(contentsOf: url, options: .alwaysMapped) else {{
+            return nil
+        }}
+        self.init(data: data)
+    }}
+
+    init?(data: Data) {{
+        let data = data.startIndex == 0 ? data : Data(data) // offsets are relative to the first byte
+        guard data.count >= Self.headerSize, data.prefix(4) == Self.magic,
+              Self.load(UInt16.self, from: data, at: 4) == Self.version else {{
+            return nil
+        }}
+        let recordCount = Int(Self.load(UInt16.self, from: data, at: 6))
+        let listCount = Int(Self.load(UInt32.self, from: data, at: 8))
+        let listItemCount = Int(Self.load(UInt32.self, from: data, at: 12))
+        let stringCount = Int(Self.load(UInt32.self, from: data, at: 16))
+
+        self.data = data
+        self.recordCount = recordCount
+        recordsOffset = Self.headerSize
+        listsOffset = recordsOffset + recordCount * Self.recordSize
+        listItemsOffset = listsOffset + listCount * 8
+        stringOffsetsOffset = listItemsOffset + listItemCount * 4
+        stringBytesOffset = stringOffsetsOffset + (stringCount + 1) * 4
+        guard data.count >= stringBytesOffset,
+              data.count == stringBytesOffset + Int(Self.load(UInt32.self, from: data, at: stringBytesOffset - 4)) else {{
+            return nil
+        }}
+    }}
+
+    func details(forIsoCode isoCode: String) -> CountryDetails? {{
+        let code = Array(isoCode.utf8)
+        guard code.count == 2 else {{
+            return nil
+        }}
+        let key = UInt16(code[0]) << 8 | UInt16(code[1])
+
+        // Records are sorted by ISO code
+        var low = 0
+        var high = recordCount - 1
+        while low <= high {{
+            let mid = (low + high) / 2
+            let offset = recordsOffset + mid * Self.recordSize
+            let recordKey = UInt16(data[offset]) << 8 | UInt16(data[offset + 1])
+            if recordKey == key {{
+                return record(at: offset, isoCode: isoCode)
+            }} else if recordKey < key {{
+                low = mid + 1
+            }} else {{
+                high = mid - 1
+            }}
+        }}
+        return nil
+    }}
+
+    private func record(at offset: Int, isoCode: String) -> CountryDetails {{
+        let population = Self.load(Int64.self, from: data, at: offset + 32)
+        let area = Double(bitPattern: Self.load(UInt64.self, from: data, at: offset + 40))
+        return CountryDetails(
+            isoCode: isoCode,
+            capital: string(at: offset + 4),
+            mainCities: list(at: offset + 16),
+            mainRivers: list(at: offset + 20),
+            mainMountains: list(at: offset + 24),
+            neighbours: list(at: offset + 28),
+            population: population < 0 ? nil : Int(population),
+            area: area.isNaN ? nil : area,
+            currency: string(at: offset + 8),
+            language: string(at: offset + 12)
+        )
+    }}
+
+    private func string(at offset: Int) -> String? {{
+        string(withId: Self.load(UInt32.self, from: data, at: offset))
+    }}
+
+    private func string(withId id: UInt32) -> String? {{
+        guard id != Self.noString else {{
+            return nil
+        }}
+        let entry = stringOffsetsOffset + Int(id) * 4
+        let start = stringBytesOffset + Int(Self.load(UInt32.self, from: data, at: entry))
+        let end = stringBytesOffset + Int(Self.load(UInt32.self, from: data, at: entry + 4))
+        return String(decoding: data[start..<end], as: UTF8.self)
+    }}
+
+    private func list(at offset: Int) -> [String] {{
+        let entry = listsOffset + Int(Self.load(UInt32.self, from: data, at: offset)) * 8
+        let first = Int(Self.load(UInt32.self, from: data, at: entry))
+        let count = Int(Self.load(UInt32.self, from: data, at: entry + 4))
+        return (0..<count).compactMap {{ index in
+            string(withId: Self.load(UInt32.self, from: data, at: listItemsOffset + (first + index) * 4))
+        }}
+    }}
+
+    private static func load<T: FixedWidthInteger>(_ type: T.Type, from data: Data, at offset: Int) -> T {{
+        var value: T = 0
+        for index in 0..<MemoryLayout<T>.size {{
+            value |= T(truncatingIfNeeded: data[offset + index]) << (index * 8)
+        }}
+        return value
+    }}
+}}
+"""
+
+def report_modes(details_dict, swift_code, loader_code, resource):
+    """Compare what each mode ships and what it costs at build and launch time."""
+    literal_calls = swift_code.count("CountryDetails(")
+    literal_strings = swift_code.count('"') // 2
+    print("Mode comparison:")
+    print(f"  literal:  {len(swift_code.encode('utf-8')):,} bytes of Swift in {swift_code.count(chr(10)) + 1:,} lines, "
+          f"{literal_calls} initialisers and {literal_strings:,} string literals to type-check, "
+          f"{len(details_dict)} records built at launch")
+    print(f"  resource: {len(resource):,} byte resource + {len(loader_code.encode('utf-8')):,} bytes of Swift "
+          f"in {loader_code.count(chr(10)) + 1} lines, no data literals to type-check, "
+          f"0 records built at launch (each decoded on first access)")
+
 def main():
-    """Generate Swift file from JSON."""
-    with open(JSON_FILE, "r", encoding="utf-8") as f:
-        details_dict = json.load(f)
+    """Generate Swift file from the country store."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=("literal", "resource"), default="literal",
+                        help="output mode (default: literal)")
+    args = parser.parse_args()
+
+    details_dict = country_store.connect().export()
 
     swift_code = generate_swift_code(details_dict)
+    loader_code = generate_loader_code()
+    resource = pack_details(details_dict)
 
-    with open(SWIFT_FILE, "w", encoding="utf-8") as f:
-        f.write(swift_code)
+    if args.format == "resource":
+        write_if_changed(RESOURCE_FILE, resource)
+        write_if_changed(SWIFT_FILE, loader_code)
+        print(f"Generated {RESOURCE_FILE} ({len(resource):,} bytes) and {SWIFT_FILE} loader "
+              f"with {len(details_dict)} countries")
+    else:
+        write_if_changed(SWIFT_FILE, swift_code)
+        if os.path.exists(RESOURCE_FILE):
+            os.remove(RESOURCE_FILE)  # would otherwise be bundled unused
+        print(f"Generated {SWIFT_FILE} with {len(details_dict)} countries")
 
-    print(f"Generated {SWIFT_FILE} with {len(details_dict)} countries")
+    report_modes(details_dict, swift_code, loader_code, resource)
 
 if __name__ == "__main__":
     main()
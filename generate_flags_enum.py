@@ -1,7 +1,102 @@
 import os
 
+import country_dataset
+from file_utils import write_if_changed
+
 ASSETS_DIR = "Tapaterra/Assets.xcassets/Flags"
 OUTPUT_FILE = "Tapaterra/FlagAssets.swift"
+THUMBNAIL_SUFFIX = "-thumb"  # grid-sized imagesets written next to each flag by import_flags.py
+
+def iso_asset_names(flag_names):
+    """
+    Join the country dataset with the scanned flag names: {alpha-2 code: flag name}.
+    Fails fast on any ISO code without a flag and any flag without an ISO code.
+    """
+    dataset = country_dataset.load()
+    by_iso = {country.alpha2: country.asset_name for country in dataset}
+
+    missing = sorted(iso_code for iso_code, flag in by_iso.items() if flag not in flag_names)
+    unmatched = sorted(flag for flag in flag_names if flag not in dataset.by_asset)
+    problems = [f"ISO code {iso_code} has no flag asset {by_iso[iso_code]!r}" for iso_code in missing]
+    problems += [f"Flag asset {flag!r} has no ISO code" for flag in unmatched]
+    if problems:
+        raise SystemExit("\n".join(problems))
+    return by_iso
+
+def iso_slot(iso_code):
+    """Perfect hash of an alpha-2 code into 0..<676."""
+    return (ord(iso_code[0]) - ord("A")) * 26 + ord(iso_code[1]) - ord("A")
+
+def generate_lookup_code(structure, asset_for):
+    """Flat flag table ordered by continent, continent ranges and an ISO-indexed slot table."""
+    region_of = {flag: region for region, flags in structure.items() for flag in flags}
+    by_iso = iso_asset_names(region_of)
+    continent_of = {region: to_camel_case(region.lower().replace("_", "-")) for region in structure}
+
+    entries = sorted(by_iso.items(), key=lambda item: (continent_of[region_of[item[1]]], item[1]))
+    slots = [-1] * 26 * 26
+    ranges = {}
+    for index, (iso_code, flag) in enumerate(entries):
+        slots[iso_slot(iso_code)] = index
+        continent = continent_of[region_of[flag]]
+        start, _ = ranges.get(continent, (index, index))
+        ranges[continent] = (start, index + 1)
+
+    lines = []
+    lines.append("struct FlagAssetEntry {")
+    lines.append("    let isoCode: String")
+    lines.append("    let assetName: String")
+    lines.append("    let continent: Continent")
+    lines.append("}")
+    lines.append("")
+    lines.append("extension FlagAssets {")
+    lines.append("    /// Every flag, grouped by continent; aliases point at the shared asset")
+    lines.append("    static let entries: [FlagAssetEntry] = [")
+    for iso_code, flag in entries:
+        asset_name = f"Flags/{asset_for.get(flag, flag)}"
+        continent = continent_of[region_of[flag]]
+        lines.append(f"        FlagAssetEntry(isoCode: \"{iso_code}\", assetName: \"{asset_name}\", continent: .{continent}),")
+    lines.append("    ]")
+    lines.append("")
+    lines.append("    /// Index range of each continent in entries")
+    lines.append("    static let continentRanges: [Continent: Range<Int>] = [")
+    for continent, (start, end) in sorted(ranges.items(), key=lambda item: item[1]):
+        lines.append(f"        .{continent}: {start}..<{end},")
+    lines.append("    ]")
+    lines.append("")
+    lines.append("    /// entries index for each alpha-2 code at (first letter * 26 + second letter), -1 if none")
+    lines.append("    private static let isoSlots: [Int16] = [")
+    for row in range(26):
+        values = ", ".join(str(slot) for slot in slots[row * 26:(row + 1) * 26])
+        lines.append(f"        {values},")
+    lines.append("    ]")
+    lines.append("")
+    lines.append("    static func entry(forIsoCode isoCode: String) -> FlagAssetEntry? {")
+    lines.append("        let letters = Array(isoCode.utf8)")
+    lines.append("        guard letters.count == 2 else {")
+    lines.append("            return nil")
+    lines.append("        }")
+    lines.append("        let first = Int(letters[0]) - 65")
+    lines.append("        let second = Int(letters[1]) - 65")
+    lines.append("        guard (0..<26).contains(first), (0..<26).contains(second) else {")
+    lines.append("            return nil")
+    lines.append("        }")
+    lines.append("        let slot = Int(isoSlots[first * 26 + second])")
+    lines.append("        return slot < 0 ? nil : entries[slot]")
+    lines.append("    }")
+    lines.append("")
+    lines.append("    static func assetName(forIsoCode isoCode: String) -> String? {")
+    lines.append("        entry(forIsoCode: isoCode)?.assetName")
+    lines.append("    }")
+    lines.append("")
+    lines.append("    static func entries(in continent: Continent) -> ArraySlice<FlagAssetEntry> {")
+    lines.append("        if continent == .all {")
+    lines.append("            return entries[...]")
+    lines.append("        }")
+    lines.append("        return entries[continentRanges[continent] ?? 0..<0]")
+    lines.append("    }")
+    lines.append("}")
+    return lines
 
 def to_camel_case(text):
     # algeria -> algeria
@@ -18,6 +113,7 @@ def main():
     # We'll organize them by region in the struct for nice access: Flags.Africa.algeria
 
     structure = {}
+    has_thumbnails = False
 
     for region in os.listdir(ASSETS_DIR):
         region_path = os.path.join(ASSETS_DIR, region)
@@ -28,17 +124,46 @@ def main():
         for item in os.listdir(region_path):
             if item.endswith(".imageset"):
                 flag_name = item.replace(".imageset", "")
+                if flag_name.endswith(THUMBNAIL_SUFFIX):
+                    has_thumbnails = True
+                    continue
                 flags.append(flag_name)
 
         if flags:
             structure[region] = sorted(flags)
 
+    # Territories whose flag is stored under another name keep their own members
+    aliases = country_dataset.load().aliases
+    asset_for = {}
+    for alias, entry in aliases.items():
+        if not any(entry["asset"] in flags for flags in structure.values()):
+            raise SystemExit(f"Alias {alias} points to missing asset {entry['asset']}")
+        structure[entry["region"]] = sorted(structure.get(entry["region"], []) + [alias])
+        asset_for[alias] = entry["asset"]
+
     # Generate Swift Code
     lines = []
     lines.append("import SwiftUI")
     lines.append("")
     lines.append("// Generated by script - do not edit manually")
     lines.append("public struct FlagAssets {")
+    lines.append(f"    public static let hasThumbnails = {'true' if has_thumbnails else 'false'}")
+    lines.append(f"    public static let thumbnailSuffix = \"{THUMBNAIL_SUFFIX}\"")
+    lines.append("")
+    lines.append("    /// Flags stored once and shared by other territories: asset name -> shared asset name")
+    if asset_for:
+        lines.append("    public static let aliases: [String: String] = [")
+        for alias in sorted(asset_for):
+            lines.append(f"        \"Flags/{alias}\": \"Flags/{asset_for[alias]}\",")
+        lines.append("    ]")
+    else:
+        lines.append("    public static let aliases: [String: String] = [:]")
+    lines.append("")
+    lines.append("    /// Asset to load for an asset name, following aliases")
+    lines.append("    public static func resolve(_ name: String) -> String {")
+    lines.append("        aliases[name] ?? name")
+    lines.append("    }")
+    lines.append("")
 
     sorted_regions = sorted(structure.keys())
 
@@ -56,7 +181,7 @@ def main():
         for flag in structure[region]:
             # flag is kebab-case: algeria or burkina-faso
             var_name = to_camel_case(flag)
-            asset_name = f"Flags/{flag}"
+            asset_name = f"Flags/{asset_for.get(flag, flag)}"
 
             lines.append(f"        public static let {var_name} = Image(\"{asset_name}\")")
             lines.append(f"        public static let {var_name}Name = \"{asset_name}\"")
@@ -64,15 +189,16 @@ def main():
         lines.append("    }")
         lines.append("")
 
-    # Also add a flat lookup if needed, or just rely on regions.
-    # Regions are better for organization.
-
     lines.append("}")
+    lines.append("")
 
-    with open(OUTPUT_FILE, "w") as f:
-        f.write("\n".join(lines))
+    # Flat ISO-keyed lookup, joined with the country dataset
+    lines.extend(generate_lookup_code(structure, asset_for))
 
-    print(f"Generated {OUTPUT_FILE}")
+    if write_if_changed(OUTPUT_FILE, "\n".join(lines)):
+        print(f"Generated {OUTPUT_FILE}")
+    else:
+        print(f"{OUTPUT_FILE} is up to date")
 
 if __name__ == "__main__":
     main()
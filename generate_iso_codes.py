@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 """
 Generate ISO code mappings for countries.
-This script creates a mapping from country names to ISO 3166-1 alpha-2 codes.
+This script creates a mapping from country names to ISO 3166-1 alpha-2 codes,
+plus the ISO 3166-1 codes (alpha-2, alpha-3, numeric and REST Countries common
+name) of each of them. country_dataset.py indexes them for lookups.
 """
 
+from typing import Set
+
 # Common ISO code mappings - manually curated for the countries in FlagData.swift
 ISO_MAPPING = {
     # Africa
@@ -269,6 +273,278 @@ ISO_MAPPING = {
     "South Georgia": "GS",
 }
 
+# ISO 3166-1 codes for every entry in ISO_MAPPING: alpha-2 -> (alpha-3, numeric, common name)
+# The common name is REST Countries' name.common, which is what country_details.json stores
+# for neighbours. Kosovo has no ISO assignment; REST Countries uses alpha-3 "UNK" for it.
+ISO_3166 = {
+    # Africa
+    "DZ": ("DZA", "012", "Algeria"),
+    "AO": ("AGO", "024", "Angola"),
+    "BJ": ("BEN", "204", "Benin"),
+    "BW": ("BWA", "072", "Botswana"),
+    "BF": ("BFA", "854", "Burkina Faso"),
+    "BI": ("BDI", "108", "Burundi"),
+    "CV": ("CPV", "132", "Cape Verde"),
+    "CM": ("CMR", "120", "Cameroon"),
+    "CF": ("CAF", "140", "Central African Republic"),
+    "TD": ("TCD", "148", "Chad"),
+    "KM": ("COM", "174", "Comoros"),
+    "CG": ("COG", "178", "Republic of the Congo"),
+    "CD": ("COD", "180", "DR Congo"),
+    "CI": ("CIV", "384", "Ivory Coast"),
+    "DJ": ("DJI", "262", "Djibouti"),
+    "EG": ("EGY", "818", "Egypt"),
+    "GQ": ("GNQ", "226", "Equatorial Guinea"),
+    "ER": ("ERI", "232", "Eritrea"),
+    "SZ": ("SWZ", "748", "Eswatini"),
+    "ET": ("ETH", "231", "Ethiopia"),
+    "GA": ("GAB", "266", "Gabon"),
+    "GM": ("GMB", "270", "Gambia"),
+    "GH": ("GHA", "288", "Ghana"),
+    "GN": ("GIN", "324", "Guinea"),
+    "GW": ("GNB", "624", "Guinea-Bissau"),
+    "KE": ("KEN", "404", "Kenya"),
+    "LS": ("LSO", "426", "Lesotho"),
+    "LR": ("LBR", "430", "Liberia"),
+    "LY": ("LBY", "434", "Libya"),
+    "MG": ("MDG", "450", "Madagascar"),
+    "MW": ("MWI", "454", "Malawi"),
+    "ML": ("MLI", "466", "Mali"),
+    "MR": ("MRT", "478", "Mauritania"),
+    "MU": ("MUS", "480", "Mauritius"),
+    "YT": ("MYT", "175", "Mayotte"),
+    "MA": ("MAR", "504", "Morocco"),
+    "MZ": ("MOZ", "508", "Mozambique"),
+    "NA": ("NAM", "516", "Namibia"),
+    "NE": ("NER", "562", "Niger"),
+    "NG": ("NGA", "566", "Nigeria"),
+    "RE": ("REU", "638", "Réunion"),
+    "RW": ("RWA", "646", "Rwanda"),
+    "SH": ("SHN", "654", "Saint Helena, Ascension and Tristan da Cunha"),
+    "ST": ("STP", "678", "São Tomé and Príncipe"),
+    "SN": ("SEN", "686", "Senegal"),
+    "SC": ("SYC", "690", "Seychelles"),
+    "SL": ("SLE", "694", "Sierra Leone"),
+    "SO": ("SOM", "706", "Somalia"),
+    "ZA": ("ZAF", "710", "South Africa"),
+    "SS": ("SSD", "728", "South Sudan"),
+    "SD": ("SDN", "729", "Sudan"),
+    "TZ": ("TZA", "834", "Tanzania"),
+    "TG": ("TGO", "768", "Togo"),
+    "TN": ("TUN", "788", "Tunisia"),
+    "UG": ("UGA", "800", "Uganda"),
+    "EH": ("ESH", "732", "Western Sahara"),
+    "ZM": ("ZMB", "894", "Zambia"),
+    "ZW": ("ZWE", "716", "Zimbabwe"),
+
+    # Asia
+    "AF": ("AFG", "004", "Afghanistan"),
+    "AM": ("ARM", "051", "Armenia"),
+    "AZ": ("AZE", "031", "Azerbaijan"),
+    "BH": ("BHR", "048", "Bahrain"),
+    "BD": ("BGD", "050", "Bangladesh"),
+    "BT": ("BTN", "064", "Bhutan"),
+    "BN": ("BRN", "096", "Brunei"),
+    "KH": ("KHM", "116", "Cambodia"),
+    "CN": ("CHN", "156", "China"),
+    "CY": ("CYP", "196", "Cyprus"),
+    "GE": ("GEO", "268", "Georgia"),
+    "HK": ("HKG", "344", "Hong Kong"),
+    "IN": ("IND", "356", "India"),
+    "ID": ("IDN", "360", "Indonesia"),
+    "IR": ("IRN", "364", "Iran"),
+    "IQ": ("IRQ", "368", "Iraq"),
+    "IL": ("ISR", "376", "Israel"),
+    "JP": ("JPN", "392", "Japan"),
+    "JO": ("JOR", "400", "Jordan"),
+    "KZ": ("KAZ", "398", "Kazakhstan"),
+    "KW": ("KWT", "414", "Kuwait"),
+    "KG": ("KGZ", "417", "Kyrgyzstan"),
+    "LA": ("LAO", "418", "Laos"),
+    "LB": ("LBN", "422", "Lebanon"),
+    "MO": ("MAC", "446", "Macau"),
+    "MY": ("MYS", "458", "Malaysia"),
+    "MV": ("MDV", "462", "Maldives"),
+    "MN": ("MNG", "496", "Mongolia"),
+    "MM": ("MMR", "104", "Myanmar"),
+    "NP": ("NPL", "524", "Nepal"),
+    "KP": ("PRK", "408", "North Korea"),
+    "OM": ("OMN", "512", "Oman"),
+    "PK": ("PAK", "586", "Pakistan"),
+    "PS": ("PSE", "275", "Palestine"),
+    "PH": ("PHL", "608", "Philippines"),
+    "QA": ("QAT", "634", "Qatar"),
+    "SA": ("SAU", "682", "Saudi Arabia"),
+    "SG": ("SGP", "702", "Singapore"),
+    "KR": ("KOR", "410", "South Korea"),
+    "LK": ("LKA", "144", "Sri Lanka"),
+    "SY": ("SYR", "760", "Syria"),
+    "TW": ("TWN", "158", "Taiwan"),
+    "TJ": ("TJK", "762", "Tajikistan"),
+    "TH": ("THA", "764", "Thailand"),
+    "TL": ("TLS", "626", "Timor-Leste"),
+    "TR": ("TUR", "792", "Turkey"),
+    "TM": ("TKM", "795", "Turkmenistan"),
+    "AE": ("ARE", "784", "United Arab Emirates"),
+    "UZ": ("UZB", "860", "Uzbekistan"),
+    "VN": ("VNM", "704", "Vietnam"),
+    "YE": ("YEM", "887", "Yemen"),
+
+    # Europe
+    "AX": ("ALA", "248", "Åland Islands"),
+    "AL": ("ALB", "008", "Albania"),
+    "AD": ("AND", "020", "Andorra"),
+    "AT": ("AUT", "040", "Austria"),
+    "BY": ("BLR", "112", "Belarus"),
+    "BE": ("BEL", "056", "Belgium"),
+    "BA": ("BIH", "070", "Bosnia and Herzegovina"),
+    "BG": ("BGR", "100", "Bulgaria"),
+    "HR": ("HRV", "191", "Croatia"),
+    "CZ": ("CZE", "203", "Czechia"),
+    "DK": ("DNK", "208", "Denmark"),
+    "EE": ("EST", "233", "Estonia"),
+    "FO": ("FRO", "234", "Faroe Islands"),
+    "FI": ("FIN", "246", "Finland"),
+    "FR": ("FRA", "250", "France"),
+    "DE": ("DEU", "276", "Germany"),
+    "GI": ("GIB", "292", "Gibraltar"),
+    "GR": ("GRC", "300", "Greece"),
+    "GG": ("GGY", "831", "Guernsey"),
+    "HU": ("HUN", "348", "Hungary"),
+    "IS": ("ISL", "352", "Iceland"),
+    "IE": ("IRL", "372", "Ireland"),
+    "IM": ("IMN", "833", "Isle of Man"),
+    "IT": ("ITA", "380", "Italy"),
+    "JE": ("JEY", "832", "Jersey"),
+    "XK": ("UNK", None, "Kosovo"),
+    "LV": ("LVA", "428", "Latvia"),
+    "LI": ("LIE", "438", "Liechtenstein"),
+    "LT": ("LTU", "440", "Lithuania"),
+    "LU": ("LUX", "442", "Luxembourg"),
+    "MT": ("MLT", "470", "Malta"),
+    "MD": ("MDA", "498", "Moldova"),
+    "MC": ("MCO", "492", "Monaco"),
+    "ME": ("MNE", "499", "Montenegro"),
+    "NL": ("NLD", "528", "Netherlands"),
+    "MK": ("MKD", "807", "North Macedonia"),
+    "NO": ("NOR", "578", "Norway"),
+    "PL": ("POL", "616", "Poland"),
+    "PT": ("PRT", "620", "Portugal"),
+    "RO": ("ROU", "642", "Romania"),
+    "RU": ("RUS", "643", "Russia"),
+    "SM": ("SMR", "674", "San Marino"),
+    "RS": ("SRB", "688", "Serbia"),
+    "SK": ("SVK", "703", "Slovakia"),
+    "SI": ("SVN", "705", "Slovenia"),
+    "ES": ("ESP", "724", "Spain"),
+    "SJ": ("SJM", "744", "Svalbard and Jan Mayen"),
+    "SE": ("SWE", "752", "Sweden"),
+    "CH": ("CHE", "756", "Switzerland"),
+    "UA": ("UKR", "804", "Ukraine"),
+    "GB": ("GBR", "826", "United Kingdom"),
+    "VA": ("VAT", "336", "Vatican City"),
+
+    # North America
+    "AI": ("AIA", "660", "Anguilla"),
+    "AG": ("ATG", "028", "Antigua and Barbuda"),
+    "AW": ("ABW", "533", "Aruba"),
+    "BS": ("BHS", "044", "Bahamas"),
+    "BB": ("BRB", "052", "Barbados"),
+    "BZ": ("BLZ", "084", "Belize"),
+    "BM": ("BMU", "060", "Bermuda"),
+    "BQ": ("BES", "535", "Caribbean Netherlands"),
+    "VG": ("VGB", "092", "British Virgin Islands"),
+    "CA": ("CAN", "124", "Canada"),
+    "KY": ("CYM", "136", "Cayman Islands"),
+    "CR": ("CRI", "188", "Costa Rica"),
+    "CU": ("CUB", "192", "Cuba"),
+    "CW": ("CUW", "531", "Curaçao"),
+    "DM": ("DMA", "212", "Dominica"),
+    "DO": ("DOM", "214", "Dominican Republic"),
+    "SV": ("SLV", "222", "El Salvador"),
+    "GL": ("GRL", "304", "Greenland"),
+    "GD": ("GRD", "308", "Grenada"),
+    "GP": ("GLP", "312", "Guadeloupe"),
+    "GT": ("GTM", "320", "Guatemala"),
+    "HT": ("HTI", "332", "Haiti"),
+    "HN": ("HND", "340", "Honduras"),
+    "JM": ("JAM", "388", "Jamaica"),
+    "MQ": ("MTQ", "474", "Martinique"),
+    "MX": ("MEX", "484", "Mexico"),
+    "MS": ("MSR", "500", "Montserrat"),
+    "NI": ("NIC", "558", "Nicaragua"),
+    "PA": ("PAN", "591", "Panama"),
+    "PR": ("PRI", "630", "Puerto Rico"),
+    "BL": ("BLM", "652", "Saint Barthélemy"),
+    "KN": ("KNA", "659", "Saint Kitts and Nevis"),
+    "LC": ("LCA", "662", "Saint Lucia"),
+    "MF": ("MAF", "663", "Saint Martin"),
+    "PM": ("SPM", "666", "Saint Pierre and Miquelon"),
+    "VC": ("VCT", "670", "Saint Vincent and the Grenadines"),
+    "SX": ("SXM", "534", "Sint Maarten"),
+    "TT": ("TTO", "780", "Trinidad and Tobago"),
+    "TC": ("TCA", "796", "Turks and Caicos Islands"),
+    "US": ("USA", "840", "United States"),
+    "VI": ("VIR", "850", "United States Virgin Islands"),
+
+    # South America
+    "AR": ("ARG", "032", "Argentina"),
+    "BO": ("BOL", "068", "Bolivia"),
+    "BR": ("BRA", "076", "Brazil"),
+    "CL": ("CHL", "152", "Chile"),
+    "CO": ("COL", "170", "Colombia"),
+    "EC": ("ECU", "218", "Ecuador"),
+    "FK": ("FLK", "238", "Falkland Islands"),
+    "GF": ("GUF", "254", "French Guiana"),
+    "GY": ("GUY", "328", "Guyana"),
+    "PY": ("PRY", "600", "Paraguay"),
+    "PE": ("PER", "604", "Peru"),
+    "SR": ("SUR", "740", "Suriname"),
+    "UY": ("URY", "858", "Uruguay"),
+    "VE": ("VEN", "862", "Venezuela"),
+
+    # Oceania
+    "AS": ("ASM", "016", "American Samoa"),
+    "AU": ("AUS", "036", "Australia"),
+    "CX": ("CXR", "162", "Christmas Island"),
+    "CC": ("CCK", "166", "Cocos (Keeling) Islands"),
+    "CK": ("COK", "184", "Cook Islands"),
+    "FJ": ("FJI", "242", "Fiji"),
+    "PF": ("PYF", "258", "French Polynesia"),
+    "GU": ("GUM", "316", "Guam"),
+    "KI": ("KIR", "296", "Kiribati"),
+    "MH": ("MHL", "584", "Marshall Islands"),
+    "FM": ("FSM", "583", "Micronesia"),
+    "NR": ("NRU", "520", "Nauru"),
+    "NC": ("NCL", "540", "New Caledonia"),
+    "NZ": ("NZL", "554", "New Zealand"),
+    "NU": ("NIU", "570", "Niue"),
+    "NF": ("NFK", "574", "Norfolk Island"),
+    "MP": ("MNP", "580", "Northern Mariana Islands"),
+    "PW": ("PLW", "585", "Palau"),
+    "PG": ("PNG", "598", "Papua New Guinea"),
+    "PN": ("PCN", "612", "Pitcairn Islands"),
+    "WS": ("WSM", "882", "Samoa"),
+    "SB": ("SLB", "090", "Solomon Islands"),
+    "TK": ("TKL", "772", "Tokelau"),
+    "TO": ("TON", "776", "Tonga"),
+    "TV": ("TUV", "798", "Tuvalu"),
+    "VU": ("VUT", "548", "Vanuatu"),
+    "WF": ("WLF", "876", "Wallis and Futuna"),
+
+    # Antarctica
+    "AQ": ("ATA", "010", "Antarctica"),
+    "BV": ("BVT", "074", "Bouvet Island"),
+    "TF": ("ATF", "260", "French Southern and Antarctic Lands"),
+    "HM": ("HMD", "334", "Heard Island and McDonald Islands"),
+    "GS": ("SGS", "239", "South Georgia"),
+}
+
+def report_unknown_codes(unknown: Set[str]) -> None:
+    """Print all codes that could not be resolved, once."""
+    if unknown:
+        print(f"Warning: {len(unknown)} unknown alpha-3 codes: {', '.join(sorted(unknown))}")
+
 def get_iso_code(country_name: str) -> str:
     """Get ISO code for a country name."""
     return ISO_MAPPING.get(country_name, "XX")
@@ -277,4 +553,6 @@ if __name__ == "__main__":
     # Test
     print(f"Algeria -> {get_iso_code('Algeria')}")
     print(f"United States -> {get_iso_code('United States')}")
+    print(f"Indexed {len(ISO_3166)} countries ({sum(1 for _, numeric, _ in ISO_3166.values() if numeric)} "
+          f"with numeric codes)")
 
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Fill mainCities in the country store from a GeoNames dump.
+Reads cities15000.txt (or the multi-gigabyte allCountries.txt) from
+https://download.geonames.org/export/dump/ line by line and keeps a bounded
+min-heap per country code, so memory stays flat whatever the file size. Large
+files are split into byte ranges that a process pool scans in parallel; the
+per-chunk heaps are then merged into the top N populated places per country.
+
+Every country in the ISO index gets the N most populous places it has in the
+dump; countries with none keep their current cities.
+
+Usage:
+  python geonames.py cities15000.txt
+  python geonames.py allCountries.txt --top 5 --jobs 8
+"""
+
+import argparse
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import country_dataset
+import country_store
+
+DEFAULT_DUMP = "cities15000.txt"
+DEFAULT_TOP_N = 5
+CHUNK_SIZE = 32 << 20  # bytes per worker task; smaller files are scanned in-process
+MAX_JOBS = os.cpu_count() or 4
+
+# Tab-separated columns of the GeoNames "geoname" table
+GEONAME_ID, NAME, FEATURE_CLASS, FEATURE_CODE, COUNTRY_CODE, POPULATION = 0, 1, 6, 7, 8, 14
+# Populated places that are not (or no longer) cities: sections, historical, abandoned, destroyed
+EXCLUDED_FEATURE_CODES = {b"PPLX", b"PPLH", b"PPLQ", b"PPLW", b"PPLCH"}
+
+# (population, -geonameid, name): the heap minimum is the least populous place kept,
+# and among equal populations the place with the lower id ranks higher
+Candidate = Tuple[int, int, bytes]
+
+
+def scan_range(path: str, start: int, end: int, top_n: int) -> Dict[bytes, List[Candidate]]:
+    """Top-N candidates per country code among the lines that start in [start, end)."""
+    heaps: Dict[bytes, List[Candidate]] = {}
+    with open(path, "rb") as f:
+        if start:
+            # Finish the line that straddles the boundary; it belongs to the previous range
+            f.seek(start - 1)
+            position = start - 1 + len(f.readline())
+        else:
+            position = 0
+        for line in f:
+            if position >= end:
+                break
+            position += len(line)
+            fields = line.split(b"\t", POPULATION + 1)
+            if len(fields) <= POPULATION or fields[FEATURE_CLASS] != b"P":
+                continue
+            if fields[FEATURE_CODE] in EXCLUDED_FEATURE_CODES:
+                continue
+            try:
+                population = int(fields[POPULATION])
+            except ValueError:
+                continue
+            if population <= 0:
+                continue
+            candidate = (population, -int(fields[GEONAME_ID]), fields[NAME])
+            heap = heaps.get(fields[COUNTRY_CODE])
+            if heap is None:
+                heaps[fields[COUNTRY_CODE]] = [candidate]
+            elif len(heap) < top_n:
+                heapq.heappush(heap, candidate)
+            elif candidate > heap[0]:
+                heapq.heapreplace(heap, candidate)
+    return heaps
+
+
+def merge_heaps(partials: List[Dict[bytes, List[Candidate]]], top_n: int) -> Dict[str, List[str]]:
+    """{country code: names, most populous first} from the per-chunk heaps."""
+    candidates: Dict[bytes, List[Candidate]] = {}
+    for heaps in partials:
+        for code, heap in heaps.items():
+            candidates.setdefault(code, []).extend(heap)
+    return {code.decode("ascii"): [name.decode("utf-8") for _, _, name in heapq.nlargest(top_n, heap)]
+            for code, heap in candidates.items()}
+
+
+def top_cities(path: str, top_n: int = DEFAULT_TOP_N, jobs: int = MAX_JOBS,
+               chunk_size: int = CHUNK_SIZE) -> Dict[str, List[str]]:
+    """The top_n most populous places per country code in a GeoNames dump."""
+    size = os.path.getsize(path)
+    ranges = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)] or [(0, 0)]
+    if len(ranges) == 1 or jobs <= 1:
+        return merge_heaps([scan_range(path, start, end, top_n) for start, end in ranges], top_n)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(ranges))) as pool:
+        futures = [pool.submit(scan_range, path, start, end, top_n) for start, end in ranges]
+        return merge_heaps([future.result() for future in futures], top_n)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dump", nargs="?", default=DEFAULT_DUMP,
+                        help=f"GeoNames dump, e.g. cities15000.txt or allCountries.txt (default: {DEFAULT_DUMP})")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_N,
+                        help=f"cities kept per country (default: {DEFAULT_TOP_N})")
+    parser.add_argument("--jobs", type=int, default=MAX_JOBS, help=f"worker processes (default: {MAX_JOBS})")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cities = top_cities(args.dump, args.top, args.jobs)
+    seconds = time.perf_counter() - start
+    print(f"Scanned {os.path.getsize(args.dump) / (1 << 20):.1f} MB of {args.dump} in {seconds:.2f}s: "
+          f"cities for {len(cities)} country codes")
+
+    store = country_store.connect()
+    data = store.export()
+    changed = {}
+    missing = []
+    for country in country_dataset.load():
+        details = data.get(country.alpha2)
+        if details is None:
+            continue
+        if not cities.get(country.alpha2):
+            missing.append(country.alpha2)
+        elif details["mainCities"] != cities[country.alpha2]:
+            changed[country.alpha2] = cities[country.alpha2]
+
+    store.set_lists("mainCities", changed)
+    store.export_json()
+    print(f"Updated mainCities for {len(changed)} countries in {country_store.DB_FILE}")
+    if missing:
+        print(f"No populated places for {len(missing)} countries (kept their current cities): {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
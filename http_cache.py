@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk HTTP response cache shared by the REST Countries scripts.
+Entries are keyed by URL, expire after a per-entry TTL and are then
+revalidated with conditional requests (ETag / Last-Modified). The cache is
+capped in size and evicts least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+import fetch_engine
+import http_client
+import telemetry
+
+CACHE_DIR = ".http_cache"
+DEFAULT_TTL = 24 * 60 * 60         # seconds before an entry is revalidated
+MAX_CACHE_BYTES = 64 * 1024 * 1024  # LRU eviction above this size
+
+
+class ResponseCache:
+    """URL-keyed cache of decoded JSON responses, stored as one JSON file per entry."""
+
+    def __init__(self, directory: str = CACHE_DIR, default_ttl: float = DEFAULT_TTL,
+                 max_bytes: int = MAX_CACHE_BYTES, enabled: bool = True, max_age: Optional[float] = None):
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.max_age = max_age  # when set, revalidate entries older than this regardless of their TTL
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, list]] = None  # key -> [size, last access]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _scan(self) -> Dict[str, list]:
+        """Load entry sizes and access times once per process."""
+        if self._entries is None:
+            self._entries = {}
+            if os.path.isdir(self.directory):
+                for item in os.scandir(self.directory):
+                    if item.name.endswith(".json"):
+                        stat = item.stat()
+                        self._entries[item.name[:-5]] = [stat.st_size, stat.st_mtime]
+        return self._entries
+
+    def _load(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _touch(self, key: str) -> None:
+        now = time.time()
+        with self._lock:
+            entries = self._scan()
+            if key in entries:
+                entries[key][1] = now
+        try:
+            os.utime(self._path(key), (now, now))
+        except OSError:
+            pass
+
+    def _store(self, key: str, entry: Dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        size = os.path.getsize(self._path(key))
+        with self._lock:
+            self._scan()[key] = [size, time.time()]
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits (lock held)."""
+        entries = self._scan()
+        total = sum(size for size, _ in entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            del entries[key]
+            total -= size
+            self.evictions += 1
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get_json(self, url: str, timeout: int = 10, ttl: Optional[float] = None, retry_errors: bool = True):
+        """Return the decoded JSON document for url, from cache when fresh (retry_errors as in fetch_engine.fetch)."""
+        if not self.enabled:
+            self._count("misses")
+            with telemetry.context(cache="off"):
+                return fetch_engine.fetch_json(url, timeout=timeout, retry_errors=retry_errors)
+
+        key = hashlib.sha256(url.encode()).hexdigest()
+        entry = self._load(key)
+        if entry is not None and "data" not in entry:
+            entry = None  # written by an older version of this cache
+        now = time.time()
+        fresh_for = entry["ttl"] if entry is not None else 0
+        if self.max_age is not None:
+            fresh_for = min(fresh_for, self.max_age)
+        if entry is not None and now - entry["fetched_at"] < fresh_for:
+            telemetry.record_request(url, 200, time.time() - now, 0, attempt=0, cache="hit")
+            self._count("hits")
+            self._touch(key)
+            return entry["data"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        with telemetry.context(cache="revalidate" if headers else "miss"):
+            status, response_headers, data = fetch_engine.fetch(url, headers=headers, timeout=timeout, parse=json.load,
+                                                                retry_errors=retry_errors)
+        if status == 304:
+            if entry is None:
+                # Conditional headers are only sent with a cached copy, so there is nothing to revalidate
+                raise http_client.HTTPStatusError(url, status, "Not Modified without a cached copy",
+                                                  response_headers)
+            self._count("revalidated")
+            entry["fetched_at"] = now
+            self._store(key, entry)
+            return entry["data"]
+
+        self._count("misses")
+        self._store(key, {
+            "url": url,
+            "etag": response_headers.get("etag"),
+            "last_modified": response_headers.get("last-modified"),
+            "fetched_at": now,
+            "ttl": self.default_ttl if ttl is None else ttl,
+            "data": data,
+        })
+        return data
+
+    def summary(self) -> str:
+        """One-line description of the hit/miss counters."""
+        total = self.hits + self.misses + self.revalidated
+        rate = (self.hits + self.revalidated) * 100 // total if total else 0
+        return (f"HTTP cache: {self.hits} hits, {self.revalidated} revalidated, "
+                f"{self.misses} misses ({rate}% served from cache), {self.evictions} evicted")
+
+
+default_cache = ResponseCache()
+
+
+def fetch_json(url: str, timeout: int = 10, retry_errors: bool = True):
+    """Fetch and decode a JSON document through the shared cache."""
+    return default_cache.get_json(url, timeout=timeout, retry_errors=retry_errors)
+
+
+def add_arguments(parser) -> None:
+    """Add cache options to an argparse parser."""
+    parser.add_argument("--no-cache", action="store_true", help="bypass the on-disk HTTP cache")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL,
+                        help=f"TTL in seconds stored with new cache entries (default: {DEFAULT_TTL})")
+    parser.add_argument("--max-age", type=float, default=None,
+                        help="revalidate cached responses older than this many seconds, whatever their TTL")
+
+
+def configure_from_args(args) -> None:
+    """Apply options added by add_arguments()."""
+    default_cache.enabled = not args.no_cache
+    default_cache.default_ttl = args.cache_ttl
+    default_cache.max_age = args.max_age
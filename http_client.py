@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Pooled keep-alive HTTP client for REST Countries traffic.
+Keeps persistent HTTP/1.1 connections per host so each pool slot pays the
+TCP/TLS handshake once, asks for gzip responses and counts reuse.
+"""
+
+import gzip
+import http.client
+import queue
+import threading
+import urllib.parse
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_TIMEOUT = 10  # seconds, for connect and each read
+POOL_SIZE = 8         # persistent connections kept per host
+MAX_REDIRECTS = 5
+USER_AGENT = "Tapaterra-data-scripts"
+
+
+class HTTPStatusError(Exception):
+    """Raised for 4xx/5xx responses (and a 304 that http_cache has no cached copy for)."""
+
+    def __init__(self, url: str, status: int, reason: str, headers: Dict[str, str]):
+        super().__init__(f"HTTP Error {status}: {reason} ({url})")
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+
+class _CountingReader:
+    """File-like wrapper counting the bytes read through it."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size) if size is not None and size >= 0 else self.stream.read()
+        self.count += len(data)
+        return data
+
+
+class _PooledConnection:
+    """An HTTP(S) connection plus the number of requests it has served."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], timeout: float):
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self.connection = connection_class(host, port, timeout=timeout)
+        self.requests = 0
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class HTTPClient:
+    """Thread-safe HTTP client with a keep-alive connection pool per host."""
+
+    def __init__(self, pool_size: int = POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.handshakes = 0       # new connections opened
+        self.requests = 0         # requests sent, including retries on stale connections
+        self.bytes_received = 0   # response body bytes on the wire (before gunzip)
+        self.bytes_decoded = 0    # response body bytes after gunzip
+        self.reuse_counts = []    # requests served by each connection that has been closed
+        self._local = threading.local()  # per-thread wire bytes of the current request
+        self._pools: Dict[Tuple[str, str, Optional[int]], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, key) -> queue.LifoQueue:
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = queue.LifoQueue()
+            return self._pools[key]
+
+    def _acquire(self, key, timeout: float) -> Tuple[_PooledConnection, bool]:
+        """Take an idle connection for key, or open a new one; returns (connection, reused)."""
+        try:
+            conn = self._pool(key).get_nowait()
+            return conn, True
+        except queue.Empty:
+            with self._lock:
+                self.handshakes += 1
+            return _PooledConnection(*key, timeout=timeout), False
+
+    def _release(self, key, conn: _PooledConnection, reusable: bool) -> None:
+        pool = self._pool(key)
+        if reusable and pool.qsize() < self.pool_size:
+            pool.put(conn)
+        else:
+            self._discard(conn)
+
+    def _discard(self, conn: _PooledConnection) -> None:
+        conn.close()
+        with self._lock:
+            self.reuse_counts.append(conn.requests)
+
+    def _read_body(self, response, parse: Optional[Callable[[Any], Any]]):
+        """Read (and gunzip) the body, handing successful responses to parse as a stream."""
+        wire = _CountingReader(response)
+        stream = wire
+        if (response.getheader("Content-Encoding") or "").lower() == "gzip":
+            stream = gzip.GzipFile(fileobj=wire, mode="rb")
+        decoded = _CountingReader(stream)
+        if parse is not None and 200 <= response.status < 300:
+            body = parse(decoded)
+        else:
+            body = decoded.read()
+        response.read()  # drain anything the parser left so the connection can be reused
+        with self._lock:
+            self.bytes_received += wire.count
+            self.bytes_decoded += decoded.count
+        self._local.bytes = getattr(self._local, "bytes", 0) + wire.count
+        return body
+
+    def _send(self, key, path: str, headers: Dict[str, str], timeout: float,
+              parse: Optional[Callable[[Any], Any]] = None):
+        """Send one request, retrying once on a fresh connection if a kept-alive one went stale."""
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.connection.timeout = timeout
+                if conn.connection.sock is not None:
+                    conn.connection.sock.settimeout(timeout)
+                conn.connection.request("GET", path, headers=headers)
+                with self._lock:
+                    self.requests += 1
+                conn.requests += 1
+                response = conn.connection.getresponse()
+                body = self._read_body(response, parse)
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                    ConnectionResetError, BrokenPipeError):
+                self._discard(conn)
+                if reused:
+                    continue  # server closed an idle keep-alive connection
+                raise
+            except Exception:
+                self._discard(conn)
+                raise
+            self._release(key, conn, reusable=not response.will_close)
+            return response, body
+
+    def request(self, url: str, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None, parse: Optional[Callable[[Any], Any]] = None) -> Tuple[int, Dict[str, str], Any]:
+        """
+        GET a URL. Returns (status, lower-cased response headers, body).
+        The body is the gunzipped bytes, or parse(stream) for 2xx responses when a
+        parser such as json.load is given, so it is decoded straight off the socket.
+        304 Not Modified is returned; other 4xx/5xx raise HTTPStatusError.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        self._local.bytes = 0
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            key = (parts.scheme, parts.hostname, parts.port)
+            path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+            request_headers = {"Accept-Encoding": "gzip", "User-Agent": USER_AGENT, **(headers or {})}
+
+            response, body = self._send(key, path, request_headers, timeout, parse)
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+
+            if response.status in (301, 302, 303, 307, 308) and "location" in response_headers:
+                url = urllib.parse.urljoin(url, response_headers["location"])
+                continue
+            if response.status >= 400:
+                raise HTTPStatusError(url, response.status, response.reason, response_headers)
+            return response.status, response_headers, body
+        raise HTTPStatusError(url, response.status, "Too many redirects", response_headers)
+
+    def last_request_bytes(self) -> int:
+        """Response bytes on the wire for this thread's most recent request()."""
+        return getattr(self._local, "bytes", 0)
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            while True:
+                try:
+                    self._discard(pool.get_nowait())
+                except queue.Empty:
+                    break
+
+    def summary(self) -> str:
+        """One-line description of connection reuse."""
+        per_connection = self.requests / self.handshakes if self.handshakes else 0
+        return (f"HTTP client: {self.requests} requests over {self.handshakes} connections "
+                f"({per_connection:.1f} requests/connection), {self.bytes_received} bytes received "
+                f"({self.bytes_decoded} decoded)")
+
+
+default_client = HTTPClient()
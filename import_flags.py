@@ -1,11 +1,62 @@
+"""
+Import flag PNGs from the flags asset set into Assets.xcassets/Flags.
+
+Every flag is rendered at 1x/2x/3x for its largest on-screen size, plus a
+"-thumb" imageset sized for grid tiles, on a process pool. Each rendition
+goes through a lossless optimisation stage: exact palette reduction when it
+has at most 256 colours, metadata stripped (colour management kept), re-compressed at maximum zlib
+effort (optionally lossless WebP when that is smaller). Results are cached
+in .flag_cache by source hash, so unchanged flags are never re-rendered.
+Per-file sizes and the decoded memory of a full flag grid are written to
+flag_optimisation_report.json.
+
+Flags are content-addressed by their decoded pixels: territories that use
+their sovereign state's flag (Bouvet Island and Svalbard with Norway, Saint
+Martin with France) are stored once, under the shortest name in the group,
+and the rest are recorded in flag_aliases.json for generate_flags_enum.py.
+
+The asset catalogue is synced rather than rebuilt: only new or changed
+files are written (reflinked or hardlinked from the cache where the
+filesystem allows, copied in parallel otherwise), orphaned imagesets are
+deleted and equivalent Contents.json files are left alone, so re-importing
+an unchanged flag set performs zero writes.
+"""
+
+import argparse
+import ctypes
+import errno
+import hashlib
+import io
 import os
 import shutil
 import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from PIL import Image
+
+from file_utils import write_if_changed
 
 # Configuration
 SOURCE_DIR = "/Users/rafal/indie/flags/assets/flags"
 DEST_DIR = os.path.abspath("Tapaterra/Assets.xcassets/Flags")
 USE_SIZE = "large"  # 'large', 'medium', or 'small'
+CACHE_DIR = ".flag_cache"
+REPORT_FILE = "flag_optimisation_report.json"
+ALIASES_FILE = "flag_aliases.json"
+OPTIMISER_VERSION = 5  # bump to invalidate cached results when the optimiser changes
+THUMBNAIL_VARIANT = "-thumb"
+# (imageset suffix, height in points): the full flag is shown up to 200pt high
+# (detail views), the thumbnail at 80pt (Learn and Play grids)
+RENDITIONS = (("", 200), (THUMBNAIL_VARIANT, 80))
+SCALES = (1, 2, 3)
+COPY_THREADS = 8
+FICLONE = 0x40049409  # Linux ioctl for reflink copies (btrfs, XFS)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Chunks that affect the decoded pixels, and those that affect how they are displayed;
+# everything else is metadata
+PNG_PIXEL_CHUNKS = {b"IHDR", b"PLTE", b"tRNS", b"IDAT", b"IEND"}
+PNG_COLOUR_CHUNKS = {b"gAMA", b"cHRM", b"sRGB", b"iCCP", b"cICP"}
 
 def create_contents_json(is_folder=False, provides_namespace=False):
     data = {
@@ -20,14 +71,16 @@ def create_contents_json(is_folder=False, provides_namespace=False):
         }
     return json.dumps(data, indent=2)
 
-def create_imageset_contents_json(filename):
+def create_imageset_contents_json(filenames):
+    """Contents.json for an imageset; filenames maps scale (1, 2, 3) to the rendition file."""
     data = {
         "images": [
             {
                 "filename": filename,
                 "idiom": "universal",
-                "scale": "1x"
+                "scale": f"{scale}x"
             }
+            for scale, filename in sorted(filenames.items())
         ],
         "info": {
             "author": "xcode",
@@ -36,17 +89,364 @@ def create_imageset_contents_json(filename):
     }
     return json.dumps(data, indent=2)
 
-def main():
-    # 1. Create root Flags folder in Assets
-    if os.path.exists(DEST_DIR):
-        shutil.rmtree(DEST_DIR)
-    os.makedirs(DEST_DIR)
+def rendition_name(variant, scale):
+    """File name suffix of a rendition, e.g. "@2x" or "-thumb@3x"."""
+    return f"{variant}@{scale}x" if scale > 1 else variant
+
+def exact_palette(img):
+    """Lossless palette version of img, or None if it has more than 256 colours."""
+    if img.mode == "P":
+        return img
+    rgba = img.convert("RGBA")
+    colors = rgba.getcolors(256)
+    if colors is None:
+        return None
+    palette = [color for _, color in colors]
+    index = {color: i for i, color in enumerate(palette)}
+    paletted = Image.new("P", rgba.size)
+    paletted.putdata([index[pixel] for pixel in rgba.getdata()])
+    paletted.putpalette(b"".join(bytes(color[:3]) for color in palette))
+    alphas = bytes(color[3] for color in palette)
+    if any(alpha != 255 for alpha in alphas):
+        paletted.info["transparency"] = alphas
+    return paletted
+
+def png_chunks(data):
+    """(type, raw chunk) for every chunk of a PNG; nothing if data is not a PNG."""
+    if data[:8] != PNG_SIGNATURE:
+        return
+    position = 8
+    while position + 8 <= len(data):
+        length = int.from_bytes(data[position:position + 4], "big")
+        end = position + 12 + length  # length, type, data, CRC
+        yield data[position + 4:position + 8], data[position:end]
+        position = end
+
+def colour_chunks(data):
+    """The raw colour-management chunks (gamma, chromaticities, sRGB, ICC profile) of a PNG."""
+    return b"".join(chunk for chunk_type, chunk in png_chunks(data) if chunk_type in PNG_COLOUR_CHUNKS)
+
+def strip_png_chunks(data):
+    """data with every metadata chunk removed and the image and colour data untouched, or None if it is not a PNG."""
+    if data[:8] != PNG_SIGNATURE:
+        return None
+    kept = PNG_PIXEL_CHUNKS | PNG_COLOUR_CHUNKS
+    return PNG_SIGNATURE + b"".join(chunk for chunk_type, chunk in png_chunks(data) if chunk_type in kept)
+
+def add_colour_chunks(data, colour):
+    """A PNG encoded by Pillow with the source's colour chunks put back, right after IHDR."""
+    header_end = 8 + 12 + 13  # signature, then the 13-byte IHDR chunk
+    return data[:header_end] + colour + data[header_end:]
+
+def optimise_image(img, webp=False, original=None, colour=b""):
+    """
+    Losslessly encode img as small as possible, without metadata; returns (bytes, extension).
+    original is the source file for an unresized rendition: its own image data, stripped of
+    metadata chunks, is kept if no re-encoding beats it. colour holds the source's colour chunks,
+    which every PNG output keeps so the flag is displayed in the same colours.
+    """
+    paletted = exact_palette(img)
+    if paletted is not None:
+        img = paletted
+    elif img.mode == "RGBA" and img.getextrema()[3] == (255, 255):
+        img = img.convert("RGB")  # opaque: drop the alpha channel
+
+    # Strip metadata (text, EXIF, timestamps); the colour chunks are added back to the PNG as they were
+    transparency = img.info.get("transparency")
+    img.info = {}
+    options = {"optimize": True, "compress_level": 9}
+    if transparency is not None:
+        options["transparency"] = transparency
+
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG", **options)
+    best = (add_colour_chunks(buffer.getvalue(), colour), "png")
+    stripped = strip_png_chunks(original) if original is not None else None
+    if stripped is not None and len(stripped) <= len(best[0]):
+        best = (stripped, "png")  # the source compression is already optimal
+
+    # Lossless WebP is written as plain sRGB, so only sources that are sRGB (or untagged) may use it
+    chunk_types = {chunk_type for chunk_type, _ in png_chunks(PNG_SIGNATURE + colour)}
+    if webp and (not chunk_types or b"sRGB" in chunk_types):
+        buffer = io.BytesIO()
+        img.save(buffer, "WEBP", lossless=True, quality=100, method=6)
+        if len(buffer.getvalue()) < len(best[0]):
+            best = (buffer.getvalue(), "webp")
+    return best
+
+def pixel_hash(img, colour=b""):
+    """Hash of the decoded RGBA pixels and colour chunks, so differently encoded copies of one flag match."""
+    rgba = img.convert("RGBA")
+    digest = hashlib.sha256(f"{rgba.width}x{rgba.height}:".encode())
+    digest.update(rgba.tobytes())
+    digest.update(colour)
+    return digest.hexdigest()
+
+def render_flag(data, webp=False):
+    """
+    Render and optimise every rendition of one source flag.
+    Returns (pixel hash, {rendition name: (bytes, extension)}).
+    """
+    source = Image.open(io.BytesIO(data))
+    source.load()
+    colour = colour_chunks(data)
+    digest = pixel_hash(source, colour)
+    rgba = None
+    renditions = {}
+    for variant, point_height in RENDITIONS:
+        for scale in SCALES:
+            height = min(point_height * scale, source.height)  # never upscale
+            if height == source.height:
+                renditions[rendition_name(variant, scale)] = optimise_image(source.copy(), webp, original=data, colour=colour)
+                continue
+            if rgba is None:
+                rgba = source.convert("RGBA")
+            width = max(1, round(source.width * height / source.height))
+            resized = rgba.resize((width, height), Image.Resampling.LANCZOS)
+            renditions[rendition_name(variant, scale)] = optimise_image(resized, webp, colour=colour)
+    return digest, renditions
+
+def cache_key(data, webp):
+    settings = json.dumps([OPTIMISER_VERSION, RENDITIONS, SCALES, webp])
+    return hashlib.sha256(data + settings.encode()).hexdigest()
+
+def cached_result(key):
+    """Cached (pixel hash, {name: (bytes, extension, cache path)}), or None."""
+    entry_dir = os.path.join(CACHE_DIR, key)
+    try:
+        with open(os.path.join(entry_dir, "manifest.json"), "r") as f:
+            manifest = json.load(f)
+        renditions = {}
+        for name, ext in manifest["renditions"].items():
+            cache_path = os.path.join(entry_dir, f"flag{name}.{ext}")
+            with open(cache_path, "rb") as f:
+                renditions[name] = (f.read(), ext, cache_path)
+        return manifest["pixel_hash"], renditions
+    except (OSError, ValueError, KeyError):
+        return None
+
+def store_result(key, digest, renditions):
+    """Store rendered renditions in the cache; returns {name: (bytes, extension, cache path)}."""
+    entry_dir = os.path.join(CACHE_DIR, key)
+    os.makedirs(entry_dir, exist_ok=True)
+    stored = {}
+    for name, (data, ext) in renditions.items():
+        cache_path = os.path.join(entry_dir, f"flag{name}.{ext}")
+        # Write a new inode and rename it in: the catalogue may hardlink the old one (clone_file)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+        stored[name] = (data, ext, cache_path)
+    # The manifest is written last, so a half-written entry is never used
+    tmp_path = os.path.join(entry_dir, "manifest.json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"pixel_hash": digest, "renditions": {name: ext for name, (_, ext) in renditions.items()}}, f)
+    os.replace(tmp_path, os.path.join(entry_dir, "manifest.json"))
+    return stored
 
-    # Write root Contents.json with namespace=True (so we use "Flags/country")
-    with open(os.path.join(DEST_DIR, "Contents.json"), "w") as f:
-        f.write(create_contents_json(is_folder=True, provides_namespace=True))
+def optimise_flags(paths, webp=False, jobs=None):
+    """
+    Render and optimise the given source PNGs across all cores, reusing cached results.
+    Returns {source path: (renditions, source size, source dimensions, cached, pixel hash)}.
+    """
+    results = {}
+    pending = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        key = cache_key(data, webp)
+        cached = cached_result(key)
+        if cached is not None:
+            results[path] = (cached[1], len(data), png_dimensions(data), True, cached[0])
+        else:
+            pending[path] = (key, data)
 
-    print(f"Created root Flags folder at {DEST_DIR}")
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {path: executor.submit(render_flag, data, webp) for path, (_, data) in pending.items()}
+            for path, future in futures.items():
+                key, data = pending[path]
+                digest, renditions = future.result()
+                renditions = store_result(key, digest, renditions)
+                results[path] = (renditions, len(data), png_dimensions(data), False, digest)
+    return results
+
+def png_dimensions(data):
+    """(width, height) from a PNG or WebP header, without decoding the image."""
+    if data[:8] == PNG_SIGNATURE:
+        return int.from_bytes(data[16:20], "big"), int.from_bytes(data[20:24], "big")
+    return Image.open(io.BytesIO(data)).size
+
+def decoded_bytes(data):
+    """Memory an image takes once decoded to 32-bit RGBA."""
+    width, height = png_dimensions(data)
+    return width * height * 4
+
+def find_duplicates(sources, results):
+    """
+    Group flags with identical pixels. sources maps source path -> flag name.
+    Returns {alias name: canonical name}; the shortest name (usually the
+    sovereign state) is kept as the canonical asset.
+    """
+    groups = {}
+    for path, name in sources.items():
+        groups.setdefault(results[path][4], []).append(name)
+    aliases = {}
+    for names in groups.values():
+        canonical = min(names, key=lambda name: (len(name), name))
+        aliases.update({name: canonical for name in names if name != canonical})
+    return aliases
+
+def write_report(results, aliases, sources):
+    """Write per-file and total savings to REPORT_FILE and print the totals."""
+    files = []
+    grid_before = grid_after = 0
+    for path, (renditions, source_bytes, (width, height), cached, _) in sorted(results.items()):
+        output_bytes = sum(len(data) for data, _, _ in renditions.values())
+        alias_of = aliases.get(sources[path])
+        files.append({
+            "source": os.path.relpath(path, SOURCE_DIR),
+            "formats": sorted({ext for _, ext, _ in renditions.values()}),
+            "source_bytes": source_bytes,
+            "output_bytes": 0 if alias_of else output_bytes,
+            "deduplicated_bytes": output_bytes if alias_of else 0,
+            "alias_of": alias_of,
+            "renditions": {name or "1x": len(data) for name, (data, _, _) in renditions.items()},
+            "cached": cached,
+        })
+        # A grid of every flag on a 3x device: full-size decode before, thumbnail@3x now
+        grid_before += width * height * 4
+        grid_after += decoded_bytes(renditions[rendition_name(THUMBNAIL_VARIANT, max(SCALES))][0])
+    total_source = sum(item["source_bytes"] for item in files)
+    total_output = sum(item["output_bytes"] for item in files)
+    deduplicated = sum(item["deduplicated_bytes"] for item in files)
+    report = {
+        "total_source_bytes": total_source,
+        "total_output_bytes": total_output,
+        "deduplicated_bytes": deduplicated,
+        "grid_decoded_bytes_before": grid_before,
+        "grid_decoded_bytes_after": grid_after,
+        "files": files,
+    }
+    with open(REPORT_FILE, "w") as f:
+        json.dump(report, f, indent=2)
+
+    optimised = sum(1 for item in files if not item["cached"])
+    print(f"Rendered {optimised} flags ({len(files) - optimised} from cache): "
+          f"{total_source:,} source bytes -> {total_output:,} bytes across "
+          f"{len(RENDITIONS) * len(SCALES)} renditions each, see {REPORT_FILE}")
+    print(f"Deduplicated {len(aliases)} flags with identical pixels, saving {deduplicated:,} bytes")
+    print(f"Decoded memory for a grid of all {len(files)} flags at 3x: "
+          f"{grid_before / 2**20:,.0f} MB full size -> {grid_after / 2**20:,.0f} MB thumbnails")
+
+def clone_file(src, dst):
+    """Copy src to dst as a reflink, then a hardlink, then a plain copy, whichever the filesystem allows."""
+    tmp_path = f"{dst}.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        if sys.platform == "darwin":
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(src), os.fsencode(tmp_path), 0) != 0:
+                raise OSError(ctypes.get_errno(), "clonefile failed")
+        else:
+            import fcntl
+            with open(src, "rb") as source, open(tmp_path, "wb") as target:
+                fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+    except (OSError, AttributeError, ImportError):
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            os.link(src, tmp_path)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+            shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+def contents_equivalent(existing_text, desired_text):
+    """
+    Compare Contents.json documents by meaning rather than formatting.
+    Xcode rewrites these files with its own spacing and empty 2x/3x slots,
+    which must not count as a change.
+    """
+    try:
+        existing = json.loads(existing_text)
+    except ValueError:
+        return False
+    desired = json.loads(desired_text)
+    for document in (existing, desired):
+        if "images" in document:
+            document["images"] = [image for image in document["images"] if "filename" in image]
+    return existing == desired
+
+def file_matches(path, data):
+    """True if path already holds exactly these bytes (size checked before hashing)."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest()
+    except OSError:
+        return False
+
+def sync_tree(dest_dir, desired, threads=COPY_THREADS):
+    """
+    Make dest_dir hold exactly the desired files, touching only what differs.
+    desired maps relative paths to Contents.json text or to (bytes, cache path) for images.
+    Returns (written, unchanged, deleted) counts.
+    """
+    writes = []
+    unchanged = 0
+    for rel_path, content in sorted(desired.items()):
+        path = os.path.join(dest_dir, rel_path)
+        if isinstance(content, str):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    same = contents_equivalent(f.read(), content)
+            except OSError:
+                same = False
+        else:
+            same = file_matches(path, content[0])
+        if same:
+            unchanged += 1
+        else:
+            writes.append((path, content))
+
+    def write(item):
+        path, content = item
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if isinstance(content, str):
+            write_if_changed(path, content)
+        else:
+            clone_file(content[1], path)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(write, writes))
+
+    # Delete orphaned files (old imagesets, replaced renditions), then empty folders
+    deleted = 0
+    wanted = {os.path.normpath(rel_path) for rel_path in desired}
+    for root, dirs, files in os.walk(dest_dir, topdown=False):
+        for name in files:
+            path = os.path.join(root, name)
+            if not name.startswith(".") and os.path.relpath(path, dest_dir) not in wanted:
+                os.remove(path)
+                deleted += 1
+        if root != dest_dir and not os.listdir(root):
+            os.rmdir(root)
+    return len(writes), unchanged, deleted
+
+def main():
+    parser = argparse.ArgumentParser(description="Import flags into Assets.xcassets")
+    parser.add_argument("--webp", action="store_true", help="use lossless WebP where it is smaller than PNG")
+    parser.add_argument("--jobs", type=int, default=None, help="optimiser processes (default: all cores)")
+    args = parser.parse_args()
+
+    # 1. Root Flags folder in Assets
+    # Root Contents.json with namespace=True (so we use "Flags/country")
+    desired = {"Contents.json": create_contents_json(is_folder=True, provides_namespace=True)}
 
     # 2. Walk source directory
     # Structure is region/size/image.png
@@ -57,6 +457,20 @@ def main():
 
     regions = [d for d in os.listdir(SOURCE_DIR) if os.path.isdir(os.path.join(SOURCE_DIR, d))]
 
+    # Render every flag up front so the work is spread across all cores
+    sources = {}
+    for region in regions:
+        size_path = os.path.join(SOURCE_DIR, region, USE_SIZE)
+        if os.path.exists(size_path):
+            for f in os.listdir(size_path):
+                if f.endswith(".png"):
+                    sources[os.path.join(size_path, f)] = os.path.splitext(f)[0]
+    optimised = optimise_flags(sources, webp=args.webp, jobs=args.jobs)
+
+    # Store each distinct image once; territories sharing a flag become aliases
+    duplicates = find_duplicates(sources, optimised)
+    aliases = {}
+
     for region in regions:
         region_path = os.path.join(SOURCE_DIR, region)
         size_path = os.path.join(region_path, USE_SIZE)
@@ -64,12 +478,9 @@ def main():
         if not os.path.exists(size_path):
             continue
 
-        # Create region folder in Assets (just for organization, no namespace)
-        dest_region_path = os.path.join(DEST_DIR, region.capitalize())
-        os.makedirs(dest_region_path, exist_ok=True)
-
-        with open(os.path.join(dest_region_path, "Contents.json"), "w") as f:
-            f.write(create_contents_json(is_folder=True, provides_namespace=False))
+        # Region folder in Assets (just for organization, no namespace)
+        dest_region = region.capitalize()
+        desired[os.path.join(dest_region, "Contents.json")] = create_contents_json(is_folder=True, provides_namespace=False)
 
         # Process images
         images = [f for f in os.listdir(size_path) if f.endswith(".png")]
@@ -79,20 +490,27 @@ def main():
             # Convert to consistent naming if needed, but source is already kebab-case.
             # Keeping kebab-case is fine for asset keys.
 
-            imageset_name = f"{country_name}.imageset"
-            imageset_path = os.path.join(dest_region_path, imageset_name)
-            os.makedirs(imageset_path, exist_ok=True)
+            if country_name in duplicates:
+                aliases[country_name] = {"asset": duplicates[country_name], "region": dest_region}
+                continue
 
-            # Copy file
-            shutil.copy(
-                os.path.join(size_path, image_file),
-                os.path.join(imageset_path, image_file)
-            )
+            # One imageset per variant (full size and thumbnail), each with 1x/2x/3x renditions
+            renditions = optimised[os.path.join(size_path, image_file)][0]
+            for variant, _ in RENDITIONS:
+                imageset_path = os.path.join(dest_region, f"{country_name}{variant}.imageset")
+                filenames = {}
+                for scale in SCALES:
+                    data, ext, cache_path = renditions[rendition_name(variant, scale)]
+                    filenames[scale] = f"{country_name}{rendition_name(variant, scale)}.{ext}"
+                    desired[os.path.join(imageset_path, filenames[scale])] = (data, cache_path)
+                desired[os.path.join(imageset_path, "Contents.json")] = create_imageset_contents_json(filenames)
 
-            # Write Contents.json
-            with open(os.path.join(imageset_path, "Contents.json"), "w") as f:
-                f.write(create_imageset_contents_json(image_file))
+    # 3. Sync the catalogue: write only what changed, delete orphans
+    written, unchanged, deleted = sync_tree(DEST_DIR, desired)
+    print(f"Synced {DEST_DIR}: {written} written, {unchanged} unchanged, {deleted} deleted")
+    write_if_changed(ALIASES_FILE, json.dumps(aliases, indent=2, sort_keys=True) + "\n")
 
+    write_report(optimised, duplicates, sources)
     print("Done importing flags.")
 
 if __name__ == "__main__":
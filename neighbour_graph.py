@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Build the land-border graph of the countries and generate its Swift table.
+Neighbour names in the country store are resolved to ISO codes and every
+border is checked from both sides; an edge recorded by only one of the two
+countries is repaired by adding the missing direction to the store. Hop
+distances between all pairs come from one BFS per country, and the connected
+components are numbered by size.
+
+NeighbourGraph.generated.swift holds the adjacency lists, the components and
+the distance table (one byte per unordered pair), so questions such as
+"countries within 2 borders" or "shortest border path" are table lookups in
+the app.
+
+Usage:
+  python neighbour_graph.py           # repair one-sided borders and generate the Swift table
+  python neighbour_graph.py --check   # only report one-sided borders (exit status 1 if any)
+"""
+
+import argparse
+import base64
+import sys
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+import country_dataset
+import country_store
+from generate_iso_codes import report_unknown_codes
+from file_utils import write_if_changed
+
+SWIFT_FILE = "Tapaterra/Models/NeighbourGraph.generated.swift"
+UNREACHABLE = 255  # distance byte for pairs without a land route
+CODES_PER_LINE = 16
+
+Graph = Dict[str, Set[str]]
+
+
+def build_graph(records: Dict[str, Dict], dataset, unknown: Set[str]) -> Graph:
+    """{ISO code: neighbour ISO codes} for every stored country; unresolved names are added to `unknown`."""
+    graph = {iso_code: set() for iso_code in records}
+    for iso_code, details in records.items():
+        for name in details.get("neighbours", []):
+            country = dataset.lookup(name)
+            if country is None or country.alpha2 not in graph:
+                unknown.add(name)
+            elif country.alpha2 != iso_code:
+                graph[iso_code].add(country.alpha2)
+    return graph
+
+
+def one_sided_edges(graph: Graph) -> List[Tuple[str, str]]:
+    """Borders (a, b) recorded by a but not by b."""
+    return sorted((a, b) for a, neighbours in graph.items() for b in neighbours if a not in graph[b])
+
+
+def hop_distances(nodes: List[str], graph: Graph) -> List[List[int]]:
+    """Matrix of border crossings between nodes (UNREACHABLE if there is no land route), one BFS per node."""
+    index = {iso_code: i for i, iso_code in enumerate(nodes)}
+    adjacency = [[index[neighbour] for neighbour in graph[iso_code]] for iso_code in nodes]
+    matrix = []
+    for source in range(len(nodes)):
+        distances = [UNREACHABLE] * len(nodes)
+        distances[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for neighbour in adjacency[node]:
+                if distances[neighbour] == UNREACHABLE:
+                    distances[neighbour] = distances[node] + 1
+                    queue.append(neighbour)
+        matrix.append(distances)
+    return matrix
+
+
+def connected_components(nodes: List[str], distances: List[List[int]]) -> List[List[str]]:
+    """Components as sorted code lists, largest first (ties by first code)."""
+    seen = set()
+    components = []
+    for i, iso_code in enumerate(nodes):
+        if iso_code in seen:
+            continue
+        members = [nodes[j] for j, distance in enumerate(distances[i]) if distance != UNREACHABLE]
+        seen.update(members)
+        components.append(members)
+    return sorted(components, key=lambda members: (-len(members), members[0]))
+
+
+def pair_distances(distances: List[List[int]]) -> bytes:
+    """Upper triangle of the distance matrix (pairs i < j), row by row."""
+    n = len(distances)
+    return bytes(distances[i][j] for i in range(n) for j in range(i + 1, n))
+
+
+def swift_int_rows(values: List[int], per_line: int = 32) -> str:
+    return "\n".join("        " + ", ".join(str(value) for value in values[start:start + per_line]) + ","
+                     for start in range(0, len(values), per_line))
+
+
+def generate_swift_code(nodes: List[str], graph: Graph, distances: List[List[int]],
+                        components: List[List[str]]) -> str:
+    index = {iso_code: i for i, iso_code in enumerate(nodes)}
+    adjacency_start = [0]
+    adjacency = []
+    for iso_code in nodes:
+        adjacency.extend(sorted(index[neighbour] for neighbour in graph[iso_code]))
+        adjacency_start.append(len(adjacency))
+    component_of = [0] * len(nodes)
+    for number, members in enumerate(components):
+        for iso_code in members:
+            component_of[index[iso_code]] = number
+
+    node_type = "UInt8" if len(nodes) <= 256 else "UInt16"
+    component_type = "UInt8" if len(components) <= 256 else "UInt16"
+    codes = "\n".join("        " + ", ".join(f'"{code}"' for code in nodes[start:start + CODES_PER_LINE]) + ","
+                      for start in range(0, len(nodes), CODES_PER_LINE))
+    encoded = base64.b64encode(pair_distances(distances)).decode("ascii")
+    return f"""import Foundation
+
+// Generated by script - do not edit manually
+// This file is auto-generated from country_details.json by neighbour_graph.py
+
+/// Land borders between countries, keyed by ISO code, with precomputed hop distances
+enum NeighbourGraph {{
+    /// Graph nodes, sorted by ISO code
+    static let isoCodes: [String] = [
+{codes}
+    ]
+
+    /// Number of connected components; component 0 is the largest
+    static let componentCount = {len(components)}
+
+    private static let unreachable: UInt8 = {UNREACHABLE}
+
+    /// Neighbours of node i are adjacency[adjacencyStart[i]..<adjacencyStart[i + 1]]
+    private static let adjacencyStart: [Int32] = [
+{swift_int_rows(adjacency_start)}
+    ]
+
+    private static let adjacency: [{node_type}] = [
+{swift_int_rows(adjacency)}
+    ]
+
+    /// Component of each node, numbered by size
+    private static let componentOfNode: [{component_type}] = [
+{swift_int_rows(component_of)}
+    ]
+
+    /// Border crossings for each pair of nodes i < j, row by row ({UNREACHABLE} = no land route)
+    private static let pairDistances: [UInt8] = Array(Data(base64Encoded: "{encoded}")!)
+
+    private static let indexByIsoCode: [String: Int] = Dictionary(
+        uniqueKeysWithValues: isoCodes.enumerated().map {{ ($0.element, $0.offset) }}
+    )
+
+    static func index(ofIsoCode isoCode: String) -> Int? {{
+        indexByIsoCode[isoCode]
+    }}
+
+    private static func neighbourIndices(_ node: Int) -> [Int] {{
+        adjacency[Int(adjacencyStart[node])..<Int(adjacencyStart[node + 1])].map {{ Int($0) }}
+    }}
+
+    private static func distance(_ a: Int, _ b: Int) -> Int? {{
+        if a == b {{
+            return 0
+        }}
+        let (i, j) = a < b ? (a, b) : (b, a)
+        let value = pairDistances[i * (2 * isoCodes.count - i - 1) / 2 + j - i - 1]
+        return value == unreachable ? nil : Int(value)
+    }}
+
+    static func neighbours(ofIsoCode isoCode: String) -> [String] {{
+        guard let node = index(ofIsoCode: isoCode) else {{
+            return []
+        }}
+        return neighbourIndices(node).map {{ isoCodes[$0] }}
+    }}
+
+    /// Number of borders crossed on the shortest land route, nil if there is none
+    static func hopDistance(from source: String, to target: String) -> Int? {{
+        guard let a = index(ofIsoCode: source), let b = index(ofIsoCode: target) else {{
+            return nil
+        }}
+        return distance(a, b)
+    }}
+
+    /// Countries at most `hops` borders away, nearest first (the country itself excluded)
+    static func countries(within hops: Int, of isoCode: String) -> [String] {{
+        guard let node = index(ofIsoCode: isoCode) else {{
+            return []
+        }}
+        return isoCodes.indices
+            .compactMap {{ other -> (Int, Int)? in
+                guard other != node, let hopCount = distance(node, other), hopCount <= hops else {{
+                    return nil
+                }}
+                return (hopCount, other)
+            }}
+            .sorted {{ $0 < $1 }}
+            .map {{ isoCodes[$0.1] }}
+    }}
+
+    /// One shortest land route, both ends included; nil if the countries are not connected
+    static func shortestPath(from source: String, to target: String) -> [String]? {{
+        guard let a = index(ofIsoCode: source), let b = index(ofIsoCode: target),
+              var remaining = distance(a, b) else {{
+            return nil
+        }}
+        var path = [a]
+        var node = a
+        while remaining > 0 {{
+            // Some neighbour is always one border closer to the target
+            guard let next = neighbourIndices(node).first(where: {{ distance($0, b) == remaining - 1 }}) else {{
+                return nil
+            }}
+            path.append(next)
+            node = next
+            remaining -= 1
+        }}
+        return path.map {{ isoCodes[$0] }}
+    }}
+
+    static func component(ofIsoCode isoCode: String) -> Int? {{
+        index(ofIsoCode: isoCode).map {{ Int(componentOfNode[$0]) }}
+    }}
+}}
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true",
+                        help="report one-sided borders without repairing them or writing anything")
+    args = parser.parse_args()
+
+    dataset = country_dataset.load()
+    store = country_store.connect()
+    records = store.export()
+    unknown = set()
+    graph = build_graph(records, dataset, unknown)
+    report_unknown_codes(unknown)
+
+    one_sided = one_sided_edges(graph)
+    for a, b in one_sided:
+        print(f"One-sided border: {a} lists {b}, {b} does not list {a}")
+    if args.check:
+        sys.exit(1 if one_sided else 0)
+
+    if one_sided:
+        repaired: Dict[str, List[str]] = {}
+        for a, b in one_sided:
+            graph[b].add(a)
+            repaired.setdefault(b, list(records[b]["neighbours"])).append(dataset.by_alpha2[a].common_name)
+        store.set_lists("neighbours", repaired)
+        store.export_json()
+        print(f"Repaired {len(one_sided)} one-sided borders in {len(repaired)} countries")
+
+    nodes = sorted(graph)
+    distances = hop_distances(nodes, graph)
+    components = connected_components(nodes, distances)
+    diameter = max((d for row in distances for d in row if d != UNREACHABLE), default=0)
+    if diameter >= UNREACHABLE:
+        raise SystemExit(f"Hop distance {diameter} does not fit the distance table")
+
+    write_if_changed(SWIFT_FILE, generate_swift_code(nodes, graph, distances, components))
+    edges = sum(len(neighbours) for neighbours in graph.values()) // 2
+    isolated = sum(1 for members in components if len(members) == 1)
+    print(f"Generated {SWIFT_FILE}: {len(nodes)} countries, {edges} borders, {len(components)} components "
+          f"(largest {len(components[0]) if components else 0}, {isolated} without land borders), "
+          f"diameter {diameter}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Incremental driver for the data and asset scripts.
+Each stage declares its inputs and outputs; stages form a DAG through the
+files they share and independent stages run in parallel. A stage is skipped
+when the content hash of its inputs (including its own script) and of its
+outputs matches the last successful run, recorded in .pipeline_state.json.
+
+Network stages (fetching from REST Countries) only rerun when their code
+changes or with --refresh, since the remote data has no local hash. With
+--offline DUMP they read a local REST Countries dump instead, which is then
+hashed like any other input.
+Scripts write through write_if_changed(), so rerunning a stage that produces
+the same bytes leaves mtimes alone and does not trigger Xcode rebuilds.
+
+Usage:
+  python pipeline.py                  # bring everything up to date
+  python pipeline.py details_swift    # one stage and whatever it depends on
+  python pipeline.py --refresh        # also refetch remote data
+  python pipeline.py --dry-run        # show what would run
+  python pipeline.py --offline restcountries.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from file_utils import write_if_changed
+
+STATE_FILE = ".pipeline_state.json"
+MAX_JOBS = os.cpu_count() or 4
+
+# Country dataset module and the sources it joins (country_details.json is listed per stage)
+DATASET = ("country_dataset.py", "generate_iso_codes.py", "Tapaterra/Models/FlagData.swift", "flag_aliases.json")
+# Library modules imported by the fetch scripts
+# SQLite store behind country_details.json; the JSON export is what stages track,
+# since it is rewritten (only when different) after every change to the store
+STORE = ("country_store.py", "file_utils.py")
+FETCH_LIBS = ("fetch_engine.py", "http_cache.py", "http_client.py", "rest_countries_dump.py",
+              "telemetry.py", "wikidata.py", "checkpoint.py") + STORE + DATASET
+
+
+class Stage(NamedTuple):
+    name: str
+    script: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    args: Tuple[str, ...] = ()
+    network: bool = False  # result also depends on remote data
+    optional: Tuple[str, ...] = ()  # inputs that may be absent on this machine; existing outputs are then kept
+
+
+STAGES = [
+    Stage("import_flags", "import_flags.py",
+          inputs=("/Users/rafal/indie/flags/assets/flags",),
+          outputs=("Tapaterra/Assets.xcassets/Flags", "flag_aliases.json"),
+          optional=("/Users/rafal/indie/flags/assets/flags",)),
+    Stage("flag_iso_codes", "add_iso_codes_to_swift.py",
+          inputs=DATASET,
+          outputs=("Tapaterra/Models/FlagData.swift",)),
+    Stage("flags_enum", "generate_flags_enum.py",
+          inputs=("Tapaterra/Assets.xcassets/Flags",) + DATASET,
+          outputs=("Tapaterra/FlagAssets.swift",)),
+    Stage("flag_similarity", "flag_similarity.py",
+          inputs=("Tapaterra/Assets.xcassets/Flags",) + DATASET,
+          outputs=("Tapaterra/FlagSimilarity.swift",)),
+    Stage("fetch_details", "fetch_country_details.py",
+          inputs=FETCH_LIBS,
+          outputs=("country_details.json",),
+          args=("--bulk",), network=True),
+    # update_neighbours.py is the older sequential variant of this stage
+    Stage("neighbours", "update_neighbours_fast.py",
+          inputs=FETCH_LIBS + ("fetch_country_details.py", "country_details.json"),
+          outputs=("country_details.json",), network=True),
+    # Repairs one-sided borders in place and generates the hop-distance table
+    Stage("neighbour_graph", "neighbour_graph.py",
+          inputs=("country_details.json",) + STORE + DATASET,
+          outputs=("country_details.json", "Tapaterra/Models/NeighbourGraph.generated.swift")),
+    # Optional: skipped while the GeoNames dump is not downloaded
+    Stage("cities", "geonames.py",
+          inputs=("cities15000.txt", "country_details.json") + STORE + DATASET,
+          outputs=("country_details.json",),
+          optional=("cities15000.txt",)),
+    Stage("details_swift", "generate_country_details_swift.py",
+          inputs=STORE + ("country_details.json",),
+          outputs=("Tapaterra/Models/CountryDetailsData.generated.swift",)),
+    Stage("app_icons", "generate_app_icons.py",
+          inputs=("../tapaterra.png",),
+          outputs=("Tapaterra/Assets.xcassets/AppIcon.appiconset",),
+          optional=("../tapaterra.png",)),
+]
+
+
+class FileHasher:
+    """Content hashes of files and directory trees, reusing hashes of files whose size and mtime are unchanged."""
+
+    def __init__(self, known: Optional[Dict[str, list]] = None):
+        self.known = known or {}  # path -> [size, mtime_ns, sha256]
+        self.seen: Dict[str, list] = {}
+
+    def file_hash(self, path: str) -> str:
+        stat = os.stat(path)
+        entry = self.known.get(path)
+        if entry is None or entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            entry = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        self.seen[path] = entry
+        return entry[2]
+
+    def path_hash(self, path: str) -> Optional[str]:
+        """Hash of a file, or of every file under a directory; None if the path does not exist."""
+        if os.path.isfile(path):
+            return self.file_hash(path)
+        if not os.path.isdir(path):
+            return None
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                digest.update(os.path.relpath(file_path, path).encode())
+                digest.update(self.file_hash(file_path).encode())
+        return digest.hexdigest()
+
+
+def offline_stages(stages: List[Stage], dump: str) -> List[Stage]:
+    """Point the network stages at a local REST Countries dump, tracked as an input."""
+    return [stage._replace(args=stage.args + ("--offline", dump), inputs=stage.inputs + (dump,), network=False)
+            if stage.network else stage for stage in stages]
+
+
+def stage_dependencies(stages: List[Stage]) -> Dict[str, List[str]]:
+    """Each stage depends on the earlier stages that produce one of its inputs."""
+    dependencies = {}
+    for index, stage in enumerate(stages):
+        dependencies[stage.name] = [
+            producer.name for producer in stages[:index]
+            if any(output in stage.inputs for output in producer.outputs)
+        ]
+    return dependencies
+
+
+def select_stages(stages: List[Stage], names: List[str]) -> List[Stage]:
+    """The named stages plus everything they depend on, in declaration order."""
+    if not names:
+        return stages
+    known = {stage.name for stage in stages}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(unknown)} (available: {', '.join(sorted(known))})")
+    dependencies = stage_dependencies(stages)
+    wanted = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(dependencies[name])
+    return [stage for stage in stages if stage.name in wanted]
+
+
+def input_fingerprint(stage: Stage, hasher: FileHasher) -> Tuple[str, List[str]]:
+    """Hash of the stage's command and input contents, plus the inputs that are missing."""
+    digest = hashlib.sha256(json.dumps([stage.script, list(stage.args)]).encode())
+    missing = []
+    for path in (stage.script,) + stage.inputs:
+        content_hash = hasher.path_hash(path)
+        if content_hash is None:
+            missing.append(path)
+        digest.update(f"{path}\0{content_hash}\0".encode())
+    return digest.hexdigest(), missing
+
+
+def output_hashes(stage: Stage, hasher: FileHasher) -> Dict[str, Optional[str]]:
+    return {path: hasher.path_hash(path) for path in stage.outputs}
+
+
+def load_state() -> Dict:
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def run_stage(stage: Stage, verbose: bool) -> Tuple[int, str, float]:
+    """Run a stage script in its own interpreter; returns (exit code, output, seconds)."""
+    start = time.monotonic()
+    process = subprocess.run([sys.executable, stage.script, *stage.args],
+                             stdout=None if verbose else subprocess.PIPE,
+                             stderr=subprocess.STDOUT, text=True)
+    return process.returncode, process.stdout or "", time.monotonic() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("stages", nargs="*", help="stages to bring up to date (default: all)")
+    parser.add_argument("--force", action="store_true", help="run the named stages (default: all) even if up to date")
+    parser.add_argument("--refresh", action="store_true", help="rerun network stages to pick up remote changes")
+    parser.add_argument("--offline", metavar="DUMP",
+                        help="build from a local REST Countries /all dump instead of the network")
+    parser.add_argument("--dry-run", action="store_true", help="only report which stages would run")
+    parser.add_argument("--jobs", type=int, default=MAX_JOBS, help=f"stages run in parallel (default: {MAX_JOBS})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="stream stage output instead of summarising it")
+    args = parser.parse_args()
+
+    if args.offline:
+        args.offline = os.path.abspath(args.offline)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    started = time.monotonic()
+    state = load_state()
+    stage_state = state.get("stages", {})
+    hasher = FileHasher(state.get("files"))
+
+    stages = select_stages(offline_stages(STAGES, args.offline) if args.offline else STAGES, args.stages)
+    forced = set(args.stages) or {stage.name for stage in stages}
+    dependencies = stage_dependencies(stages)
+    by_name = {stage.name: stage for stage in stages}
+    status: Dict[str, str] = {}  # name -> "ran", "skipped" or "failed"
+    outputs_before: Dict[str, Dict[str, Optional[str]]] = {}
+    changed_outputs = set()
+
+    def decide(stage: Stage) -> Optional[str]:
+        """Reason to run the stage, or None if it is up to date ("unavailable: ..." keeps its outputs)."""
+        fingerprint, missing = input_fingerprint(stage, hasher)
+        previous = stage_state.get(stage.name, {})
+        if missing:
+            # Only optional sources may be absent; a missing tracked input (e.g. a renamed module) is an error
+            if all(path in stage.optional for path in missing) and all(
+                    hasher.path_hash(path) is not None for path in stage.outputs):
+                return f"unavailable: {', '.join(missing)}"
+            return f"missing input(s): {', '.join(missing)}"
+        if (args.force and stage.name in forced) or (args.refresh and stage.network):
+            return "forced"
+        if previous.get("inputs") != fingerprint:
+            return "inputs changed" if previous else "never run"
+        if previous.get("outputs") != output_hashes(stage, hasher):
+            return "outputs changed"
+        return None
+
+    def record(stage: Stage) -> None:
+        # Fingerprint after the run so in-place outputs (inputs == outputs) count as up to date
+        fingerprint, _ = input_fingerprint(stage, hasher)
+        outputs = output_hashes(stage, hasher)
+        before = outputs_before[stage.name]
+        changed_outputs.update(path for path, value in outputs.items() if before.get(path) != value)
+        stage_state[stage.name] = {"inputs": fingerprint, "outputs": outputs}
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        running = {}
+        while len(status) < len(stages):
+            for stage in stages:
+                if stage.name in status or stage.name in running.values():
+                    continue
+                deps = dependencies[stage.name]
+                if not all(dep in status for dep in deps):
+                    continue
+                if any(status[dep] == "failed" for dep in deps):
+                    print(f"✗ {stage.name}: skipped, a dependency failed")
+                    status[stage.name] = "failed"
+                    continue
+                reason = decide(stage)
+                if reason is None:
+                    print(f"✓ {stage.name}: up to date")
+                    status[stage.name] = "skipped"
+                elif reason.startswith("unavailable"):
+                    print(f"! {stage.name}: keeping the existing outputs, optional input {reason}")
+                    status[stage.name] = "skipped"
+                elif reason.startswith("missing"):
+                    print(f"✗ {stage.name}: {reason}")
+                    status[stage.name] = "failed"
+                elif args.dry_run:
+                    print(f"• {stage.name}: would run ({reason})")
+                    status[stage.name] = "ran"
+                else:
+                    print(f"▶ {stage.name}: running ({reason})")
+                    outputs_before[stage.name] = output_hashes(stage, hasher)
+                    running[executor.submit(run_stage, stage, args.verbose)] = stage.name
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = by_name[running.pop(future)]
+                code, output, seconds = future.result()
+                lines = output.strip().splitlines()
+                if code == 0:
+                    record(stage)
+                    status[stage.name] = "ran"
+                    print(f"✓ {stage.name}: done in {seconds:.1f}s" + (f" — {lines[-1]}" if lines else ""))
+                else:
+                    status[stage.name] = "failed"
+                    print(f"✗ {stage.name}: exit code {code} after {seconds:.1f}s")
+                    for line in lines[-20:]:
+                        print(f"    {line}")
+
+    if not args.dry_run:
+        files = {path: entry for path, entry in hasher.seen.items()}
+        write_if_changed(STATE_FILE, json.dumps({"stages": stage_state, "files": files}, indent=2, sort_keys=True))
+
+    counts = {key: sum(1 for value in status.values() if value == key) for key in ("ran", "skipped", "failed")}
+    print(f"\n{counts['ran']} ran, {counts['skipped']} up to date, {counts['failed']} failed "
+          f"in {time.monotonic() - started:.2f}s; {len(changed_outputs)} outputs changed")
+    if counts["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Offline REST Countries source: serves records from a local dump instead of the API.
+The dump is the JSON array returned by /v3.1/all (optionally gzipped), e.g.
+
+  curl -o restcountries.json "https://restcountries.com/v3.1/all?fields=cca2,cca3,capital,borders,population,area,currencies,languages"
+
+It is stream-parsed one record at a time and indexed by alpha-2 and alpha-3
+code once per process; lookups then return the same records (projected to the
+requested fields) as the API, with no network I/O.
+
+Usage:
+  python fetch_country_details.py --offline restcountries.json
+  python rest_countries_dump.py restcountries.json   # check a dump and print a summary
+"""
+
+import argparse
+import codecs
+import gzip
+import json
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+READ_SIZE = 1 << 16
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """Yield the elements of a top-level JSON array one at a time, reading the file in blocks."""
+    opener = gzip.open if path.endswith(".gz") else open
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    with opener(path, "rb") as f:
+        buffer = ""
+        position = 0
+        started = False
+        eof = False
+        while True:
+            # Skip whitespace, the opening bracket and separators
+            while position < len(buffer) and buffer[position] in " \t\r\n,[]":
+                if buffer[position] == "[":
+                    started = True
+                position += 1
+            if position < len(buffer):
+                if not started:
+                    raise ValueError(f"{path}: expected a JSON array of country records")
+                try:
+                    record, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # Objects end with "}", so a decode that succeeded is never a truncated value
+                    yield record
+                    position = end
+                    continue
+            if eof:
+                return
+            block = f.read(READ_SIZE)
+            eof = not block
+            buffer = buffer[position:] + text.decode(block, final=eof)
+            position = 0
+
+
+def project(record: Dict, fields: Optional[Iterable[str]]) -> Dict:
+    """Keep only the given top-level fields, like ?fields= does."""
+    if fields is None:
+        return record
+    wanted = set(fields)
+    return {key: value for key, value in record.items() if key in wanted}
+
+
+class DumpIndex:
+    """REST Countries records from a dump, keyed by alpha-2 and alpha-3 code."""
+
+    def __init__(self, path: str):
+        self.path = path
+        start = time.perf_counter()
+        self.records: List[Dict] = []
+        self.by_code: Dict[str, Dict] = {}
+        for record in iter_records(path):
+            self.records.append(record)
+            for key in ("cca2", "cca3"):
+                if record.get(key):
+                    self.by_code[record[key].upper()] = record
+        self.load_seconds = time.perf_counter() - start
+
+    def __len__(self):
+        return len(self.records)
+
+    def lookup(self, code: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """The record for an alpha-2 or alpha-3 code, or None if the dump has no such country."""
+        record = self.by_code.get(code.upper())
+        return project(record, fields) if record is not None else None
+
+    def all(self, fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        return [project(record, fields) for record in self.records]
+
+    def summary(self) -> str:
+        return f"Offline dump: {len(self.records)} countries from {self.path} (parsed in {self.load_seconds * 1000:.0f} ms)"
+
+
+# Set by configure_from_args(); the fetch scripts read from it instead of the API when present
+default_index: Optional[DumpIndex] = None
+
+
+def add_arguments(parser) -> None:
+    """Add the --offline option to an argparse parser."""
+    parser.add_argument("--offline", metavar="DUMP",
+                        help="read REST Countries data from a local /all dump (JSON, optionally .gz) "
+                             "instead of the API")
+
+
+def configure_from_args(args) -> None:
+    """Apply options added by add_arguments()."""
+    global default_index
+    default_index = DumpIndex(args.offline) if args.offline else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dump", help="REST Countries /all dump")
+    args = parser.parse_args()
+
+    index = DumpIndex(args.dump)
+    print(index.summary())
+    missing_alpha2 = sum(1 for record in index.records if not record.get("cca2"))
+    if missing_alpha2:
+        print(f"Warning: {missing_alpha2} records have no cca2 and cannot be looked up by alpha-2 code")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Structured metrics for the fetch scripts.
+Every HTTP request (and every cache hit) is logged as one JSON line with its
+URL, status, latency, bytes, cache outcome and attempt number, and spans
+time the stages of a run (e.g. one span per country). Attributes of the
+enclosing spans, such as the country code, are attached to the requests made
+inside them. report() summarises the run: latency percentiles, throughput,
+error rate, the slowest countries and the time spent per span.
+
+Summarise an earlier run:
+  python telemetry.py fetch_country_details.metrics.jsonl
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+SLOWEST_COUNT = 5
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class Telemetry:
+    """Thread-safe event log with span context, kept in memory and optionally written as JSONL."""
+
+    def __init__(self):
+        self.events: List[Dict] = []
+        self.started = time.time()
+        self.path: Optional[str] = None
+        self._file = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def open(self, path: Optional[str]) -> None:
+        """Start a new run, writing events to path (None keeps them in memory only)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(path, "w", encoding="utf-8") if path else None
+            self.path = path
+            self.events = []
+            self.started = time.time()
+
+    def _context(self) -> Dict:
+        if not hasattr(self._local, "context"):
+            self._local.context = {}
+        return self._local.context
+
+    @contextlib.contextmanager
+    def context(self, **attributes) -> Iterator[None]:
+        """Attach attributes to the events emitted by this thread inside the block."""
+        previous = self._context()
+        self._local.context = {**previous, **attributes}
+        try:
+            yield
+        finally:
+            self._local.context = previous
+
+    def emit(self, event_type: str, **fields) -> None:
+        event = {"ts": round(time.time(), 6), "type": event_type, **self._context(), **fields}
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self.events.append(event)
+            if self._file is not None:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def record_request(self, url: str, status: Optional[int], latency: float, bytes_received: int = 0,
+                       attempt: int = 1, cache: Optional[str] = None, error: Optional[str] = None) -> None:
+        fields = {"url": url, "status": status, "latency_ms": round(latency * 1000, 3), "bytes": bytes_received,
+                  "attempt": attempt, "error": error}
+        if cache is not None:
+            fields["cache"] = cache  # an explicit outcome wins over the one set by the caller's context
+        self.emit("request", **fields)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes) -> Iterator[None]:
+        """Time a block; its attributes are also attached to the requests made inside it."""
+        start = time.perf_counter()
+        error = None
+        try:
+            with self.context(**attributes):
+                yield
+        except BaseException as e:
+            error = repr(e)
+            raise
+        finally:
+            self.emit("span", name=name, duration_ms=round((time.perf_counter() - start) * 1000, 3),
+                      error=error, **attributes)
+
+    def summary(self) -> Dict:
+        """Aggregates over the events recorded so far."""
+        with self._lock:
+            events = list(self.events)
+        requests = [e for e in events if e["type"] == "request"]
+        network = [e for e in requests if e.get("cache") != "hit"]
+        errors = [e for e in network if e["error"] is not None or (e["status"] or 0) >= 400]
+        latencies = sorted(e["latency_ms"] for e in network)
+        elapsed = max(time.time() - self.started, 1e-9)
+
+        spans: Dict[str, List[float]] = {}
+        countries = []
+        for event in events:
+            if event["type"] == "span":
+                spans.setdefault(event["name"], []).append(event["duration_ms"])
+                if event["name"] == "country":
+                    countries.append((event["duration_ms"], event.get("country")))
+        countries.sort(reverse=True)
+
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "requests": len(network),
+            "cache_hits": len(requests) - len(network),
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(network), 4) if network else 0.0,
+            "retries": sum(1 for e in network if e["attempt"] > 1),
+            "bytes": sum(e["bytes"] for e in network),
+            "throughput_rps": round(len(network) / elapsed, 2),
+            "latency_ms": {
+                "p50": percentile(latencies, 0.50),
+                "p95": percentile(latencies, 0.95),
+                "p99": percentile(latencies, 0.99),
+                "max": latencies[-1] if latencies else 0.0,
+            },
+            "slowest_countries": [{"country": country, "duration_ms": duration}
+                                  for duration, country in countries[:SLOWEST_COUNT]],
+            "spans": {name: {"count": len(durations), "total_ms": round(sum(durations), 3)}
+                      for name, durations in spans.items()},
+        }
+
+    def report(self) -> str:
+        """Write the run summary as a final event, close the log and describe the run."""
+        summary = self.summary()
+        self.emit("summary", **summary)
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        return format_summary(summary, self.path)
+
+
+def format_summary(summary: Dict, path: Optional[str] = None) -> str:
+    latency = summary["latency_ms"]
+    lines = [
+        f"Requests: {summary['requests']} in {summary['elapsed_s']:.2f}s ({summary['throughput_rps']:.1f}/s), "
+        f"{summary['cache_hits']} cache hits, {summary['bytes']} bytes, "
+        f"{summary['errors']} errors ({summary['error_rate']:.1%}), {summary['retries']} retried",
+        f"Latency: p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms, "
+        f"max {latency['max']:.1f} ms",
+    ]
+    if summary["slowest_countries"]:
+        slowest = ", ".join(f"{entry['country']} {entry['duration_ms']:.0f} ms" for entry in summary["slowest_countries"])
+        lines.append(f"Slowest countries: {slowest}")
+    if summary["spans"]:
+        spans = ", ".join(f"{name} {value['count']}x {value['total_ms'] / 1000:.2f}s"
+                          for name, value in summary["spans"].items())
+        lines.append(f"Spans: {spans}")
+    if path:
+        lines.append(f"Metrics written to {path}")
+    return "\n".join(lines)
+
+
+default_telemetry = Telemetry()
+span = default_telemetry.span
+context = default_telemetry.context
+record_request = default_telemetry.record_request
+report = default_telemetry.report
+
+
+def default_metrics_path() -> str:
+    """<script>.metrics.jsonl next to the script being run."""
+    script = os.path.splitext(os.path.basename(sys.argv[0]))[0] or "run"
+    return f"{script}.metrics.jsonl"
+
+
+def add_arguments(parser) -> None:
+    """Add --metrics/--no-metrics options to an argparse parser."""
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="JSONL file for per-request metrics and spans (default: <script>.metrics.jsonl)")
+    parser.add_argument("--no-metrics", action="store_true", help="keep metrics in memory for the summary only")
+
+
+def configure_from_args(args) -> None:
+    """Apply options added by add_arguments()."""
+    default_telemetry.open(None if args.no_metrics else args.metrics or default_metrics_path())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("metrics", help="JSONL metrics file written by a fetch script")
+    args = parser.parse_args()
+
+    telemetry = Telemetry()
+    with open(args.metrics, "r", encoding="utf-8") as f:
+        telemetry.events = [event for event in map(json.loads, f) if event["type"] != "summary"]
+    if telemetry.events:
+        telemetry.started = telemetry.events[0]["ts"]
+        last = max(event["ts"] for event in telemetry.events)
+        summary = telemetry.summary()
+        summary["elapsed_s"] = round(last - telemetry.started, 3)
+        summary["throughput_rps"] = round(summary["requests"] / max(summary["elapsed_s"], 1e-9), 2)
+    else:
+        summary = telemetry.summary()
+    print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
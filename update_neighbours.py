@@ -1,83 +1,102 @@
 #!/usr/bin/env python3
 """Update neighbours in existing country_details.json"""
 
-import json
-import urllib.request
-import time
+import argparse
+import country_dataset
+import country_store
+import fetch_engine
+import http_cache
+import http_client
+import rest_countries_dump
+import telemetry
+from http_cache import fetch_json
+from fetch_country_details import get_neighbours, projected_fields
+from generate_iso_codes import report_unknown_codes
 
-JSON_FILE = "country_details.json"
 REST_COUNTRIES_BASE = "https://restcountries.com/v3.1"
 
-def get_neighbour_names(iso3_codes):
-    """Convert ISO alpha-3 codes to country names."""
-    names = []
-    for iso3 in iso3_codes:
-        try:
-            url = f"{REST_COUNTRIES_BASE}/alpha/{iso3.lower()}"
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
-                if isinstance(data, list) and len(data) > 0:
-                    country_data = data[0]
-                else:
-                    country_data = data
-                if "name" in country_data and "common" in country_data["name"]:
-                    names.append(country_data["name"]["common"])
-            time.sleep(0.05)
-        except Exception as e:
-            print(f"Error fetching {iso3}: {e}")
-    return names
+# Only the borders are needed, so ask REST Countries for nothing else
+NEIGHBOUR_FIELDS = projected_fields([get_neighbours])
+
+def fetch_country(iso_code):
+    """Fetch the fields this script needs for a single country from REST Countries (or the offline dump)."""
+    if rest_countries_dump.default_index is not None:
+        country_data = rest_countries_dump.default_index.lookup(iso_code, NEIGHBOUR_FIELDS.split(","))
+        if country_data is None:
+            raise KeyError(f"{iso_code} is not in {rest_countries_dump.default_index.path}")
+        return country_data
+    country_data = fetch_json(f"{REST_COUNTRIES_BASE}/alpha/{iso_code.lower()}?fields={NEIGHBOUR_FIELDS}", timeout=5)
+    if isinstance(country_data, list):
+        country_data = country_data[0]
+    return country_data
+
+def get_neighbour_names(iso3_codes, unknown=None):
+    """Convert ISO alpha-3 codes to country names using the country dataset."""
+    return country_dataset.load().alpha3_to_names(iso3_codes, unknown)
+
+def get_borders(iso_code):
+    """Fetch the alpha-3 border codes for a country, or None on error."""
+    try:
+        with telemetry.span("country", country=iso_code):
+            return get_neighbours(fetch_country(iso_code))
+    except Exception as e:
+        print(f"Error updating {iso_code}: {e}")
+        return None
 
 def main():
-    with open(JSON_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    parser = argparse.ArgumentParser(description=__doc__)
+    fetch_engine.add_arguments(parser)
+    http_cache.add_arguments(parser)
+    rest_countries_dump.add_arguments(parser)
+    telemetry.add_arguments(parser)
+    args = parser.parse_args()
+    fetch_engine.configure_from_args(args)
+    http_cache.configure_from_args(args)
+    telemetry.configure_from_args(args)
+    with telemetry.span("load_dump"):
+        rest_countries_dump.configure_from_args(args)
 
-    # Get all ISO codes
-    iso_to_alpha3 = {}
-    for iso_code in data.keys():
-        try:
-            url = f"{REST_COUNTRIES_BASE}/alpha/{iso_code.lower()}"
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=5) as response:
-                country_data = json.loads(response.read().decode())
-                if isinstance(country_data, list):
-                    country_data = country_data[0]
-                if "cca3" in country_data:
-                    iso_to_alpha3[iso_code] = country_data["cca3"]
-            time.sleep(0.05)
-        except Exception as e:
-            print(f"Error fetching alpha-3 for {iso_code}: {e}")
+    store = country_store.connect()
+    data = store.export()
 
     # Update neighbours for each country
     updated = 0
-    for iso_code, details in data.items():
-        if details.get("neighbours"):
-            continue  # Skip if already has neighbours
+    unknown = set()
+    # Skip if already has neighbours; each update is committed, so an interrupted run resumes here
+    pending = [iso_code for iso_code, details in data.items() if not details.get("neighbours")]
+    retry_queue = []
+    for final_pass in (False, True):
+        if final_pass:
+            if not retry_queue:
+                break
+            print(f"Retrying {len(retry_queue)} failed countries...")
+            fetch_engine.wait_for_circuits()
+            pending, retry_queue = retry_queue, []
+        for iso_code, borders in zip(pending, fetch_engine.imap_ordered(get_borders, pending)):
+            if borders is None:
+                retry_queue.append(iso_code)
+                continue
+            if borders:
+                details = data[iso_code]
+                neighbour_names = get_neighbour_names(borders, unknown)
+                details["neighbours"] = neighbour_names
+                store.set_neighbours(iso_code, neighbour_names)
+                updated += 1
+                print(f"Updated {details.get('isoCode', iso_code)}: {len(neighbour_names)} neighbours")
 
-        try:
-            url = f"{REST_COUNTRIES_BASE}/alpha/{iso_code.lower()}"
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=5) as response:
-                country_data = json.loads(response.read().decode())
-                if isinstance(country_data, list):
-                    country_data = country_data[0]
-
-                borders = country_data.get("borders", [])
-                if borders:
-                    neighbour_names = get_neighbour_names(borders)
-                    details["neighbours"] = neighbour_names
-                    updated += 1
-                    print(f"Updated {details.get('isoCode', iso_code)}: {len(neighbour_names)} neighbours")
-            time.sleep(0.1)
-        except Exception as e:
-            print(f"Error updating {iso_code}: {e}")
-
-    # Save updated JSON
-    with open(JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with telemetry.span("write"):
+        store.export_json()
 
     print(f"\nUpdated {updated} countries with neighbours")
+    if retry_queue:
+        print(f"Failed to update {len(retry_queue)} countries: {', '.join(retry_queue)}")
+    report_unknown_codes(unknown)
+    if rest_countries_dump.default_index is not None:
+        print(rest_countries_dump.default_index.summary())
+    print(http_cache.default_cache.summary())
+    print(http_client.default_client.summary())
+    print(fetch_engine.summary())
+    print(telemetry.report())
 
 if __name__ == "__main__":
     main()
-
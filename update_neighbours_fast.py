@@ -1,52 +1,71 @@
 #!/usr/bin/env python3
 """Update neighbours in existing country_details.json - optimized version"""
 
-import json
-import urllib.request
-import time
+import argparse
+import country_dataset
+import country_store
+import fetch_engine
+import http_cache
+import http_client
+import rest_countries_dump
+import telemetry
+from http_cache import fetch_json
+from fetch_country_details import get_neighbours, projected_fields
+from generate_iso_codes import report_unknown_codes
 
-JSON_FILE = "country_details.json"
 REST_COUNTRIES_BASE = "https://restcountries.com/v3.1"
 
-# Cache for ISO3 to name mapping
-iso3_to_name_cache = {}
+# Only the borders are needed, so ask REST Countries for nothing else
+NEIGHBOUR_FIELDS = projected_fields([get_neighbours])
+
+# Alpha-3 codes that the ISO index could not resolve, reported once at the end
+unknown_iso3 = set()
 
 def get_country_name_from_iso3(iso3):
-    """Get country name from ISO alpha-3 code, with caching."""
-    if iso3 in iso3_to_name_cache:
-        return iso3_to_name_cache[iso3]
+    """Get country name from ISO alpha-3 code using the country dataset."""
+    country = country_dataset.load().by_alpha3.get(iso3.upper())
+    if country is None:
+        unknown_iso3.add(iso3)
+        return None
+    return country.common_name
+
+def get_neighbour_names(iso3_codes):
+    """Convert ISO alpha-3 codes to country names."""
+    return [name for name in map(get_country_name_from_iso3, iso3_codes) if name]
 
+def fetch_neighbours(iso_code):
+    """Fetch borders and neighbour names for a country; returns (borders, names, error)."""
     try:
-        url = f"{REST_COUNTRIES_BASE}/alpha/{iso3.lower()}"
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=5) as response:
-            data = json.loads(response.read().decode())
-            if isinstance(data, list) and len(data) > 0:
-                country_data = data[0]
+        with telemetry.span("country", country=iso_code):
+            if rest_countries_dump.default_index is not None:
+                country_data = rest_countries_dump.default_index.lookup(iso_code, NEIGHBOUR_FIELDS.split(","))
+                if country_data is None:
+                    raise KeyError(f"{iso_code} is not in {rest_countries_dump.default_index.path}")
             else:
-                country_data = data
-            if "name" in country_data and "common" in country_data["name"]:
-                name = country_data["name"]["common"]
-                iso3_to_name_cache[iso3] = name
-                return name
+                country_data = fetch_json(f"{REST_COUNTRIES_BASE}/alpha/{iso_code.lower()}?fields={NEIGHBOUR_FIELDS}", timeout=5)
+        if isinstance(country_data, list):
+            country_data = country_data[0]
+        borders = get_neighbours(country_data)
+        return borders, get_neighbour_names(borders), None
     except Exception as e:
-        print(f"  Warning: Could not fetch name for {iso3}: {e}")
-    return None
-
-def get_neighbour_names(iso3_codes):
-    """Convert ISO alpha-3 codes to country names."""
-    names = []
-    for iso3 in iso3_codes:
-        name = get_country_name_from_iso3(iso3)
-        if name:
-            names.append(name)
-        time.sleep(0.03)  # Reduced delay
-    return names
+        return None, None, e
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    fetch_engine.add_arguments(parser)
+    http_cache.add_arguments(parser)
+    rest_countries_dump.add_arguments(parser)
+    telemetry.add_arguments(parser)
+    args = parser.parse_args()
+    fetch_engine.configure_from_args(args)
+    http_cache.configure_from_args(args)
+    telemetry.configure_from_args(args)
+    with telemetry.span("load_dump"):
+        rest_countries_dump.configure_from_args(args)
+
     print("Loading existing country data...")
-    with open(JSON_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    store = country_store.connect()
+    data = store.export()
 
     total = len(data)
     updated = 0
@@ -54,52 +73,63 @@ def main():
 
     print(f"Processing {total} countries...\n")
 
+    # Skip countries that already have neighbours; each update is committed
+    # to the store, so an interrupted run resumes where it stopped
+    pending = []
     for idx, (iso_code, details) in enumerate(data.items(), 1):
-        # Skip if already has neighbours
         if details.get("neighbours"):
             skipped += 1
-            continue
-
-        try:
-            url = f"{REST_COUNTRIES_BASE}/alpha/{iso_code.lower()}"
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=5) as response:
-                country_data = json.loads(response.read().decode())
-                if isinstance(country_data, list):
-                    country_data = country_data[0]
-
-                borders = country_data.get("borders", [])
-                if borders:
-                    neighbour_names = get_neighbour_names(borders)
-                    details["neighbours"] = neighbour_names
-                    updated += 1
-                    country_name = details.get("capital", iso_code) or iso_code
-                    print(f"[{idx}/{total}] {iso_code}: {len(neighbour_names)} neighbours ({', '.join(neighbour_names[:3])}{'...' if len(neighbour_names) > 3 else ''})")
-                else:
-                    # No borders (island countries, etc.)
-                    details["neighbours"] = []
-                    print(f"[{idx}/{total}] {iso_code}: No borders")
-
-            # Save periodically (every 10 countries)
-            if updated % 10 == 0:
-                with open(JSON_FILE, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                print(f"  (Saved progress: {updated} countries updated)")
-
-            time.sleep(0.05)  # Small delay between requests
-
-        except Exception as e:
-            print(f"[{idx}/{total}] Error updating {iso_code}: {e}")
-
-    # Final save
-    print("\nSaving final data...")
-    with open(JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            pending.append((idx, iso_code))
+
+    # Fetch concurrently; results arrive in the original order.
+    # Failures are queued and retried once more after the main pass.
+    retry_queue = []
+    for final_pass in (False, True):
+        if final_pass:
+            if not retry_queue:
+                break
+            print(f"\nRetrying {len(retry_queue)} failed countries...")
+            fetch_engine.wait_for_circuits()
+            pending, retry_queue = retry_queue, []
+        results = fetch_engine.imap_ordered(lambda item: fetch_neighbours(item[1]), pending)
+        for (idx, iso_code), (borders, neighbour_names, error) in zip(pending, results):
+            if error is not None:
+                print(f"[{idx}/{total}] Error updating {iso_code}: {error}")
+                retry_queue.append((idx, iso_code))
+                continue
+
+            details = data[iso_code]
+            if borders:
+                details["neighbours"] = neighbour_names
+                updated += 1
+                print(f"[{idx}/{total}] {iso_code}: {len(neighbour_names)} neighbours ({', '.join(neighbour_names[:3])}{'...' if len(neighbour_names) > 3 else ''})")
+            else:
+                # No borders (island countries, etc.)
+                details["neighbours"] = []
+                print(f"[{idx}/{total}] {iso_code}: No borders")
+
+            # One small transaction per country
+            store.set_neighbours(iso_code, details["neighbours"])
+
+    print(f"\nExporting {country_store.JSON_FILE}...")
+    with telemetry.span("write"):
+        store.export_json()
 
     print(f"\n✓ Complete!")
     print(f"  Updated: {updated} countries")
     print(f"  Skipped: {skipped} countries (already had neighbours)")
     print(f"  Total: {total} countries")
+    if retry_queue:
+        print(f"  Failed: {len(retry_queue)} countries ({', '.join(iso_code for _, iso_code in retry_queue)})")
+    report_unknown_codes(unknown_iso3)
+    if rest_countries_dump.default_index is not None:
+        print(f"  {rest_countries_dump.default_index.summary()}")
+    print(f"  {http_cache.default_cache.summary()}")
+    print(f"  {http_client.default_client.summary()}")
+    print(f"  {fetch_engine.summary()}")
+    for line in telemetry.report().splitlines():
+        print(f"  {line}")
 
 if __name__ == "__main__":
     main()
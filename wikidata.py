@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Batched Wikidata SPARQL client for the main cities, rivers and mountains of each country.
+Instead of one query per country and feature, each feature type is fetched
+with a few queries whose VALUES clause lists a batch of countries. A batch
+that times out is split in half and retried, down to single countries, so
+one slow country does not lose the whole batch. Candidates are ranked by
+population, length or elevation and the top N per country are kept. Queries go through the shared
+HTTP cache and fetch engine, so they are cached, rate limited and retried
+like the REST Countries requests.
+
+Usage:
+  python fetch_country_details.py --wikidata
+  python wikidata.py PL FR --top 3          # print the features for a few countries
+"""
+
+import argparse
+import urllib.parse
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import fetch_engine
+import http_cache
+import http_client
+
+SPARQL_ENDPOINT = "https://query.wikidata.org/sparql"
+DEFAULT_TOP_N = 5
+BATCH_SIZE = 25       # countries per VALUES clause; the subclass path (P279*) makes large batches time out
+QUERY_TIMEOUT = 60    # seconds; the public endpoint aborts queries after 60s
+
+
+class FeatureQuery(NamedTuple):
+    """A ranked feature type: instances (or subclass instances) of a class, ranked by a quantity."""
+    class_id: str                 # e.g. Q515 (city)
+    measure_property: str         # e.g. P1082 (population)
+    minimum: Optional[float] = None  # ignore smaller candidates to keep the result set small
+
+
+FEATURES = {
+    "cities": FeatureQuery("Q515", "P1082", minimum=10000),  # city, ranked by population
+    "rivers": FeatureQuery("Q4022", "P2043"),                # river, ranked by length
+    "mountains": FeatureQuery("Q8502", "P2044"),             # mountain, ranked by elevation
+}
+
+
+def build_query(feature: FeatureQuery, iso_codes: Iterable[str]) -> str:
+    """One SPARQL query returning (country code, item, English label, measure) for all the given countries."""
+    values = " ".join(f'"{code}"' for code in iso_codes)
+    minimum = f"\n  FILTER(?measure >= {feature.minimum:g})" if feature.minimum is not None else ""
+    return f"""SELECT ?iso ?item ?label ?measure WHERE {{
+  VALUES ?iso {{ {values} }}
+  ?country wdt:P297 ?iso .
+  ?item wdt:P17 ?country ;
+        wdt:P31/wdt:P279* wd:{feature.class_id} ;
+        wdt:{feature.measure_property} ?measure ;
+        rdfs:label ?label .
+  FILTER(LANG(?label) = "en"){minimum}
+}}"""
+
+
+def query_url(query: str, endpoint: Optional[str] = None) -> str:
+    return f"{endpoint or SPARQL_ENDPOINT}?{urllib.parse.urlencode({'query': query, 'format': 'json'})}"
+
+
+def rank_bindings(bindings: List[Dict], top_n: int) -> Dict[str, List[str]]:
+    """Top-N labels per country code from SPARQL JSON bindings, largest measure first."""
+    # An item can appear once per measure statement (e.g. several census populations); keep its largest
+    best: Dict[Tuple[str, str], Tuple[float, str]] = {}
+    for binding in bindings:
+        try:
+            iso_code = binding["iso"]["value"]
+            item = binding["item"]["value"]
+            label = binding["label"]["value"]
+            measure = float(binding["measure"]["value"])
+        except (KeyError, ValueError):
+            continue
+        key = (iso_code, item)
+        if key not in best or measure > best[key][0]:
+            best[key] = (measure, label)
+
+    by_country: Dict[str, List[Tuple[float, str]]] = {}
+    for (iso_code, _), candidate in best.items():
+        by_country.setdefault(iso_code, []).append(candidate)
+
+    ranked = {}
+    for iso_code, candidates in by_country.items():
+        labels = []
+        for _, label in sorted(candidates, reverse=True):
+            if label not in labels:  # distinct items can share a name
+                labels.append(label)
+            if len(labels) == top_n:
+                break
+        ranked[iso_code] = labels
+    return ranked
+
+
+def fetch_feature(name: str, iso_codes: List[str], top_n: int, endpoint: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Run one batched query for a feature type. A batch that times out (a 5xx or no answer in time) is
+    split in half at once, without retries, and each half queried on its own; countries that fail
+    alone get no entry, so callers fall back to the curated lists.
+    """
+    url = query_url(build_query(FEATURES[name], iso_codes), endpoint)
+    try:
+        # A query timeout says nothing about the endpoint, so it is neither retried nor counted by its circuit
+        data = http_cache.fetch_json(url, timeout=QUERY_TIMEOUT, retry_errors=False)
+    except Exception as e:
+        # Client errors, throttling and an open circuit fail the same way for a smaller batch
+        if len(iso_codes) == 1 or isinstance(e, fetch_engine.CircuitOpenError) or (
+                isinstance(e, http_client.HTTPStatusError)
+                and (e.status < 500 or e.status in fetch_engine.THROTTLE_STATUSES)):
+            print(f"Error fetching Wikidata {name} for {iso_codes[0]}..{iso_codes[-1]}: {e}")
+            return {}
+        middle = len(iso_codes) // 2
+        print(f"Wikidata {name} query for {iso_codes[0]}..{iso_codes[-1]} failed, splitting it in half")
+        ranked = fetch_feature(name, iso_codes[:middle], top_n, endpoint)
+        ranked.update(fetch_feature(name, iso_codes[middle:], top_n, endpoint))
+        return ranked
+    return rank_bindings(data.get("results", {}).get("bindings", []), top_n)
+
+
+def fetch_features(iso_codes: List[str], top_n: Optional[int] = None, batch_size: Optional[int] = None,
+                   endpoint: Optional[str] = None, features: Iterable[str] = tuple(FEATURES)) -> Dict[str, Dict[str, List[str]]]:
+    """{iso code: {feature name: top-N labels}} for every country, with one query per feature and batch."""
+    top_n = top_n or _top_n
+    batch_size = batch_size or _batch_size
+    batches = [iso_codes[start:start + batch_size] for start in range(0, len(iso_codes), max(1, batch_size))]
+    jobs = [(name, batch) for name in features for batch in batches]
+    results = {iso_code: {name: [] for name in features} for iso_code in iso_codes}
+    for (name, _), ranked in zip(jobs, fetch_engine.imap_ordered(
+            lambda job: fetch_feature(job[0], job[1], top_n, endpoint), jobs)):
+        for iso_code, labels in ranked.items():
+            if iso_code in results:
+                results[iso_code][name] = labels
+    return results
+
+
+# Set by configure_from_args()
+enabled = False
+_top_n = DEFAULT_TOP_N
+_batch_size = BATCH_SIZE
+
+
+def add_arguments(parser) -> None:
+    """Add Wikidata options to an argparse parser."""
+    parser.add_argument("--wikidata", action="store_true",
+                        help="rank cities, rivers and mountains from Wikidata (curated lists fill any gaps)")
+    parser.add_argument("--wikidata-endpoint", help=f"SPARQL endpoint (default: {SPARQL_ENDPOINT})")
+    parser.add_argument("--wikidata-top", type=int, default=DEFAULT_TOP_N,
+                        help=f"features kept per country and type (default: {DEFAULT_TOP_N})")
+    parser.add_argument("--wikidata-batch", type=int, default=BATCH_SIZE,
+                        help=f"countries per query (default: {BATCH_SIZE})")
+
+
+def configure_from_args(args) -> None:
+    """Apply options added by add_arguments()."""
+    global enabled, _top_n, _batch_size, SPARQL_ENDPOINT
+    enabled = args.wikidata
+    _top_n = args.wikidata_top
+    _batch_size = args.wikidata_batch
+    if args.wikidata_endpoint:
+        SPARQL_ENDPOINT = args.wikidata_endpoint
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("iso_codes", nargs="+", help="alpha-2 codes")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_N, help=f"features per type (default: {DEFAULT_TOP_N})")
+    parser.add_argument("--endpoint", default=SPARQL_ENDPOINT, help=f"SPARQL endpoint (default: {SPARQL_ENDPOINT})")
+    parser.add_argument("--show-query", action="store_true", help="print the cities query and exit")
+    fetch_engine.add_arguments(parser)
+    http_cache.add_arguments(parser)
+    args = parser.parse_args()
+    fetch_engine.configure_from_args(args)
+    http_cache.configure_from_args(args)
+
+    iso_codes = [code.upper() for code in args.iso_codes]
+    if args.show_query:
+        print(build_query(FEATURES["cities"], iso_codes))
+        return
+    for iso_code, features in fetch_features(iso_codes, args.top, endpoint=args.endpoint).items():
+        print(iso_code)
+        for name, labels in features.items():
+            print(f"  {name}: {', '.join(labels) or '-'}")
+    print(http_cache.default_cache.summary())
+
+
+if __name__ == "__main__":
+    main()